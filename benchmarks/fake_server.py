@@ -0,0 +1,570 @@
+"""
+In-process stand-in for the SuperAnnotate API and assets provider.
+
+It implements the endpoints used by the repositories closely enough to drive the
+SDK hot paths offline, with configurable latency, slow responses, error rate and payload sizes:
+
+    with FakeServer(folders=2, items_per_folder=5000, latency=0.01) as server:
+        session = server.session()
+        ItemRepository(session).list(...)
+"""
+import asyncio
+import itertools
+import json
+import random
+import threading
+from collections import defaultdict
+from collections import deque
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from urllib.parse import parse_qsl
+
+from aiohttp import web
+from multidict import MultiDict
+from superannotate_core.infrastructure.repositories.utils import StreamedAnnotations
+from superannotate_core.infrastructure.session import Session
+
+PROJECT_ID = 1
+TEAM_ID = 1
+ASSETS_PREFIX = "/assets/"
+
+
+class FakeServer:
+    def __init__(
+        self,
+        folders: int = 1,
+        items_per_folder: int = 1000,
+        instances_per_annotation: int = 10,
+        classes: int = 20,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_latency: float = 0.0,
+        error_rate: float = 0.0,
+        bandwidth: Optional[float] = None,
+        stream_chunk_size: int = 64 * 1024,
+        large_every: int = 0,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+        self.error_rate = error_rate
+        self.bandwidth = bandwidth
+        self.instances_per_annotation = instances_per_annotation
+        self.stream_chunk_size = stream_chunk_size
+        self.large_every = large_every
+        self.bytes_received = 0
+        self.bytes_sent = 0
+        self.requests: Dict[str, int] = defaultdict(int)
+        self._faults: Dict[str, Deque[Tuple[int, bool]]] = defaultdict(deque)
+        self._stalls: Dict[str, Deque[float]] = defaultdict(deque)
+        self._random = random.Random(seed)
+        self._ids = itertools.count(1)
+        self._polls: Dict[int, int] = {}
+        self.uploaded: Dict[int, Dict[str, dict]] = defaultdict(dict)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self.port: Optional[int] = None
+
+        self.project = {
+            "id": PROJECT_ID,
+            "team_id": TEAM_ID,
+            "name": "benchmark",
+            "type": 1,
+            "upload_state": 3,
+            "status": 1,
+            "users": [],
+        }
+        self.classes = [
+            {
+                "id": next(self._ids),
+                "project_id": PROJECT_ID,
+                "type": 1,
+                "name": f"class_{i}",
+                "color": "#FFFFFF",
+                "attribute_groups": [],
+            }
+            for i in range(classes)
+        ]
+        self.folders: Dict[int, dict] = {}
+        self.items: Dict[int, Dict[str, dict]] = {}
+        for i in range(folders):
+            folder = self._create_folder("root" if i == 0 else f"folder_{i}")
+            for j in range(items_per_folder):
+                self._create_item(folder["id"], f"item_{j}.jpg")
+
+    # state
+
+    def _create_folder(self, name: str) -> dict:
+        folder = {
+            "id": next(self._ids),
+            "project_id": PROJECT_ID,
+            "team_id": TEAM_ID,
+            "name": name,
+            "status": 1,
+            "is_root": name == "root",
+            "folder_users": [],
+        }
+        self.folders[folder["id"]] = folder
+        self.items[folder["id"]] = {}
+        return folder
+
+    def _create_item(self, folder_id: int, name: str, path: str = None) -> dict:
+        item = {
+            "id": next(self._ids),
+            "name": name,
+            "path": path or f"https://example.com/{name}",
+            "url": path or f"https://example.com/{name}",
+            "project_id": PROJECT_ID,
+            "folder_id": folder_id,
+            "annotation_status": 1,
+            "approval_status": 0,
+            "annotator_email": None,
+            "qa_email": None,
+            "entropy_value": None,
+            "custom_metadata": {},
+            "createdAt": "2024-01-01T00:00:00.000Z",
+            "updatedAt": "2024-01-01T00:00:00.000Z",
+        }
+        self.items[folder_id][name] = item
+        return item
+
+    def annotation(self, item: dict) -> dict:
+        rnd = random.Random(item["id"])
+        instances = []
+        for _ in range(self.instances_per_annotation):
+            annotation_class = rnd.choice(self.classes)
+            x, y = rnd.uniform(0, 1000), rnd.uniform(0, 1000)
+            instances.append(
+                {
+                    "type": "bbox",
+                    "classId": annotation_class["id"],
+                    "className": annotation_class["name"],
+                    "probability": 100,
+                    "points": {
+                        "x1": x,
+                        "y1": y,
+                        "x2": x + rnd.uniform(1, 200),
+                        "y2": y + rnd.uniform(1, 200),
+                    },
+                    "attributes": [],
+                    "createdBy": {
+                        "email": "annotator@example.com",
+                        "role": "Annotator",
+                    },
+                }
+            )
+        return {
+            "metadata": {
+                "id": item["id"],
+                "name": item["name"],
+                "folder_id": item["folder_id"],
+                "width": 1024,
+                "height": 1024,
+                "status": "NotStarted",
+            },
+            "instances": instances,
+            "tags": [],
+            "comments": [],
+        }
+
+    # faults
+
+    def fail(self, path: str, status: int = 500, count: int = 1, applied: bool = False):
+        """
+        Answers the next `count` requests to `path` with `status`.
+        :param applied: handle the requests before failing them, as when the response of a done change is lost.
+        """
+        self._faults[path].extend([(status, applied)] * count)
+
+    def stall(self, path: str, delay: float, count: int = 1):
+        """
+        Delays the next `count` requests to `path` by `delay` seconds.
+        """
+        self._stalls[path].extend([delay] * count)
+
+    # lifecycle
+
+    def __enter__(self) -> "FakeServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    @property
+    def api_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/"
+
+    @property
+    def assets_provider_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}{ASSETS_PREFIX}"
+
+    def session(self, **kwargs) -> Session:
+        session = Session("token", TEAM_ID, api_url=self.api_url, **kwargs)
+        session.ASSETS_PROVIDER_URL = self.assets_provider_url
+        return session
+
+    def start(self):
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._runner = web.AppRunner(self._build_app(), access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, "127.0.0.1", 0)
+            self._loop.run_until_complete(site.start())
+            self.port = site._server.sockets[0].getsockname()[1]  # noqa
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self):
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    # http
+
+    def _build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware], client_max_size=2**30)
+        a = ASSETS_PREFIX
+        app.add_routes(
+            [
+                web.get("/projects", self.list_projects),
+                web.get("/project/{project_id}", self.get_project),
+                web.get("/project/{project_id}/limitationDetails", self.limits),
+                web.get("/folders", self.list_folders),
+                web.post("/folder", self.create_folder),
+                web.get("/folder/getFolderById/{folder_id}", self.get_folder),
+                web.get("/folder/getFolderByName", self.get_folder_by_name),
+                web.put("/folder/{folder_id}", self.update_folder),
+                web.get("/classes", self.list_classes),
+                web.post("/classes", self.create_classes),
+                web.get("/items", self.list_items),
+                web.get("/image/{item_id}", self.get_item),
+                web.post("/images/getBulk", self.get_bulk),
+                web.post("/images/getImagesByIds", self.get_by_ids),
+                web.post("/image/ext-create", self.attach),
+                web.post("/images/copy-image-or-folders", self.copy),
+                web.get("/images/copy-image-progress", self.copy_progress),
+                web.post("/image/move", self.move),
+                web.put("/image/updateAnnotationStatusBulk", self.set_statuses),
+                web.post("/items/bulk/change", self.set_approval_statuses),
+                web.put("/image/delete/images", self.delete_items),
+                web.put("/images/editAssignment/", self.assign),
+                web.post(f"{a}items/annotations/download/method", self.sort),
+                web.post(f"{a}items/annotations/download", self.download),
+                web.post(
+                    f"{a}items/{{item_id}}/annotations/download", self.download_large
+                ),
+                web.post(f"{a}items/{{item_id}}/annotations/sync", self.sync),
+                web.get(f"{a}items/{{item_id}}/annotations/sync/status", self.sync),
+                web.post(f"{a}items/annotations/upload", self.upload),
+                web.post(f"{a}items/{{item_id}}/annotations/upload", self.upload_large),
+            ]
+        )
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        self.requests[request.path] += 1
+        content_length = request.content_length or 0
+        self.bytes_received += content_length
+        delay = self.latency + self._random.uniform(0, self.latency_jitter)
+        if self.slow_rate and self._random.random() < self.slow_rate:
+            # a slow replica, the tail a hedged request avoids
+            delay += self.slow_latency
+        if self.bandwidth:
+            delay += content_length / self.bandwidth
+        stalls = self._stalls.get(request.path)
+        if stalls:
+            delay += stalls.popleft()
+        if delay:
+            await asyncio.sleep(delay)
+        if self.error_rate and self._random.random() < self.error_rate:
+            return web.json_response({"error": "injected"}, status=503)
+        faults = self._faults.get(request.path)
+        if faults:
+            status, applied = faults.popleft()
+            if applied:
+                await handler(request)
+            return web.json_response({"error": "injected"}, status=status)
+        response = await handler(request)
+        if isinstance(response, web.Response) and response.body:
+            self.bytes_sent += len(response.body)
+        return response
+
+    @staticmethod
+    def _folder_id(request: web.Request, body: dict = None) -> int:
+        folder_id = request.query.get("folder_id") or (body or {}).get("folder_id")
+        return int(folder_id)
+
+    @staticmethod
+    async def _form(request: web.Request) -> MultiDict:
+        # the SDK sends form bodies with the session's json Content-Type
+        return MultiDict(parse_qsl(await request.text(), keep_blank_values=True))
+
+    async def list_projects(self, request: web.Request):
+        return web.json_response({"data": [self.project], "count": 1})
+
+    async def get_project(self, request: web.Request):
+        return web.json_response(self.project)
+
+    async def limits(self, request: web.Request):
+        folder_id = self._folder_id(request)
+        used = len(self.items.get(folder_id, {}))
+        project_used = sum(len(i) for i in self.items.values())
+        return web.json_response(
+            {
+                "folder_limit": {
+                    "max_image_count": 50000,
+                    "remaining_image_count": 50000 - used,
+                },
+                "project_limit": {
+                    "max_image_count": 500000,
+                    "remaining_image_count": 500000 - project_used,
+                },
+            }
+        )
+
+    async def list_folders(self, request: web.Request):
+        folders = list(self.folders.values())
+        if "name" in request.query:
+            folders = [i for i in folders if i["name"] == request.query["name"]]
+        return self._page(request, folders)
+
+    async def create_folder(self, request: web.Request):
+        body = await request.json()
+        return web.json_response(self._create_folder(body["name"]))
+
+    async def get_folder(self, request: web.Request):
+        return web.json_response(self.folders[int(request.match_info["folder_id"])])
+
+    async def get_folder_by_name(self, request: web.Request):
+        name = request.query["name"]
+        for folder in self.folders.values():
+            if folder["name"] == name:
+                return web.json_response(folder)
+        return web.json_response({"error": "Folder not found"}, status=404)
+
+    async def update_folder(self, request: web.Request):
+        folder = self.folders[int(request.match_info["folder_id"])]
+        body = await request.json()
+        folder.update({k: body[k] for k in ("name", "status") if k in body})
+        return web.json_response(folder)
+
+    async def list_classes(self, request: web.Request):
+        return self._page(request, self.classes)
+
+    async def create_classes(self, request: web.Request):
+        body = await request.json()
+        created = []
+        for annotation_class in body["classes"]:
+            annotation_class = {**annotation_class, "id": next(self._ids)}
+            self.classes.append(annotation_class)
+            created.append(annotation_class)
+        return web.json_response(created)
+
+    def _page(self, request: web.Request, data: List[dict], limit: int = 2000):
+        offset = int(request.query.get("offset", 0))
+        return web.json_response(
+            {"data": data[offset : offset + limit], "count": len(data)}  # noqa
+        )
+
+    async def list_items(self, request: web.Request):
+        items = list(self.items[self._folder_id(request)].values())
+        if "name" in request.query:
+            items = [i for i in items if i["name"] == request.query["name"]]
+        return self._page(request, items)
+
+    async def get_item(self, request: web.Request):
+        item_id = int(request.match_info["item_id"])
+        items = self.items[self._folder_id(request)].values()
+        item = next((i for i in items if i["id"] == item_id), None)
+        if not item:
+            raise web.HTTPNotFound()
+        return web.json_response(item)
+
+    async def get_bulk(self, request: web.Request):
+        body = await request.json()
+        items = self.items[self._folder_id(request, body)]
+        return web.json_response([items[i] for i in body["names"] if i in items])
+
+    async def get_by_ids(self, request: web.Request):
+        body = await request.json()
+        items = self.items[self._folder_id(request)]
+        ids = set(body["image_ids"])
+        return web.json_response(
+            {"images": [i for i in items.values() if i["id"] in ids]}
+        )
+
+    async def attach(self, request: web.Request):
+        body = await request.json()
+        folder_id = self._folder_id(request, body)
+        for image in body["images"]:
+            self._create_item(folder_id, image["name"], image["path"])
+        return web.json_response({"success": True})
+
+    async def copy(self, request: web.Request):
+        body = await request.json()
+        source = self.items[body["source_folder_id"]]
+        destination = body["destination_folder_id"]
+        for name in body["image_names"]:
+            if name in source:
+                self._create_item(destination, name, source[name]["path"])
+        poll_id = next(self._ids)
+        self._polls[poll_id] = len(body["image_names"])
+        return web.json_response({"poll_id": poll_id})
+
+    async def copy_progress(self, request: web.Request):
+        done = self._polls.pop(int(request.query["poll_id"]), 0)
+        return web.json_response({"done": done, "skipped": 0})
+
+    async def move(self, request: web.Request):
+        body = await request.json()
+        source = self.items[body["source_folder_id"]]
+        destination = self.items[body["destination_folder_id"]]
+        skipped = []
+        for name in body["image_names"]:
+            if name in source and name not in destination:
+                item = source.pop(name)
+                item["folder_id"] = body["destination_folder_id"]
+                destination[name] = item
+            else:
+                skipped.append(name)
+        return web.json_response({"skipped": skipped})
+
+    async def set_statuses(self, request: web.Request):
+        body = await request.json()
+        items = self.items[self._folder_id(request, body)]
+        for name in body["image_names"]:
+            if name in items:
+                items[name]["annotation_status"] = body["annotation_status"]
+        return web.json_response({"success": True})
+
+    async def set_approval_statuses(self, request: web.Request):
+        body = await request.json()
+        items = self.items[self._folder_id(request)]
+        for name in body["item_names"]:
+            if name in items:
+                items[name]["approval_status"] = body["change_actions"][
+                    "APPROVAL_STATUS"
+                ]
+        return web.json_response({"success": True})
+
+    async def delete_items(self, request: web.Request):
+        if "folder_ids" in request.query:
+            for folder_id in request.query.getall("folder_ids"):
+                self.folders.pop(int(folder_id), None)
+                self.items.pop(int(folder_id), None)
+            return web.json_response({"success": True})
+        form = await self._form(request)
+        items = self.items[self._folder_id(request)]
+        ids = {int(i) for i in form.getall("image_ids", [])}
+        for name in [n for n, i in items.items() if i["id"] in ids]:
+            del items[name]
+        return web.json_response({"success": True})
+
+    async def assign(self, request: web.Request):
+        form = await self._form(request)
+        items = self.items[int(form["folder_id"])]
+        count = 0
+        for name in form.getall("image_names", []):
+            if name in items:
+                items[name]["annotator_email"] = form.get("assign_user_id")
+                count += 1
+        return web.json_response({"successCount": count})
+
+    async def sort(self, request: web.Request):
+        body = await request.json()
+        item_ids = body["item_ids"]
+        large = [i for i in item_ids if self._is_large(i)]
+        small = [i for i in item_ids if not self._is_large(i)]
+        chunks = [small[i : i + 100] for i in range(0, len(small), 100)]  # noqa
+        return web.json_response(
+            {
+                "small": {
+                    str(idx): {"data": [{"id": i} for i in chunk]}
+                    for idx, chunk in enumerate(chunks)
+                },
+                "large": [{"id": i} for i in large],
+            }
+        )
+
+    def _is_large(self, item_id: int) -> bool:
+        return bool(self.large_every) and item_id % self.large_every == 0
+
+    async def download_large(self, request: web.Request):
+        item_id = int(request.match_info["item_id"])
+        for item in self.items[self._folder_id(request)].values():
+            if item["id"] == item_id:
+                return web.json_response(self.annotation(item))
+        raise web.HTTPNotFound()
+
+    async def download(self, request: web.Request):
+        body = await request.json()
+        items = self.items[self._folder_id(request, body)]
+        ids = set(body.get("image_ids", []))
+        response = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await response.prepare(request)
+        buffer = bytearray()
+        delimiter = StreamedAnnotations.DELIMITER
+        first = True
+        for item in items.values():
+            if item["id"] not in ids:
+                continue
+            if not first:
+                buffer += delimiter
+            first = False
+            buffer += json.dumps(self.annotation(item)).encode()
+            if len(buffer) >= self.stream_chunk_size:
+                self.bytes_sent += len(buffer)
+                await response.write(bytes(buffer))
+                buffer.clear()
+        if buffer:
+            self.bytes_sent += len(buffer)
+            await response.write(bytes(buffer))
+        await response.write_eof()
+        return response
+
+    async def upload(self, request: web.Request):
+        folder_id = self._folder_id(request)
+        failed = []
+        reader = await request.multipart()
+        async for part in reader:
+            name = part.name
+            data = await part.read()
+            if name not in self.items[folder_id]:
+                failed.append(name)
+                continue
+            self.uploaded[folder_id][name] = json.loads(data)
+        return web.json_response({"failedItems": failed, "missing": {}})
+
+    async def upload_large(self, request: web.Request):
+        folder_id = self._folder_id(request)
+        item_id = int(request.match_info["item_id"])
+        reader = await request.multipart()
+        part = await reader.next()
+        annotation = json.loads(await part.read())
+        for item in self.items[folder_id].values():
+            if item["id"] == item_id:
+                self.uploaded[folder_id][item["name"]] = annotation
+                return web.json_response({})
+        raise web.HTTPNotFound()
+
+    async def sync(self, request: web.Request):
+        return web.json_response({"status": "SUCCESS"})
@@ -0,0 +1,258 @@
+"""
+Offline benchmarks for the SDK hot paths, driven by the in-process FakeServer.
+
+    PYTHONPATH=src python -m benchmarks.run
+    PYTHONPATH=src python -m benchmarks.run paginate stream --items 20000 --latency 0.005
+"""
+import argparse
+import sys
+import time
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+
+from benchmarks.fake_server import FakeServer
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.core.conditions import Condition
+from superannotate_core.core.conditions import CONDITION_EQ as EQ
+from superannotate_core.core.enums import AnnotationStatus
+from superannotate_core.core.enums import UploadStateEnum
+from superannotate_core.infrastructure.repositories import AnnotationRepository
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.repositories import ItemRepository
+from superannotate_core.infrastructure.repositories.utils import run_async
+
+
+class Result(NamedTuple):
+    name: str
+    operations: int
+    seconds: float
+    bytes_out: int = 0
+    bytes_in: int = 0
+
+    def __str__(self):
+        rate = self.operations / self.seconds if self.seconds else float("inf")
+        return (
+            f"{self.name:<28} {self.operations:>9} ops {self.seconds:>9.3f} s "
+            f"{rate:>12.1f} ops/s {self.bytes_out:>12} B out {self.bytes_in:>12} B in"
+        )
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], list]] = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def _server(args, **kwargs) -> FakeServer:
+    options = dict(
+        items_per_folder=args.items,
+        instances_per_annotation=args.instances,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        bandwidth=args.bandwidth,
+    )
+    options.update(kwargs)
+    return FakeServer(**options)
+
+
+def _root(server: FakeServer) -> int:
+    return next(iter(server.folders))
+
+
+def _timed(name: str, server: FakeServer, operations: int, func) -> Result:
+    bytes_out, bytes_in = server.bytes_received, server.bytes_sent
+    start = time.perf_counter()
+    func()
+    return Result(
+        name,
+        operations,
+        time.perf_counter() - start,
+        server.bytes_received - bytes_out,
+        server.bytes_sent - bytes_in,
+    )
+
+
+@benchmark
+def paginate(args):
+    with _server(args) as server:
+        repo = ItemRepository(server.session())
+        condition = Condition("project_id", PROJECT_ID, EQ) & Condition(
+            "folder_id", _root(server), EQ
+        )
+        return [_timed("paginate", server, args.items, lambda: repo.list(condition))]
+
+
+@benchmark
+def decode(args):
+    with _server(args, items_per_folder=0) as server:
+        repo = ItemRepository(server.session())
+        folder_id = _root(server)
+        data = [
+            server._create_item(folder_id, f"item_{i}.jpg") for i in range(args.items)
+        ]
+        payload = [dict(i) for i in data]
+        return [
+            _timed(
+                "entity_decode",
+                server,
+                args.items,
+                lambda: repo.serialize_entiy(payload),
+            )
+        ]
+
+
+@benchmark
+def stream(args):
+    with _server(args) as server:
+        session = server.session()
+        folder_id = _root(server)
+        item_ids = [i["id"] for i in server.items[folder_id].values()]
+        repo = AnnotationRepository(session)
+
+        def run():
+            annotations = run_async(
+                repo.list_annotations(PROJECT_ID, folder_id, item_ids=item_ids)
+            )
+            assert len(annotations) == len(item_ids)
+
+        return [_timed("annotation_stream", server, len(item_ids), run)]
+
+
+def _attachments(count: int):
+    return [
+        {"name": f"attached_{i}.jpg", "url": f"https://example.com/attached_{i}.jpg"}
+        for i in range(count)
+    ]
+
+
+@benchmark
+def attach(args):
+    results = []
+    for threshold in (None, args.compress_threshold):
+        with _server(args, folders=2, items_per_folder=0) as server:
+            repo = ItemRepository(server.session(compress_threshold=threshold))
+            folder_id = list(server.folders)[1]
+            attachments = _attachments(args.items)
+            name = "attach" if threshold is None else "attach_gzip"
+            results.append(
+                _timed(
+                    name,
+                    server,
+                    args.items,
+                    lambda: repo.attach(
+                        PROJECT_ID,
+                        folder_id,
+                        attachments,
+                        AnnotationStatus.NotStarted,
+                        UploadStateEnum.EXTERNAL,
+                    ),
+                )
+            )
+    return results
+
+
+@benchmark
+def copy(args):
+    with _server(args, folders=2) as server:
+        repo = ItemRepository(server.session())
+        source, destination = list(server.folders)
+        names = list(server.items[source])
+        return [
+            _timed(
+                "bulk_copy",
+                server,
+                len(names),
+                lambda: repo.bulk_copy_by_names(PROJECT_ID, source, destination, names),
+            )
+        ]
+
+
+@benchmark
+def statuses(args):
+    results = []
+    for threshold in (None, args.compress_threshold):
+        with _server(args) as server:
+            repo = ItemRepository(server.session(compress_threshold=threshold))
+            folder_id = _root(server)
+            names = list(server.items[folder_id])
+            name = "set_statuses" if threshold is None else "set_statuses_gzip"
+            results.append(
+                _timed(
+                    name,
+                    server,
+                    len(names),
+                    lambda: repo.set_statuses(
+                        PROJECT_ID, folder_id, AnnotationStatus.Completed, names
+                    ),
+                )
+            )
+    return results
+
+
+@benchmark
+def async_items(args):
+    with _server(args) as server:
+        session = server.session()
+        repo = AsyncItemRepository(session)
+        folder_id = _root(server)
+        names = list(server.items[folder_id])
+
+        def _run(coroutine):
+            async def _closing():
+                try:
+                    return await coroutine
+                finally:
+                    await session.aclose()
+
+            return run_async(_closing())
+
+        def set_statuses():
+            report = _run(
+                repo.set_statuses(
+                    PROJECT_ID, folder_id, AnnotationStatus.Completed, names
+                )
+            )
+            assert len(report["succeeded"]) == len(names), report["errors"][:3]
+
+        def list_by_names():
+            items = _run(repo.list_by_names(PROJECT_ID, folder_id, names))
+            assert len(items) == len(names)
+
+        return [
+            _timed("async_set_statuses", server, len(names), set_statuses),
+            _timed("async_list_by_names", server, len(names), list_by_names),
+        ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    # argparse checks the empty default of a "*" positional against its choices, they are checked below
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="benchmark",
+        help=f"Benchmarks to run, all by default: {', '.join(BENCHMARKS)}.",
+    )
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--instances", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--bandwidth", type=float, default=None, help="Upload bytes per second."
+    )
+    parser.add_argument("--compress-threshold", type=int, default=1024)
+    args = parser.parse_args(argv)
+    unknown = [i for i in args.benchmarks if i not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    for name in args.benchmarks or BENCHMARKS:
+        for result in BENCHMARKS[name](args):
+            print(result)
+            sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
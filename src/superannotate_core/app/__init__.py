@@ -1,15 +1,33 @@
 import asyncio
+import functools
+import inspect
 import logging
+import os
 from functools import wraps
 from operator import itemgetter
+from typing import AsyncIterator
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Sequence
 from typing import Tuple
 from typing import Union
 
+import aiohttp
 from requests import HTTPError
+from superannotate_core.app.export import AnnotationSink
+from superannotate_core.app.export import CocoSink
+from superannotate_core.app.export import DirectorySink
+from superannotate_core.app.export import ExportReport
+from superannotate_core.app.export import ProjectExporter
+from superannotate_core.app.export import YoloSink
+from superannotate_core.app.snapshot import ProjectSnapshot
+from superannotate_core.app.upload import AnnotationSource
+from superannotate_core.app.upload import AnnotationUploader
+from superannotate_core.app.upload import UploadResult
 from superannotate_core.core import constants
+from superannotate_core.core.arrays import AnnotationArrays
 from superannotate_core.core.conditions import Condition
 from superannotate_core.core.conditions import CONDITION_EQ as EQ
 from superannotate_core.core.conditions import EmptyCondition
@@ -26,31 +44,67 @@ from superannotate_core.core.enums import ClassTypeEnum
 from superannotate_core.core.enums import FolderStatus
 from superannotate_core.core.enums import ProjectType
 from superannotate_core.core.enums import UploadStateEnum
+from superannotate_core.core.filters import AnnotationFilter
 from superannotate_core.core.exceptions import SAException
 from superannotate_core.core.exceptions import SAInvalidInput
 from superannotate_core.core.exceptions import SAValidationException
+from superannotate_core.core.statistics import AnnotationStatistics
+from superannotate_core.core.utils import achunkify_iter
 from superannotate_core.core.utils import chunkify
+from superannotate_core.infrastructure.journal import DownloadJournal
 from superannotate_core.infrastructure.repositories import AnnotationClassesRepository
 from superannotate_core.infrastructure.repositories import AnnotationRepository
+from superannotate_core.infrastructure.repositories import (
+    AsyncAnnotationClassesRepository,
+)
+from superannotate_core.infrastructure.repositories import AsyncFolderRepository
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.repositories import AsyncProjectRepository
 from superannotate_core.infrastructure.repositories import FolderRepository
 from superannotate_core.infrastructure.repositories import ItemRepository
 from superannotate_core.infrastructure.repositories import ProjectRepository
+from superannotate_core.infrastructure.repositories.classes_repository import (
+    ClassRegistry,
+)
+from superannotate_core.infrastructure.repositories.folder_repository import (
+    FolderIndex,
+)
 from superannotate_core.infrastructure.repositories.item_repository import Attachment
 from superannotate_core.infrastructure.repositories.item_repository import (
     AttachmentMeta,
 )
+from superannotate_core.infrastructure.repositories.item_repository import BulkReport
+from superannotate_core.infrastructure.repositories.item_repository import (
+    DeleteReport,
+)
+from superannotate_core.infrastructure.repositories.utils import gather_adaptive
+from superannotate_core.infrastructure.repositories.utils import gather_bounded
 from superannotate_core.infrastructure.repositories.utils import run_async
+from superannotate_core.infrastructure.repositories.utils import StreamedAnnotations
 from superannotate_core.infrastructure.session import Session
+from superannotate_core.infrastructure.store import AnnotationStore
 
 
 logger = logging.getLogger(__name__)
 
 
+def run_session_async(session: Session, coroutine):
+    """
+    Runs the coroutine with run_async and closes the session's aiohttp client of its event loop.
+    """
+
+    async def _run():
+        try:
+            return await coroutine
+        finally:
+            await session.aclose()
+
+    return run_async(_run())
+
+
 def set_releated_attribute(attr_name, many=False):
     def decorator(method):
-        @wraps(method)
-        def wrapper(self, *args, **kwargs):
-            response = method(self, *args, **kwargs)
+        def _set(self, response):
             if many:
                 for i in response:
                     setattr(i, attr_name, self)
@@ -58,6 +112,18 @@ def set_releated_attribute(attr_name, many=False):
                 setattr(response, attr_name, self)
             return response
 
+        if inspect.iscoroutinefunction(method):
+
+            @wraps(method)
+            async def async_wrapper(self, *args, **kwargs):
+                return _set(self, await method(self, *args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            return _set(self, method(self, *args, **kwargs))
+
         return wrapper
 
     return decorator
@@ -186,12 +252,27 @@ class Item(BaseItemEntity):
         project_id: int,
         folder_id: int,
         items: List[Union["BaseItemEntity", "Item", "VideoItem", "ImageItem"]],
-    ):
+        memory_budget: int = None,
+        annotation_filter: AnnotationFilter = None,
+    ) -> Union[List[dict], AnnotationStore]:
+        """
+        :param memory_budget: encoded size in bytes past which the annotations spill to a temporary file,
+         an AnnotationStore is returned instead of a list.
+        :param annotation_filter: applied to each annotation as soon as it is decoded,
+         the annotations it drops are not returned.
+        """
         repo = AnnotationRepository(session)
-        sort_response = AnnotationRepository(session=session).sort_annotatoins_by_size(
-            project_id=project_id, folder_id=folder_id, item_ids=[i.id for i in items]
+        sort_response = await repo.asort_annotations_by_size(
+            project_id=project_id, item_ids=[i.id for i in items]
+        )
+        store = (
+            AnnotationStore(memory_budget, session.json_codec)
+            if memory_budget is not None
+            else None
+        )
+        annotations: Union[List[dict], AnnotationStore] = (
+            store if store is not None else []
         )
-        annotations = []
 
         large_item_ids = set(map(itemgetter("id"), sort_response["large"]))
         small_item_ids_chunks = []
@@ -211,33 +292,122 @@ class Item(BaseItemEntity):
                             session=session,
                             project_id=project_id,
                             folder_id=folder_id,
-                            item_id=item_id,
+                            item_id=item.id,
                         )
-                        for item_id in chunk
+                        for item in chunk
                     ]
                 )
+                if annotation_filter:
+                    large_annotations = [
+                        i
+                        for i in map(annotation_filter, large_annotations)
+                        if i is not None
+                    ]
                 annotations.extend(large_annotations)
         if small_item_ids_chunks:
-            for chunk in chunkify(small_item_ids_chunks, session.MAX_COROUTINE_COUNT):
-                small_annotations = await asyncio.gather(
-                    *[
-                        repo.list_annotations(
-                            project_id=project_id,
-                            folder_id=folder_id,
-                            item_ids=item_ids,
-                        )
-                        for item_ids in chunk
-                    ]
+            annotations.extend(
+                await cls._alist_small_annotations(
+                    session,
+                    project_id,
+                    folder_id,
+                    small_item_ids_chunks,
+                    store,
+                    annotation_filter,
                 )
-                annotations.extend(*small_annotations)
+            )
         return annotations
 
+    @classmethod
+    async def _alist_small_annotations(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        item_ids_chunks: List[List[int]],
+        store: Optional[AnnotationStore],
+        annotation_filter: Optional[AnnotationFilter],
+    ) -> List[dict]:
+        """
+        Streams the annotations of the chunks of small items sorted by asort_annotations_by_size.
+        With a store the annotations are added to it and an empty list is returned.
+        """
+        repo = AnnotationRepository(session)
+        chunks = await gather_adaptive(
+            (
+                repo.list_annotations(
+                    project_id=project_id,
+                    folder_id=folder_id,
+                    item_ids=item_ids,
+                    store=store,
+                    annotation_filter=annotation_filter,
+                )
+                for item_ids in item_ids_chunks
+            ),
+            session.window(
+                "annotations.download",
+                session.MAX_COROUTINE_COUNT,
+                maximum=session.MAX_COROUTINE_COUNT * 4,
+            ),
+        )
+        if store is not None:
+            return []
+        return [annotation for chunk in chunks for annotation in chunk]
+
+    @classmethod
+    async def adownload_annotations(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        items: List[Union["BaseItemEntity", "Item", "VideoItem", "ImageItem"]],
+        download_path: str,
+        journal: DownloadJournal,
+    ) -> int:
+        """
+        Stores the annotations of the items the journal has not completed yet.
+        Returns the count of the downloaded annotations.
+        """
+        repo = AnnotationRepository(session)
+        item_ids = [i.id for i in items if i.id not in journal.completed]
+        if not item_ids:
+            return 0
+        sort_response = await repo.asort_annotations_by_size(project_id, item_ids)
+        await gather_bounded(
+            (
+                repo.download_small_annotations(
+                    project_id,
+                    folder_id,
+                    [i["id"] for i in chunk],
+                    download_path,
+                    journal=journal,
+                )
+                for chunk in sort_response["small"]
+            ),
+            session.MAX_COROUTINE_COUNT,
+        )
+
+        async def _download_large(item_id: int):
+            annotation = await repo.get_large_annotation(project_id, folder_id, item_id)
+            data = StreamedAnnotations._store_annotation(
+                download_path, annotation, json_codec=session.json_codec
+            )
+            journal.record(item_id, annotation["metadata"]["name"], data)
+
+        large_item_ids = [i["id"] for i in sort_response["large"]]
+        await gather_bounded(
+            (_download_large(i) for i in large_item_ids),
+            max(session.MAX_COROUTINE_COUNT // 2, 2),
+        )
+        if large_item_ids:
+            journal.complete_chunk(large_item_ids)
+        return len(item_ids)
+
     @classmethod
     async def aget_large_annotation(
         cls, session: Session, project_id: int, folder_id: int, item_id: int
     ):
         repo = AnnotationRepository(session)
-        return repo.get_large_annotation(
+        return await repo.get_large_annotation(
             project_id=project_id, folder_id=folder_id, item_id=item_id
         )
 
@@ -284,8 +454,11 @@ class Item(BaseItemEntity):
         folder_id: int,
         annotation_status: AnnotationStatus,
         items: List[str] = None,
-    ):
-        ItemRepository(session).set_statuses(
+    ) -> BulkReport:
+        """
+        :return: item names the status was set for, failed item names and the errors
+        """
+        return ItemRepository(session).set_statuses(
             project_id=project_id,
             folder_id=folder_id,
             annotation_status=annotation_status,
@@ -300,8 +473,11 @@ class Item(BaseItemEntity):
         folder_id: int,
         approval_status: ApprovalStatus,
         items: List[str] = None,
-    ):
-        ItemRepository(session).set_approval_statuses(
+    ) -> BulkReport:
+        """
+        :return: item names the status was set for, failed item names and the errors
+        """
+        return ItemRepository(session).set_approval_statuses(
             project_id=project_id,
             folder_id=folder_id,
             approval_status=approval_status,
@@ -317,24 +493,24 @@ class Item(BaseItemEntity):
         *,
         item_ids: List[int],
         item_names: List[str] = None,
-    ):
+    ) -> DeleteReport:
+        """
+        Without item_ids and item_names all folder items are deleted.
+        """
         repo = ItemRepository(session)
-
-        if not item_ids:
-            item_ids = [
-                i.id
-                for i in cls._list_items(
-                    repo,
-                    project_id,
-                    folder_id,
-                    item_ids=item_ids,
-                    item_names=item_names,
-                )
-            ]
-            if item_ids:
-                repo.bulk_delete(
-                    project_id=project_id, folder_id=folder_id, item_ids=item_ids
-                )
+        if item_ids:
+            return repo.bulk_delete(
+                project_id=project_id, folder_id=folder_id, item_ids=item_ids
+            )
+        elif item_names:
+            return repo.delete_by_names(
+                project_id=project_id, folder_id=folder_id, item_names=item_names
+            )
+        # ids are collected up front, deleting while paginating would shift the offsets
+        item_ids = [i["id"] for i in repo.iter_items(project_id, folder_id)]
+        return repo.bulk_delete(
+            project_id=project_id, folder_id=folder_id, item_ids=item_ids
+        )
 
     @classmethod
     def bulk_assign(
@@ -353,23 +529,48 @@ class Item(BaseItemEntity):
         """
 
         repo = ItemRepository(session=session)
+        names: Iterable[str] = item_names or []
         if not item_names and (condition or item_ids):
-            _items = cls._list_items(
-                repo,
-                project_id=project_id,
-                folder_id=folder_id,
-                condition=condition,
-                item_ids=item_ids,
+            names = cls._resolve_names(
+                repo, project_id, folder_id, condition=condition, item_ids=item_ids
             )
-            item_names = [i.name for i in _items]
         count = repo.assign_items(
             project_id=project_id,
             folder_id=folder_id,
-            item_names=item_names,
+            item_names=names,
             user_id=user,
         )
         return count
 
+    @classmethod
+    def bulk_assign_users(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        assignments: Dict[str, List[str]],
+    ) -> int:
+        """
+        Assigns each user, the key, its list of item names in one batched call.
+        Returns successed items count.
+        """
+        return ItemRepository(session=session).assign_items_to_users(
+            project_id=project_id, folder_id=folder_id, assignments=assignments
+        )
+
+    @staticmethod
+    def _resolve_names(
+        repo: ItemRepository,
+        project_id: int,
+        folder_id: int,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+    ) -> Iterable[str]:
+        if item_ids:
+            return repo.names_by_ids(project_id, folder_id, item_ids)
+        return repo.iter_names(project_id, folder_id, condition)
+
     @classmethod
     def bulk_unassign(
         cls,
@@ -382,171 +583,898 @@ class Item(BaseItemEntity):
         item_names: List[str] = None,
     ) -> int:
         repo = ItemRepository(session=session)
+        names: Iterable[str] = item_names or []
         if not item_names and (condition or item_ids):
-            _items = cls._list_items(
-                repo,
-                project_id=project_id,
-                folder_id=folder_id,
-                condition=condition,
-                item_ids=item_ids,
+            names = cls._resolve_names(
+                repo, project_id, folder_id, condition=condition, item_ids=item_ids
             )
-            item_names = [i.name for i in _items]
-        count = repo.unassign_items(
+        report = repo.unassign_items(
             project_id=project_id,
             folder_id=folder_id,
-            item_names=item_names,
+            item_names=names,
         )
-        return count
-
-
-class ImageItem(Item, ImageEntity):
-    ...
-
-
-class VideoItem(Item, ViedoEntity):
-    ...
-
-
-PROJECT_ITEM_MAP = {
-    ProjectType.Vector: ImageItem,
-    ProjectType.Pixel: ImageItem,
-    ProjectType.Video: VideoItem,
-    ProjectType.Tiled: ImageItem,
-}
+        return len(report["succeeded"])
 
-
-class AnnotationClass(AnnotationClassEntity):
     @classmethod
-    def bulk_create(
+    async def aattach(
         cls,
         session: Session,
         project_id: int,
-        annotation_classes: List["AnnotationClassEntity"],
-    ):
-        try:
-            _annotation_classes = AnnotationClassesRepository(session).bulk_create(
-                project_id, annotation_classes
-            )
-            return [cls._from_entity(i) for i in _annotation_classes]
-        except HTTPError as e:
-            raise SAException(e.response.json()["error"])
-
-
-class Folder(FolderEntity):
-    def __init__(self, /, **data):
-        project: Optional[Project] = data.pop("project", None)
-        super().__init__(**data)
-        self._project = project
-
-    class Meta:
-        NAME_MAX_LENGTH = 80
-        SPECIAL_CHARACTERS = set('/\\:*?"<>|“')
-
-    @property
-    def project(self):
-        if not self._project:
-            raise Exception(
-                """
-                To access data through the folder you have to access the folder through the project
-                Project.get_by_id(1).get_folder(1).list_items()
-                """
-            )
-        return self._project
-
-    @project.setter
-    def project(self, v):
-        self._project = v
-
-    def get_item(self, pk: Union[str, int], include_custom_metadata=False):
-        _item = PROJECT_ITEM_MAP[self.project.type]
-        return _item.get(
-            self.session,
-            project_id=self.project_id,
-            folder_id=self.id,
-            pk=pk,
-            include_custom_metadata=include_custom_metadata,
-        )
-
-    def attach_items(
-        self,
+        folder_id: int,
         attachments: List[Attachment],
         annotation_status: AnnotationStatus,
+        upload_state: UploadStateEnum,
         meta: Dict[str, AttachmentMeta] = None,
     ) -> Tuple[List[str], List[str]]:
-        if self.project.upload_state == UploadStateEnum.BASIC:
-            raise SAValidationException(constants.ATTACHING_UPLOAD_STATE_ERROR)
-        return Item.attach(
-            self.session,
-            project_id=self.project_id,
-            folder_id=self.id,
+        """
+        :return: uploaded and duplicated item names
+        """
+        return await AsyncItemRepository(session).attach(
+            project_id=project_id,
+            folder_id=folder_id,
             attachments=attachments,
             annotation_status=annotation_status,
-            upload_state=UploadStateEnum.EXTERNAL,
+            upload_state=upload_state,
             meta=meta,
         )
 
-    def list_items(
-        self,
+    @classmethod
+    async def aget_by_id(
+        cls, session: Session, project_id: int, folder_id, item_id: int
+    ) -> "Item":
+        _item = await AsyncItemRepository(session).get_by_id(
+            project_id=project_id, folder_id=folder_id, item_id=item_id
+        )
+        return cls._from_entity(_item)
+
+    @classmethod
+    async def aget(
+        cls,
+        session,
+        project_id: int,
+        pk: Union[str, int],
+        folder_id: int,
+        include_custom_metadata=False,
+    ):
+        repo = AsyncItemRepository(session)
+        item: Optional[BaseItemEntity]
+        if isinstance(pk, int):
+            item = await repo.get_by_id(
+                project_id=project_id,
+                folder_id=folder_id,
+                item_id=pk,
+            )
+        elif isinstance(pk, str):
+            if not folder_id:
+                raise SAInvalidInput("To access iteam provide folder_id.")
+            condition = (
+                Condition("project_id", project_id, EQ)
+                & Condition("folder_id", folder_id, EQ)
+                & Condition("name", pk, EQ)
+                & Condition("includeCustomMetadata", include_custom_metadata, EQ)
+            )
+            items = await repo.list(condition)
+            item = next((i for i in items if i.name == pk), None)
+        else:
+            raise SAInvalidInput("Invalid primery key.")
+        if not item:
+            raise SAInvalidInput("Item not found.")
+        return cls._from_entity(item)
+
+    @classmethod
+    async def alist(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
         *,
         condition: Condition = None,
         item_ids: List[int] = None,
         item_names: List[str] = None,
-    ) -> List[Union[BaseItemEntity, Item, VideoItem, ImageItem]]:
-        _item = PROJECT_ITEM_MAP[self.project.type]
-        return _item.list(
-            self.session,
-            project_id=self.project_id,
-            folder_id=self.id,
-            condition=condition,
+    ):
+        repo = AsyncItemRepository(session)
+        _items = await cls._alist_items(
+            repo,
+            project_id,
+            folder_id,
             item_ids=item_ids,
             item_names=item_names,
+            condition=condition,
         )
+        return [cls._from_entity(i) for i in _items]
 
-    def delete_items(self, *, item_ids: List[int] = None, item_names: List[str] = None):
-        _item = PROJECT_ITEM_MAP[self.project.type]
-        _item.bulk_delete(
-            self.session,
-            project_id=self.project_id,
-            folder_id=self.id,
-            item_ids=item_ids,
+    @classmethod
+    async def _alist_items(
+        cls,
+        repo: AsyncItemRepository,
+        project_id: int,
+        folder_id: int,
+        *,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+        condition: Condition = None,
+    ):
+        if item_ids:
+            return await repo.list_by_ids(
+                project_id=project_id, folder_id=folder_id, ids=item_ids
+            )
+        elif item_names:
+            return await repo.list_by_names(
+                project_id=project_id, folder_id=folder_id, names=item_names
+            )
+        base_condition = Condition("project_id", project_id, EQ) & Condition(
+            "folder_id", folder_id, EQ
+        )
+        if condition:
+            base_condition = condition
+            base_condition &= Condition("project_id", project_id, EQ)
+            base_condition &= Condition("folder_id", folder_id, EQ)
+        return await repo.list(base_condition)
+
+    @classmethod
+    async def acopy_items_by_names(
+        cls,
+        session: Session,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        items: List[str],
+        include_annotations=True,
+    ) -> List[str]:
+        return await AsyncItemRepository(session).bulk_copy_by_names(
+            project_id=project_id,
+            source_folder_id=source_folder_id,
+            destination_folder_id=destination_folder_id,
+            item_names=items,
+            include_annotations=include_annotations,
+        )
+
+    @classmethod
+    async def amove_items_by_names(
+        cls,
+        session: Session,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        items: List[str],
+    ) -> List[str]:
+        return await AsyncItemRepository(session).bulk_move_by_names(
+            project_id=project_id,
+            source_folder_id=source_folder_id,
+            destination_folder_id=destination_folder_id,
+            item_names=items,
+        )
+
+    @classmethod
+    async def abulk_set_annotation_status(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        annotation_status: AnnotationStatus,
+        items: List[str] = None,
+    ) -> BulkReport:
+        """
+        :return: item names the status was set for, failed item names and the errors
+        """
+        return await AsyncItemRepository(session).set_statuses(
+            project_id=project_id,
+            folder_id=folder_id,
+            annotation_status=annotation_status,
+            item_names=items,
+        )
+
+    @classmethod
+    async def abulk_set_approval_status(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        approval_status: ApprovalStatus,
+        items: List[str] = None,
+    ) -> BulkReport:
+        """
+        :return: item names the status was set for, failed item names and the errors
+        """
+        return await AsyncItemRepository(session).set_approval_statuses(
+            project_id=project_id,
+            folder_id=folder_id,
+            approval_status=approval_status,
+            item_names=items,
+        )
+
+    @classmethod
+    async def abulk_delete(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        *,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+    ) -> DeleteReport:
+        repo = AsyncItemRepository(session)
+        if item_ids:
+            return await repo.bulk_delete(
+                project_id=project_id, folder_id=folder_id, item_ids=item_ids
+            )
+        elif item_names:
+            return await repo.delete_by_names(
+                project_id=project_id, folder_id=folder_id, item_names=item_names
+            )
+        item_ids = [i["id"] async for i in repo.iter_items(project_id, folder_id)]
+        return await repo.bulk_delete(
+            project_id=project_id, folder_id=folder_id, item_ids=item_ids
+        )
+
+    @classmethod
+    async def abulk_assign(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        user: str,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+    ) -> int:
+        """
+        Returns successed items count.
+        """
+        repo = AsyncItemRepository(session=session)
+        names: Union[List[str], AsyncIterator[str]] = item_names or []
+        if not item_names and (condition or item_ids):
+            names = await cls._aresolve_names(
+                repo, project_id, folder_id, condition=condition, item_ids=item_ids
+            )
+        return await repo.assign_items(
+            project_id=project_id,
+            folder_id=folder_id,
+            item_names=names,
+            user_id=user,
+        )
+
+    @classmethod
+    async def abulk_assign_users(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        assignments: Dict[str, List[str]],
+    ) -> int:
+        return await AsyncItemRepository(session=session).assign_items_to_users(
+            project_id=project_id, folder_id=folder_id, assignments=assignments
+        )
+
+    @staticmethod
+    async def _aresolve_names(
+        repo: AsyncItemRepository,
+        project_id: int,
+        folder_id: int,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+    ) -> Union[List[str], AsyncIterator[str]]:
+        if item_ids:
+            return await repo.names_by_ids(project_id, folder_id, item_ids)
+        return repo.iter_names(project_id, folder_id, condition)
+
+    @classmethod
+    async def abulk_unassign(
+        cls,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+    ) -> int:
+        repo = AsyncItemRepository(session=session)
+        names: Union[List[str], AsyncIterator[str]] = item_names or []
+        if not item_names and (condition or item_ids):
+            names = await cls._aresolve_names(
+                repo, project_id, folder_id, condition=condition, item_ids=item_ids
+            )
+        report = await repo.unassign_items(
+            project_id=project_id,
+            folder_id=folder_id,
+            item_names=names,
+        )
+        return len(report["succeeded"])
+
+
+class ImageItem(Item, ImageEntity):
+    ...
+
+
+class VideoItem(Item, ViedoEntity):
+    ...
+
+
+PROJECT_ITEM_MAP = {
+    ProjectType.Vector: ImageItem,
+    ProjectType.Pixel: ImageItem,
+    ProjectType.Video: VideoItem,
+    ProjectType.Tiled: ImageItem,
+}
+
+
+class AnnotationClass(AnnotationClassEntity):
+    @classmethod
+    def bulk_create(
+        cls,
+        session: Session,
+        project_id: int,
+        annotation_classes: List["AnnotationClassEntity"],
+    ):
+        try:
+            _annotation_classes = AnnotationClassesRepository(session).bulk_create(
+                project_id, annotation_classes
+            )
+            return [cls._from_entity(i) for i in _annotation_classes]
+        except HTTPError as e:
+            raise SAException(e.response.json()["error"])
+
+    @classmethod
+    async def abulk_create(
+        cls,
+        session: Session,
+        project_id: int,
+        annotation_classes: List["AnnotationClassEntity"],
+    ):
+        try:
+            _annotation_classes = await AsyncAnnotationClassesRepository(
+                session
+            ).bulk_create(project_id, annotation_classes)
+            return [cls._from_entity(i) for i in _annotation_classes]
+        except aiohttp.ClientResponseError as e:
+            raise SAException(e.message)
+
+
+class Folder(FolderEntity):
+    ANNOTATIONS_CHUNK_SIZE = 2000
+
+    def __init__(self, /, **data):
+        project: Optional[Project] = data.pop("project", None)
+        super().__init__(**data)
+        self._project = project
+
+    class Meta:
+        NAME_MAX_LENGTH = 80
+        SPECIAL_CHARACTERS = set('/\\:*?"<>|“')
+
+    @property
+    def project(self):
+        if not self._project:
+            raise Exception(
+                """
+                To access data through the folder you have to access the folder through the project
+                Project.get_by_id(1).get_folder(1).list_items()
+                """
+            )
+        return self._project
+
+    @project.setter
+    def project(self, v):
+        self._project = v
+
+    def get_item(self, pk: Union[str, int], include_custom_metadata=False):
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return _item.get(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            pk=pk,
+            include_custom_metadata=include_custom_metadata,
+        )
+
+    def attach_items(
+        self,
+        attachments: List[Attachment],
+        annotation_status: AnnotationStatus,
+        meta: Dict[str, AttachmentMeta] = None,
+    ) -> Tuple[List[str], List[str]]:
+        if self.project.upload_state == UploadStateEnum.BASIC:
+            raise SAValidationException(constants.ATTACHING_UPLOAD_STATE_ERROR)
+        return Item.attach(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            attachments=attachments,
+            annotation_status=annotation_status,
+            upload_state=UploadStateEnum.EXTERNAL,
+            meta=meta,
+        )
+
+    def list_items(
+        self,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+    ) -> List[Union[BaseItemEntity, Item, VideoItem, ImageItem]]:
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return _item.list(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            condition=condition,
+            item_ids=item_ids,
+            item_names=item_names,
+        )
+
+    def delete_items(
+        self, *, item_ids: List[int] = None, item_names: List[str] = None
+    ) -> DeleteReport:
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return _item.bulk_delete(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            item_ids=item_ids,
+            item_names=item_names,
+        )
+
+    def get_annotations(
+        self,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+        memory_budget: int = None,
+        annotation_filter: AnnotationFilter = None,
+        as_arrays: bool = False,
+    ) -> Union[Sequence[dict], AnnotationArrays]:
+        """
+        :param memory_budget: encoded size in bytes past which the annotations spill to a temporary file,
+         the returned AnnotationStore reads them back on access.
+        :param annotation_filter: keeps only the matching instances and fields of each annotation,
+         applied while the annotations are streamed.
+        :param as_arrays: return the instance geometries as numpy arrays, see AnnotationArrays.
+        """
+        items = self.list_items(
+            condition=condition, item_ids=item_ids, item_names=item_names
+        )
+        annotations = run_session_async(
+            self.session,
+            self._aget_annotations(items, memory_budget, annotation_filter, as_arrays),
+        )
+        if item_names:
+            annotations = self._order_by_names(annotations, item_names)
+        return annotations
+
+    async def _aget_annotations(
+        self,
+        items: List[BaseItemEntity],
+        memory_budget: Optional[int],
+        annotation_filter: Optional[AnnotationFilter],
+        as_arrays: bool,
+    ) -> Union[Sequence[dict], AnnotationArrays]:
+        if as_arrays:
+            return await self._aget_annotation_arrays(
+                items, memory_budget, annotation_filter
+            )
+        if not items:
+            return []
+        return await Item.alist_annotations(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            items=items,
+            memory_budget=memory_budget,
+            annotation_filter=annotation_filter,
+        )
+
+    async def _aget_annotation_arrays(
+        self,
+        items: List[BaseItemEntity],
+        memory_budget: Optional[int],
+        annotation_filter: Optional[AnnotationFilter],
+    ) -> AnnotationArrays:
+        """
+        Large annotations are converted to arrays as they are decoded,
+        in the session's decoding processes when it has them.
+        """
+        if not items:
+            return AnnotationArrays.from_annotations([])
+        repo = AnnotationRepository(self.session)
+        sort_response = await repo.asort_annotations_by_size(
+            self.project_id, [i.id for i in items]
+        )
+        large_item_ids = set(map(itemgetter("id"), sort_response["large"]))
+        small_item_ids_chunks = [[i["id"] for i in j] for j in sort_response["small"]]
+        parts = []
+        if small_item_ids_chunks:
+            store = (
+                AnnotationStore(memory_budget, self.session.json_codec)
+                if memory_budget is not None
+                else None
+            )
+            annotations = await Item._alist_small_annotations(
+                self.session,
+                self.project_id,
+                self.id,
+                small_item_ids_chunks,
+                store,
+                annotation_filter,
+            )
+            if store is not None:
+                parts.append(AnnotationArrays.from_annotations(store))
+                store.close()
+            else:
+                parts.append(AnnotationArrays.from_annotations(annotations))
+        transform = functools.partial(
+            AnnotationArrays.from_annotation, annotation_filter=annotation_filter
+        )
+        parts.extend(
+            await gather_bounded(
+                (
+                    repo.get_large_annotation(
+                        self.project_id, self.id, item_id, transform=transform
+                    )
+                    for item_id in large_item_ids
+                ),
+                max(self.session.MAX_COROUTINE_COUNT // 2, 2),
+            )
+        )
+        return AnnotationArrays.concatenate(parts)
+
+    @staticmethod
+    def _order_by_names(
+        annotations: Union[Sequence[dict], AnnotationArrays],
+        item_names: List[str],
+    ) -> Union[Sequence[dict], AnnotationArrays]:
+        #  keeping the same oreder
+        name_to_index = {name: index for index, name in enumerate(item_names)}
+        if isinstance(annotations, (AnnotationStore, AnnotationArrays)):
+            names = annotations.names
+            annotations.reorder(
+                sorted(range(len(names)), key=lambda i: name_to_index[names[i]])
+            )
+            return annotations
+        return list(
+            sorted(annotations, key=lambda x: name_to_index[x["metadata"]["name"]])
+        )
+
+    def copy_items_by_name(
+        self,
+        destination_folder_id: int,
+        items: List[str],
+        include_annotations=True,
+    ) -> List[str]:
+        return Item.copy_items_by_names(
+            self.session,
+            project_id=self.project_id,
+            source_folder_id=self.id,
+            destination_folder_id=destination_folder_id,
+            items=items,
+            include_annotations=include_annotations,
+        )
+
+    def move_items_by_name(
+        self, destination_folder_id: int, items: List[str]
+    ) -> List[str]:
+        return Item.move_items_by_names(
+            self.session,
+            project_id=self.project_id,
+            source_folder_id=self.id,
+            destination_folder_id=destination_folder_id,
+            items=items,
+        )
+
+    def set_items_annotation_statuses(
+        self, items: List[str], annotation_status: AnnotationStatus
+    ) -> BulkReport:
+        return Item.bulk_set_annotation_status(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            items=items,
+            annotation_status=annotation_status,
+        )
+
+    def set_items_approval_statuses(
+        self, items: List[str], approval_status: ApprovalStatus
+    ) -> BulkReport:
+        return Item.bulk_set_approval_status(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            items=items,
+            approval_status=approval_status,
+        )
+
+    def assign(self, users: List[str]):
+        _users = self.project.users
+        verified_users = {i["user_id"] for i in _users}
+        intersection = set(users).intersection(set(verified_users))
+        unverified_contributor = set(users) - verified_users
+        if unverified_contributor:  # todo update error message
+            logger.warning(
+                f"Skipping not a verified {','.join(unverified_contributor)} from assignees."
+            )
+        if intersection:
+            FolderRepository(session=self._session).assign(
+                project_id=self.project_id, folder_name=self.name, users=users
+            )
+
+    def assign_items(
+        self,
+        user: str,
+        *,
+        condition: Condition = None,
+        item_names: List[str],
+        item_ids: List[int],
+    ) -> int:
+        return Item.bulk_assign(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            user=user,
+            condition=condition,
+            item_names=item_names,
+            item_ids=item_ids,
+        )
+
+    def assign_items_to_users(self, assignments: Dict[str, List[str]]) -> int:
+        """
+        :param assignments: item names to assign keyed by user
+        :return: successed items count
+        """
+        return Item.bulk_assign_users(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            assignments=assignments,
+        )
+
+    def unassign_items(
+        self,
+        *,
+        condition: Condition = None,
+        item_names: List[str] = None,
+        item_ids: List[int] = None,
+    ) -> int:
+        return Item.bulk_unassign(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            condition=condition,
             item_names=item_names,
+            item_ids=item_ids,
         )
 
-    def get_annotations(
+    async def aget_item(self, pk: Union[str, int], include_custom_metadata=False):
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return await _item.aget(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            pk=pk,
+            include_custom_metadata=include_custom_metadata,
+        )
+
+    async def aattach_items(
+        self,
+        attachments: List[Attachment],
+        annotation_status: AnnotationStatus,
+        meta: Dict[str, AttachmentMeta] = None,
+    ) -> Tuple[List[str], List[str]]:
+        if self.project.upload_state == UploadStateEnum.BASIC:
+            raise SAValidationException(constants.ATTACHING_UPLOAD_STATE_ERROR)
+        return await Item.aattach(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            attachments=attachments,
+            annotation_status=annotation_status,
+            upload_state=UploadStateEnum.EXTERNAL,
+            meta=meta,
+        )
+
+    async def alist_items(
         self,
         *,
         condition: Condition = None,
         item_ids: List[int] = None,
         item_names: List[str] = None,
-    ) -> List[dict]:
-        items = self.list_items(
+    ) -> List[Union[BaseItemEntity, Item, VideoItem, ImageItem]]:
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return await _item.alist(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            condition=condition,
+            item_ids=item_ids,
+            item_names=item_names,
+        )
+
+    async def adelete_items(
+        self, *, item_ids: List[int] = None, item_names: List[str] = None
+    ) -> DeleteReport:
+        _item = PROJECT_ITEM_MAP[self.project.type]
+        return await _item.abulk_delete(
+            self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            item_ids=item_ids,
+            item_names=item_names,
+        )
+
+    async def aget_annotations(
+        self,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+        memory_budget: int = None,
+        annotation_filter: AnnotationFilter = None,
+        as_arrays: bool = False,
+    ) -> Union[Sequence[dict], AnnotationArrays]:
+        items = await self.alist_items(
             condition=condition, item_ids=item_ids, item_names=item_names
         )
-        annotations = []
-        if items:
-            annotations = run_async(
-                Item.alist_annotations(
-                    session=self.session,
-                    project_id=self.project_id,
-                    folder_id=self.id,
-                    items=items,
-                )
-            )
+        annotations = await self._aget_annotations(
+            items, memory_budget, annotation_filter, as_arrays
+        )
         if item_names:
-            #  keeping the same oreder
-            name_to_index = {name: index for index, name in enumerate(item_names)}
-            annotations = list(
-                sorted(annotations, key=lambda x: name_to_index[x["metadata"]["name"]])
-            )
+            annotations = self._order_by_names(annotations, item_names)
         return annotations
 
-    def copy_items_by_name(
+    def upload_annotations(
+        self,
+        annotations: Iterable[AnnotationSource],
+        *,
+        max_concurrency: int = None,
+    ) -> List[UploadResult]:
+        """
+        Uploads the annotations of the folder items concurrently, see AnnotationUploader.
+        :param annotations: annotation dicts or paths of <item name>.json annotation files.
+        """
+        return run_session_async(
+            self.session,
+            self.aupload_annotations(annotations, max_concurrency=max_concurrency),
+        )
+
+    async def aupload_annotations(
+        self,
+        annotations: Iterable[AnnotationSource],
+        *,
+        max_concurrency: int = None,
+    ) -> List[UploadResult]:
+        return await AnnotationUploader(
+            self.session, self.project_id, self.id, max_concurrency
+        ).arun(annotations)
+
+    async def _aiter_item_chunks(
+        self, condition: Condition = None
+    ) -> AsyncIterator[List[int]]:
+        items = AsyncItemRepository(self.session).iter_items(
+            self.project_id, self.id, condition
+        )
+        async for chunk in achunkify_iter(
+            (item["id"] async for item in items), self.ANNOTATIONS_CHUNK_SIZE
+        ):
+            yield chunk
+
+    async def aiter_annotations(
+        self,
+        *,
+        condition: Condition = None,
+        annotation_filter: AnnotationFilter = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Streams the annotations of the folder items without keeping them,
+        items are listed and their annotations fetched ANNOTATIONS_CHUNK_SIZE at a time.
+        """
+        repo = AnnotationRepository(self.session)
+        async for item_ids in self._aiter_item_chunks(condition):
+            sort_response = await repo.asort_annotations_by_size(
+                self.project_id, item_ids
+            )
+            for chunk in sort_response["small"]:
+                async for annotation in repo.iter_annotations(
+                    self.project_id,
+                    self.id,
+                    [i["id"] for i in chunk],
+                    annotation_filter=annotation_filter,
+                ):
+                    yield annotation
+            for item in sort_response["large"]:
+                annotation = await repo.get_large_annotation(
+                    self.project_id, self.id, item["id"]
+                )
+                filtered = (
+                    annotation_filter(annotation) if annotation_filter else annotation
+                )
+                if filtered is not None:
+                    yield filtered
+
+    def get_statistics(
+        self,
+        *,
+        condition: Condition = None,
+        annotation_filter: AnnotationFilter = None,
+    ) -> AnnotationStatistics:
+        """
+        Aggregates the folder annotations while they are streamed, see AnnotationStatistics.
+        """
+        return run_session_async(
+            self.session,
+            self.aget_statistics(
+                condition=condition, annotation_filter=annotation_filter
+            ),
+        )
+
+    async def aget_statistics(
+        self,
+        *,
+        condition: Condition = None,
+        annotation_filter: AnnotationFilter = None,
+    ) -> AnnotationStatistics:
+        statistics = AnnotationStatistics()
+        async for annotation in self.aiter_annotations(
+            condition=condition, annotation_filter=annotation_filter
+        ):
+            statistics.add(annotation)
+        return statistics
+
+    def download_annotations(
+        self,
+        download_path: str,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+        resume: bool = False,
+    ) -> int:
+        """
+        Stores the item annotations as <download_path>/<item name>.json, journaling every stored file.
+        :param resume: skip the items whose files the journal of a previous download verifies.
+        :return: the count of the downloaded annotations.
+        """
+        return run_session_async(
+            self.session,
+            self.adownload_annotations(
+                download_path,
+                condition=condition,
+                item_ids=item_ids,
+                item_names=item_names,
+                resume=resume,
+            ),
+        )
+
+    async def adownload_annotations(
+        self,
+        download_path: str,
+        *,
+        condition: Condition = None,
+        item_ids: List[int] = None,
+        item_names: List[str] = None,
+        resume: bool = False,
+    ) -> int:
+        items = await self.alist_items(
+            condition=condition, item_ids=item_ids, item_names=item_names
+        )
+        with DownloadJournal(download_path, resume=resume) as journal:
+            return await Item.adownload_annotations(
+                session=self.session,
+                project_id=self.project_id,
+                folder_id=self.id,
+                items=items,
+                download_path=download_path,
+                journal=journal,
+            )
+
+    async def acopy_items_by_name(
         self,
         destination_folder_id: int,
         items: List[str],
         include_annotations=True,
     ) -> List[str]:
-        return Item.copy_items_by_names(
+        return await Item.acopy_items_by_names(
             self.session,
             project_id=self.project_id,
             source_folder_id=self.id,
@@ -555,10 +1483,10 @@ class Folder(FolderEntity):
             include_annotations=include_annotations,
         )
 
-    def move_items_by_name(
+    async def amove_items_by_name(
         self, destination_folder_id: int, items: List[str]
     ) -> List[str]:
-        return Item.move_items_by_names(
+        return await Item.amove_items_by_names(
             self.session,
             project_id=self.project_id,
             source_folder_id=self.id,
@@ -566,10 +1494,10 @@ class Folder(FolderEntity):
             items=items,
         )
 
-    def set_items_annotation_statuses(
+    async def aset_items_annotation_statuses(
         self, items: List[str], annotation_status: AnnotationStatus
-    ):
-        Item.bulk_set_annotation_status(
+    ) -> BulkReport:
+        return await Item.abulk_set_annotation_status(
             session=self.session,
             project_id=self.project_id,
             folder_id=self.id,
@@ -577,10 +1505,10 @@ class Folder(FolderEntity):
             annotation_status=annotation_status,
         )
 
-    def set_items_approval_statuses(
+    async def aset_items_approval_statuses(
         self, items: List[str], approval_status: ApprovalStatus
-    ):
-        Item.bulk_set_approval_status(
+    ) -> BulkReport:
+        return await Item.abulk_set_approval_status(
             session=self.session,
             project_id=self.project_id,
             folder_id=self.id,
@@ -588,29 +1516,15 @@ class Folder(FolderEntity):
             approval_status=approval_status,
         )
 
-    def assign(self, users: List[str]):
-        _users = self.project.users
-        verified_users = {i["user_id"] for i in _users}
-        intersection = set(users).intersection(set(verified_users))
-        unverified_contributor = set(users) - verified_users
-        if unverified_contributor:  # todo update error message
-            logger.warning(
-                f"Skipping not a verified {','.join(unverified_contributor)} from assignees."
-            )
-        if intersection:
-            FolderRepository(session=self._session).assign(
-                project_id=self.project_id, folder_name=self.name, users=users
-            )
-
-    def assign_items(
+    async def aassign_items(
         self,
         user: str,
         *,
         condition: Condition = None,
-        item_names: List[str],
-        item_ids: List[int],
-    ):
-        Item.bulk_assign(
+        item_names: List[str] = None,
+        item_ids: List[int] = None,
+    ) -> int:
+        return await Item.abulk_assign(
             session=self.session,
             project_id=self.project_id,
             folder_id=self.id,
@@ -620,14 +1534,22 @@ class Folder(FolderEntity):
             item_ids=item_ids,
         )
 
-    def unassign_items(
+    async def aassign_items_to_users(self, assignments: Dict[str, List[str]]) -> int:
+        return await Item.abulk_assign_users(
+            session=self.session,
+            project_id=self.project_id,
+            folder_id=self.id,
+            assignments=assignments,
+        )
+
+    async def aunassign_items(
         self,
         *,
         condition: Condition = None,
         item_names: List[str] = None,
         item_ids: List[int] = None,
-    ):
-        Item.bulk_unassign(
+    ) -> int:
+        return await Item.abulk_unassign(
             session=self.session,
             project_id=self.project_id,
             folder_id=self.id,
@@ -654,22 +1576,14 @@ class Folder(FolderEntity):
 
     @classmethod
     def get(cls, session: Session, project_id: int, pk: Union[str, int]):
+        repo = FolderRepository(session)
         if isinstance(pk, int):
-            return cls._from_entity(
-                FolderRepository(session).get_by_id(project_id=project_id, folder_id=pk)
-            )
+            return cls._from_entity(repo.get_cached_by_id(project_id, pk))
         elif isinstance(pk, str):
-            condition = Condition("project_id", project_id, EQ) & Condition(
-                "namne", pk, EQ
-            )
-            repo = FolderRepository(session)
-            folder = next(
-                (cls._from_entity(i) for i in repo.list(condition) if i.name == pk),
-                None,
-            )
+            folder = repo.get_cached_by_name(project_id, pk)
             if not folder:
                 raise SAInvalidInput("Folder not found.")
-            return folder
+            return cls._from_entity(folder)
         else:
             raise SAInvalidInput("Invalid primery key.")
 
@@ -677,7 +1591,7 @@ class Folder(FolderEntity):
     @classmethod
     def get_by_id(cls, session: Session, project_id: int, folder_id: int):
         return cls._from_entity(
-            FolderRepository(session).get_by_id(
+            FolderRepository(session).get_cached_by_id(
                 project_id=project_id, folder_id=folder_id
             )
         )
@@ -685,16 +1599,10 @@ class Folder(FolderEntity):
     # todo delete
     @classmethod
     def get_by_name(cls, session: Session, project_id: int, name: str) -> "Folder":
-        condition = Condition("project_id", project_id, EQ) & Condition(
-            "namne", name, EQ
-        )
-        repo = FolderRepository(session)
-        folder = next(
-            (cls._from_entity(i) for i in repo.list(condition) if i.name == name), None
-        )
+        folder = FolderRepository(session).get_cached_by_name(project_id, name)
         if not folder:
             raise SAInvalidInput("Folder not found.")
-        return folder
+        return cls._from_entity(folder)
 
     @classmethod
     def create(cls, session: Session, project_id: int, name: str):
@@ -708,21 +1616,67 @@ class Folder(FolderEntity):
     @classmethod
     def delete_folders(cls, session: Session, project_id: int, names: List[str]) -> int:
         repo = FolderRepository(session)
-        existing_folders = repo.list(Condition("project_id", project_id, EQ))
-        to_delete = []
-        for folder in existing_folders:
-            if folder.name in names:
-                to_delete.append(folder.id)
+        index = repo.index(project_id)
+        if any(index.get_by_name(name) is None for name in names):
+            index = repo.index(project_id, refresh=True)
+        to_delete = cls._indexed_ids(index, names)
         if to_delete:
-            FolderRepository(session).bulk_delete(
-                project_id=project_id, folder_ids=to_delete
-            )
+            repo.bulk_delete(project_id=project_id, folder_ids=to_delete)
         return len(to_delete)
 
+    @staticmethod
+    def _indexed_ids(index: FolderIndex, names: List[str]) -> List[int]:
+        folders = (index.get_by_name(name) for name in set(names))
+        return [folder.id for folder in folders if folder]
+
     @classmethod
     def update_folder(cls, session: Session, folder: "Folder") -> "Folder":
         return cls._from_entity(FolderRepository(session).update(folder))
 
+    @classmethod
+    async def aget(cls, session: Session, project_id: int, pk: Union[str, int]):
+        repo = AsyncFolderRepository(session)
+        if isinstance(pk, int):
+            return cls._from_entity(await repo.get_cached_by_id(project_id, pk))
+        elif isinstance(pk, str):
+            folder = await repo.get_cached_by_name(project_id, pk)
+            if not folder:
+                raise SAInvalidInput("Folder not found.")
+            return cls._from_entity(folder)
+        else:
+            raise SAInvalidInput("Invalid primery key.")
+
+    @classmethod
+    async def acreate(cls, session: Session, project_id: int, name: str):
+        name = cls._clean_folder_name(name)
+        return await AsyncFolderRepository(session).create(
+            project_id=project_id, name=name
+        )
+
+    @classmethod
+    async def alist(cls, session: Session, condition: Condition):
+        return [
+            cls._from_entity(i)
+            for i in await AsyncFolderRepository(session).list(condition)
+        ]
+
+    @classmethod
+    async def adelete_folders(
+        cls, session: Session, project_id: int, names: List[str]
+    ) -> int:
+        repo = AsyncFolderRepository(session)
+        index = await repo.index(project_id)
+        if any(index.get_by_name(name) is None for name in names):
+            index = await repo.index(project_id, refresh=True)
+        to_delete = cls._indexed_ids(index, names)
+        if to_delete:
+            await repo.bulk_delete(project_id=project_id, folder_ids=to_delete)
+        return len(to_delete)
+
+    @classmethod
+    async def aupdate_folder(cls, session: Session, folder: "Folder") -> "Folder":
+        return cls._from_entity(await AsyncFolderRepository(session).update(folder))
+
 
 class Project(ProjectEntity):
     @classmethod
@@ -819,3 +1773,199 @@ class Project(ProjectEntity):
         return AnnotationClass.bulk_create(
             self.session, self.id, annotation_classes_prepared
         )
+
+    def class_registry(self, refresh: bool = False) -> ClassRegistry:
+        """
+        Returns the cached annotation class index of the project, see ClassRegistry.
+        """
+        return AnnotationClassesRepository(self.session).registry(self.id, refresh)
+
+    @classmethod
+    async def aget_by_id(cls, session, project_id):
+        return cls._from_entity(
+            await AsyncProjectRepository(session).get_by_id(project_id)
+        )
+
+    @classmethod
+    async def aget(cls, session: Session, pk: Union[str, int]) -> "Project":
+        project: Optional[ProjectEntity]
+        if isinstance(pk, int):
+            project = await AsyncProjectRepository(session).get_by_id(pk)
+        elif isinstance(pk, str):
+            projects = await cls.alist(session, condition=Condition("name", pk, EQ))
+            project = next(
+                (project for project in projects if project.name == pk),
+                None,
+            )
+            if not project:
+                raise SAInvalidInput("Project not found.")
+        else:
+            raise SAInvalidInput("Invalid primery key.")
+        return cls._from_entity(project)
+
+    @classmethod
+    async def acreate(cls, session, **data) -> "Project":
+        return cls._from_entity(
+            await AsyncProjectRepository(session).create(ProjectEntity(**data))
+        )
+
+    @classmethod
+    async def alist(cls, session: Session, condition: Condition) -> List["Project"]:
+        return [
+            cls._from_entity(i)
+            for i in await AsyncProjectRepository(session).list(condition)
+        ]
+
+    async def acreate_folder(self, name: str) -> Folder:
+        return await Folder.acreate(self.session, project_id=self.id, name=name)
+
+    async def adelete_folders(self, folder_names: List[str]) -> int:
+        return await Folder.adelete_folders(
+            self.session, project_id=self.id, names=folder_names
+        )
+
+    async def aset_folder_status(
+        self, folder_name: str, status: FolderStatus
+    ) -> Folder:
+        folder = await Folder.aget(self.session, self.id, folder_name)
+        folder.status = status
+        return await Folder.aupdate_folder(self.session, folder)
+
+    @set_releated_attribute("project", many=True)
+    async def alist_folders(
+        self, condition: Condition = EmptyCondition()
+    ) -> List[Folder]:
+        condition &= Condition("project_id", self.id, EQ)
+        return await Folder.alist(self.session, condition)
+
+    @set_releated_attribute("project")
+    async def aget_folder(self, pk: Union[str, int]):
+        if isinstance(pk, str) and not pk:
+            pk = "root"
+        return await Folder.aget(self.session, project_id=self.id, pk=pk)
+
+    async def acreate_annotation_classes(self, annotation_classes: List[dict]):
+        return await AnnotationClass.abulk_create(
+            self.session,
+            self.id,
+            [AnnotationClass.from_json(i) for i in annotation_classes],
+        )
+
+    def snapshot(self, max_concurrency: int = None) -> ProjectSnapshot:
+        """
+        Fetches the project folders, classes and items concurrently, see ProjectSnapshot.
+        """
+        return run_session_async(self.session, self.asnapshot(max_concurrency))
+
+    async def asnapshot(self, max_concurrency: int = None) -> ProjectSnapshot:
+        return await ProjectSnapshot.afetch(self.session, self.id, max_concurrency)
+
+    def export_annotations(
+        self,
+        sink: Union[str, AnnotationSink],
+        *,
+        folders: List[str] = None,
+        max_concurrency: int = None,
+        rate_limit: float = None,
+        resume: bool = True,
+        export_format: str = "json",
+    ) -> ExportReport:
+        """
+        Exports the annotations of the project folders concurrently, see ProjectExporter.
+        :param sink: a directory path or an AnnotationSink.
+        :param folders: names of the folders to export, all the folders by default.
+        :param rate_limit: maximum requests per second of the whole export.
+        :param resume: skip the annotations the sink already has.
+        :param export_format: format of the directory path sink, one of
+         json (file per item), coco (<path>/annotations.json, see CocoSink) or yolo (see YoloSink).
+        """
+        return run_session_async(
+            self.session,
+            self.aexport_annotations(
+                sink,
+                folders=folders,
+                max_concurrency=max_concurrency,
+                rate_limit=rate_limit,
+                resume=resume,
+                export_format=export_format,
+            ),
+        )
+
+    async def aexport_annotations(
+        self,
+        sink: Union[str, AnnotationSink],
+        *,
+        folders: List[str] = None,
+        max_concurrency: int = None,
+        rate_limit: float = None,
+        resume: bool = True,
+        export_format: str = "json",
+    ) -> ExportReport:
+        if isinstance(sink, str):
+            sink = await self._directory_sink(sink, export_format)
+        return await ProjectExporter(
+            self.session,
+            self.id,
+            sink,
+            folders=folders,
+            max_concurrency=max_concurrency,
+            rate_limit=rate_limit,
+            resume=resume,
+        ).arun()
+
+    def get_statistics(
+        self,
+        *,
+        folders: List[str] = None,
+        annotation_filter: AnnotationFilter = None,
+        max_concurrency: int = None,
+    ) -> AnnotationStatistics:
+        """
+        Aggregates the annotations of the project folders concurrently and merges the folder statistics.
+        :param folders: names of the folders to aggregate, all the folders by default.
+        """
+        return run_session_async(
+            self.session,
+            self.aget_statistics(
+                folders=folders,
+                annotation_filter=annotation_filter,
+                max_concurrency=max_concurrency,
+            ),
+        )
+
+    async def aget_statistics(
+        self,
+        *,
+        folders: List[str] = None,
+        annotation_filter: AnnotationFilter = None,
+        max_concurrency: int = None,
+    ) -> AnnotationStatistics:
+        if folders is None:
+            _folders = await self.alist_folders()
+        else:
+            _folders = [await self.aget_folder(i) for i in folders]
+        statistics = AnnotationStatistics()
+        for folder_statistics in await gather_bounded(
+            (i.aget_statistics(annotation_filter=annotation_filter) for i in _folders),
+            max_concurrency or self.session.MAX_COROUTINE_COUNT,
+        ):
+            statistics.merge(folder_statistics)
+        return statistics
+
+    async def _directory_sink(self, path: str, export_format: str) -> AnnotationSink:
+        if export_format == "json":
+            return DirectorySink(path, self.session.json_codec)
+        if export_format == "coco":
+            return CocoSink(
+                os.path.join(path, "annotations.json"),
+                await self.aclass_registry(),
+                self.session.json_codec,
+            )
+        if export_format == "yolo":
+            return YoloSink(path, await self.aclass_registry())
+        raise SAInvalidInput(f"Unsupported export format {export_format}.")
+
+    async def aclass_registry(self, refresh: bool = False) -> ClassRegistry:
+        return await AsyncAnnotationClassesRepository(self.session).registry(
+            self.id, refresh
+        )
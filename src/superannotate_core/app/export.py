@@ -0,0 +1,465 @@
+import asyncio
+import contextlib
+import logging
+import os
+import queue
+import shutil
+import threading
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import aiohttp
+from superannotate_core.core.entities import AnnotationClassEntity
+from superannotate_core.core.entities import FolderEntity
+from superannotate_core.core.enums import AnnotationTypes
+from superannotate_core.core.exceptions import SAInvalidInput
+from superannotate_core.core.utils import chunkify
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.codecs import JSONCodec
+from superannotate_core.infrastructure.repositories import AnnotationRepository
+from superannotate_core.infrastructure.repositories import AsyncFolderRepository
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.repositories.classes_repository import (
+    ClassRegistry,
+)
+from superannotate_core.infrastructure.repositories.utils import AsyncRateLimiter
+from superannotate_core.infrastructure.repositories.utils import gather_bounded
+from superannotate_core.infrastructure.session import Session
+from typing_extensions import TypedDict
+
+logger = logging.getLogger(__name__)
+
+
+class ExportReport(TypedDict):
+    exported: int
+    skipped: int
+    failed: List[int]
+    errors: List[str]
+
+
+class AnnotationSink(ABC):
+    """
+    Destination of the exported annotations.
+    """
+
+    def exists(self, folder_name: str, item_name: str) -> bool:
+        """
+        Whether the annotation was written by a previous export, resumed exports skip it.
+        """
+        return False
+
+    @abstractmethod
+    def write(self, folder_name: str, annotation: dict):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class DirectorySink(AnnotationSink):
+    """
+    Writes each annotation to <path>/<folder name>/<item name>.json, root folder annotations to <path>.
+    Files are written by a background thread, at most `buffer_size` of them are pending.
+    """
+
+    def __init__(
+        self, path: str, json_codec: JSONCodec = None, buffer_size: int = 1000
+    ):
+        self.path = path
+        self._json_codec = json_codec if json_codec else get_json_codec()
+        self._writer = _WriteBehind(buffer_size)
+
+    def _path(self, folder_name: str, item_name: str) -> str:
+        if folder_name == "root":
+            return os.path.join(self.path, f"{item_name}.json")
+        return os.path.join(self.path, folder_name, f"{item_name}.json")
+
+    def exists(self, folder_name: str, item_name: str) -> bool:
+        return os.path.exists(self._path(folder_name, item_name))
+
+    def write(self, folder_name: str, annotation: dict):
+        path = self._path(folder_name, annotation["metadata"]["name"])
+        self._writer.write(path, self._json_codec.dumps(annotation))
+
+    def close(self):
+        self._writer.close()
+
+
+class CallbackSink(AnnotationSink):
+    def __init__(self, callback: Callable[[str, dict], Any]):
+        self._callback = callback
+
+    def write(self, folder_name: str, annotation: dict):
+        self._callback(folder_name, annotation)
+
+
+class _WriteBehind:
+    """
+    Writes files from a background thread, at most `buffer_size` writes are pending.
+    Files are written under a temporary name and renamed, so interrupted writes are not taken as exported.
+    """
+
+    def __init__(self, buffer_size: int):
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            if task is None:
+                return
+            if self._error:
+                continue
+            path, data = task
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(f"{path}.part", "wb") as file:
+                    file.write(data)
+                os.replace(f"{path}.part", path)
+            except OSError as e:
+                self._error = e
+
+    def write(self, path: str, data: bytes):
+        if self._error:
+            raise self._error
+        self._queue.put((path, data))
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error:
+            raise self._error
+
+
+def _class_of(
+    registry: ClassRegistry, instance: dict
+) -> Optional[AnnotationClassEntity]:
+    if instance.get("classId") is not None:
+        annotation_class = registry.get_by_id(instance["classId"])
+        if annotation_class:
+            return annotation_class
+    class_name = instance.get("className")
+    return registry.get_by_name(class_name) if class_name else None
+
+
+def _polygon_bbox(points: List[float]) -> Tuple[float, float, float, float]:
+    xs, ys = points[0::2], points[1::2]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class CocoSink(AnnotationSink):
+    """
+    Writes the bbox and polygon instances as a single COCO JSON file.
+    Images and annotations are appended to two temporary files as they arrive
+    and joined with the categories of the class registry on close, so memory use doesn't grow with the export.
+    Category ids are the annotation class ids.
+    """
+
+    def __init__(
+        self, path: str, class_registry: ClassRegistry, json_codec: JSONCodec = None
+    ):
+        self.path = path
+        self._registry = class_registry
+        self._json_codec = json_codec if json_codec else get_json_codec()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._images = open(f"{path}.images.part", "w+b")
+        self._annotations = open(f"{path}.annotations.part", "w+b")
+        self._image_id = 0
+        self._annotation_id = 0
+
+    def _append(self, file, record: dict):
+        if file.tell():
+            file.write(b",")
+        file.write(self._json_codec.dumps(record))
+
+    def _coco_annotation(self, image_id: int, instance: dict) -> Optional[dict]:
+        annotation_class = _class_of(self._registry, instance)
+        if not annotation_class:
+            return None
+        _type, points = instance.get("type"), instance.get("points")
+        if not points:
+            return None
+        if _type == AnnotationTypes.BBOX:
+            x1, y1, x2, y2 = points["x1"], points["y1"], points["x2"], points["y2"]
+            segmentation = []
+            area = abs(x2 - x1) * abs(y2 - y1)
+        elif _type == AnnotationTypes.POLYGON and len(points) >= 6:
+            x1, y1, x2, y2 = _polygon_bbox(points)
+            segmentation = [points]
+            xs, ys = points[0::2], points[1::2]
+            # shoelace formula
+            area = abs(
+                sum(xs[i - 1] * ys[i] - xs[i] * ys[i - 1] for i in range(len(xs)))
+            )
+            area /= 2
+        else:
+            return None
+        self._annotation_id += 1
+        return {
+            "id": self._annotation_id,
+            "image_id": image_id,
+            "category_id": annotation_class.id,
+            "bbox": [min(x1, x2), min(y1, y2), abs(x2 - x1), abs(y2 - y1)],
+            "area": area,
+            "segmentation": segmentation,
+            "iscrowd": 0,
+        }
+
+    def write(self, folder_name: str, annotation: dict):
+        metadata = annotation["metadata"]
+        self._image_id += 1
+        self._append(
+            self._images,
+            {
+                "id": self._image_id,
+                "file_name": metadata["name"]
+                if folder_name == "root"
+                else f"{folder_name}/{metadata['name']}",
+                "width": metadata.get("width"),
+                "height": metadata.get("height"),
+            },
+        )
+        for instance in annotation.get("instances") or []:
+            coco_annotation = self._coco_annotation(self._image_id, instance)
+            if coco_annotation:
+                self._append(self._annotations, coco_annotation)
+
+    def close(self):
+        if self._images.closed:
+            return
+        categories = [
+            {"id": i.id, "name": i.name, "supercategory": i.name}
+            for i in self._registry
+        ]
+        with open(f"{self.path}.part", "wb") as file:
+            for key, part in (
+                (b'{"images":[', self._images),
+                (b'],"annotations":[', self._annotations),
+            ):
+                file.write(key)
+                part.seek(0)
+                shutil.copyfileobj(part, file)
+            file.write(b'],"categories":')
+            file.write(self._json_codec.dumps(categories))
+            file.write(b"}")
+        os.replace(f"{self.path}.part", self.path)
+        for part in (self._images, self._annotations):
+            part.close()
+            os.remove(part.name)
+
+
+class YoloSink(AnnotationSink):
+    """
+    Writes a YOLO label file per item, <path>/<folder name>/<item name stem>.txt,
+    with the class indexes of <path>/classes.txt.
+    Bbox instances are written as boxes, polygons as their bounding boxes or,
+    with `segments`, as polygons. Coordinates are normalized by the item width and height.
+    Label files are written by a background thread, at most `buffer_size` of them are pending.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        class_registry: ClassRegistry,
+        segments: bool = False,
+        buffer_size: int = 1000,
+    ):
+        self.path = path
+        self._registry = class_registry
+        self._segments = segments
+        self._indexes = {c.id: i for i, c in enumerate(class_registry)}
+        self._writer = _WriteBehind(buffer_size)
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "classes.txt"), "w", encoding="utf-8") as file:
+            file.writelines(f"{i.name}\n" for i in class_registry)
+
+    def _path(self, folder_name: str, item_name: str) -> str:
+        name = f"{os.path.splitext(item_name)[0]}.txt"
+        if folder_name == "root":
+            return os.path.join(self.path, name)
+        return os.path.join(self.path, folder_name, name)
+
+    def exists(self, folder_name: str, item_name: str) -> bool:
+        return os.path.exists(self._path(folder_name, item_name))
+
+    def _line(self, instance: dict, width: float, height: float) -> Optional[str]:
+        annotation_class = _class_of(self._registry, instance)
+        if not annotation_class:
+            return None
+        _type, points = instance.get("type"), instance.get("points")
+        if not points:
+            return None
+        if _type == AnnotationTypes.BBOX:
+            box = points["x1"], points["y1"], points["x2"], points["y2"]
+        elif _type == AnnotationTypes.POLYGON and len(points) >= 6:
+            if self._segments:
+                coordinates = " ".join(
+                    f"{v / (height if i % 2 else width):.6f}"
+                    for i, v in enumerate(points[: len(points) // 2 * 2])
+                )
+                return f"{self._indexes[annotation_class.id]} {coordinates}"
+            box = _polygon_bbox(points)
+        else:
+            return None
+        x1, y1, x2, y2 = box
+        return (
+            f"{self._indexes[annotation_class.id]} "
+            f"{(x1 + x2) / 2 / width:.6f} {(y1 + y2) / 2 / height:.6f} "
+            f"{abs(x2 - x1) / width:.6f} {abs(y2 - y1) / height:.6f}"
+        )
+
+    def write(self, folder_name: str, annotation: dict):
+        metadata = annotation["metadata"]
+        width, height = metadata.get("width"), metadata.get("height")
+        lines = []
+        if width and height:
+            for instance in annotation.get("instances") or []:
+                line = self._line(instance, width, height)
+                if line:
+                    lines.append(line)
+        elif annotation.get("instances"):
+            logger.warning("Skipping the instances of %s, no size.", metadata["name"])
+        data = "".join(f"{i}\n" for i in lines).encode("utf-8")
+        self._writer.write(self._path(folder_name, metadata["name"]), data)
+
+    def close(self):
+        self._writer.close()
+
+
+class ProjectExporter:
+    """
+    Exports the annotations of the project folders concurrently.
+    Every request of the export takes a slot of the shared `max_concurrency` budget
+    and, when `rate_limit` is set, a token of the shared requests per second limit.
+    """
+
+    SORT_CHUNK_SIZE = 2000
+
+    def __init__(
+        self,
+        session: Session,
+        project_id: int,
+        sink: AnnotationSink,
+        folders: List[str] = None,
+        max_concurrency: int = None,
+        rate_limit: float = None,
+        resume: bool = True,
+    ):
+        self._session = session
+        self._project_id = project_id
+        self._sink = sink
+        self._folder_names = folders
+        self._max_concurrency = max_concurrency or session.MAX_COROUTINE_COUNT
+        self._rate_limit = rate_limit
+        self._resume = resume
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[AsyncRateLimiter] = None
+        self._annotation_repo = AnnotationRepository(session)
+        self._report = ExportReport(exported=0, skipped=0, failed=[], errors=[])
+
+    @contextlib.asynccontextmanager
+    async def _slot(self):
+        async with self._semaphore:
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+            yield
+
+    def _failed(self, item_ids: List[int], error: Exception):
+        logger.warning("Failed to export %s annotations: %s", len(item_ids), error)
+        self._report["failed"].extend(item_ids)
+        self._report["errors"].append(str(error))
+
+    async def _folders(self) -> List[FolderEntity]:
+        repo = AsyncFolderRepository(self._session)
+        if self._folder_names is None:
+            return list(await repo.index(self._project_id))
+        folders = []
+        for name in self._folder_names:
+            folder = await repo.get_cached_by_name(self._project_id, name)
+            if not folder:
+                raise SAInvalidInput(f"Folder {name} not found.")
+            folders.append(folder)
+        return folders
+
+    async def _export_small(self, folder: FolderEntity, items: Dict[int, str]):
+        written = set()
+        async with self._slot():
+            try:
+                async for annotation in self._annotation_repo.iter_annotations(
+                    self._project_id, folder.id, list(items)
+                ):
+                    self._sink.write(folder.name, annotation)
+                    written.add(annotation["metadata"]["name"])
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._failed([i for i, n in items.items() if n not in written], e)
+        self._report["exported"] += len(written)
+
+    async def _export_large(self, folder: FolderEntity, item_id: int):
+        async with self._slot():
+            try:
+                annotation = await self._annotation_repo.get_large_annotation(
+                    self._project_id, folder.id, item_id
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self._failed([item_id], e)
+                return
+        self._sink.write(folder.name, annotation)
+        self._report["exported"] += 1
+
+    async def _export_folder(self, folder: FolderEntity):
+        names: Dict[int, str] = {}
+        async with self._slot():
+            try:
+                async for item in AsyncItemRepository(self._session).iter_items(
+                    self._project_id, folder.id
+                ):
+                    if self._resume and self._sink.exists(folder.name, item["name"]):
+                        self._report["skipped"] += 1
+                    else:
+                        names[item["id"]] = item["name"]
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning("Failed to list the items of %s: %s", folder.name, e)
+                self._report["errors"].append(str(e))
+                return
+        exports = []
+        for chunk in chunkify(list(names), self.SORT_CHUNK_SIZE):
+            async with self._slot():
+                try:
+                    sorted_items = (
+                        await self._annotation_repo.asort_annotations_by_size(
+                            self._project_id, chunk
+                        )
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self._failed(chunk, e)
+                    continue
+            for small in sorted_items["small"]:
+                items = {i["id"]: names[i["id"]] for i in small}
+                exports.append(self._export_small(folder, items))
+            for large in sorted_items["large"]:
+                exports.append(self._export_large(folder, large["id"]))
+        await asyncio.gather(*exports)
+
+    async def arun(self) -> ExportReport:
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        if self._rate_limit:
+            self._rate_limiter = AsyncRateLimiter(
+                self._rate_limit, burst=self._max_concurrency
+            )
+        try:
+            await gather_bounded(
+                (self._export_folder(i) for i in await self._folders()),
+                self._max_concurrency,
+            )
+        finally:
+            self._sink.close()
+        return self._report
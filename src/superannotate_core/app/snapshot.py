@@ -0,0 +1,200 @@
+import asyncio
+import gzip
+import time
+from collections import Counter
+from enum import IntEnum
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Type
+from typing import Union
+
+from superannotate_core.core.conditions import Condition
+from superannotate_core.core.conditions import CONDITION_EQ as EQ
+from superannotate_core.core.enums import AnnotationStatus
+from superannotate_core.core.enums import ApprovalStatus
+from superannotate_core.core.exceptions import SAInvalidInput
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.repositories import (
+    AsyncAnnotationClassesRepository,
+)
+from superannotate_core.infrastructure.repositories import AsyncFolderRepository
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.repositories import AsyncProjectRepository
+from superannotate_core.infrastructure.repositories.classes_repository import (
+    ClassRegistry,
+)
+from superannotate_core.infrastructure.repositories.folder_repository import (
+    FolderIndex,
+)
+from superannotate_core.infrastructure.repositories.folder_repository import (
+    FolderIndexCache,
+)
+from superannotate_core.infrastructure.repositories.utils import gather_bounded
+from superannotate_core.infrastructure.session import Session
+from superannotate_core.infrastructure.transport import GZIP_COMPRESSION_LEVEL
+
+
+class ProjectSnapshot:
+    """
+    Point in time copy of a project with its folders, annotation classes and items.
+    Items are kept as the raw listing dicts, indexed by folder id.
+    """
+
+    MAGIC = b"SASNAPSHOT"
+    VERSION = 1
+
+    def __init__(
+        self,
+        project: dict,
+        folders: List[dict],
+        classes: List[dict],
+        items: Dict[int, List[dict]],
+        created_at: float = None,
+    ):
+        self.project = project
+        self.folders = folders
+        self.classes = classes
+        self.created_at = created_at if created_at is not None else time.time()
+        self._folders_by_id = {i["id"]: i for i in folders}
+        self._folders_by_name = {i["name"]: i for i in folders}
+        self._items = {i["id"]: items.get(i["id"], []) for i in folders}
+
+    @classmethod
+    async def afetch(
+        cls, session: Session, project_id: int, max_concurrency: int = None
+    ) -> "ProjectSnapshot":
+        """
+        Fetches the project, folders and classes at once, then the items of at most
+        `max_concurrency` folders at a time.
+        """
+        condition = Condition("project_id", project_id, EQ)
+        project, folders, classes = await asyncio.gather(
+            AsyncProjectRepository(session).get_by_id(project_id),
+            AsyncFolderRepository(session).list(condition),
+            AsyncAnnotationClassesRepository(session).list(condition),
+        )
+        FolderIndexCache(session).set(project_id, FolderIndex(folders, complete=True))
+        session.cache(
+            AsyncAnnotationClassesRepository.REGISTRY_CACHE,
+            AsyncAnnotationClassesRepository.REGISTRY_TTL,
+        ).set(project_id, ClassRegistry(project_id, classes))
+        item_repo = AsyncItemRepository(session)
+
+        async def _list_items(folder_id: int) -> List[dict]:
+            return [i async for i in item_repo.iter_items(project_id, folder_id)]
+
+        items = await gather_bounded(
+            (_list_items(folder.id) for folder in folders),
+            max_concurrency or session.MAX_COROUTINE_COUNT,
+        )
+        return cls(
+            project.to_json(),
+            [i.to_json() for i in folders],
+            [i.to_json() for i in classes],
+            {folder.id: folder_items for folder, folder_items in zip(folders, items)},
+        )
+
+    def __len__(self):
+        return sum(len(i) for i in self._items.values())
+
+    def folder(self, pk: Union[str, int]) -> dict:
+        folder = (
+            self._folders_by_name.get(pk)
+            if isinstance(pk, str)
+            else self._folders_by_id.get(pk)
+        )
+        if folder is None:
+            raise SAInvalidInput("Folder not found.")
+        return folder
+
+    def items(self, folder: Union[str, int] = None) -> List[dict]:
+        """
+        :param folder: folder name or id, all the project items by default.
+        """
+        if folder is None:
+            return [item for items in self._items.values() for item in items]
+        return self._items[self.folder(folder)["id"]]
+
+    @staticmethod
+    def _count(items: Iterable[dict], key: str, enum: Type[IntEnum]) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for value, count in Counter(item.get(key) for item in items).items():
+            try:
+                name = enum(value).name if value is not None else str(value)
+            except ValueError:
+                name = str(value)
+            counts[name] = counts.get(name, 0) + count
+        return counts
+
+    def status_counts(self, folder: Union[str, int] = None) -> Dict[str, int]:
+        """
+        Returns the item counts by annotation status name.
+        """
+        return self._count(self.items(folder), "annotation_status", AnnotationStatus)
+
+    def approval_counts(self, folder: Union[str, int] = None) -> Dict[str, int]:
+        return self._count(self.items(folder), "approval_status", ApprovalStatus)
+
+    def save(self, path: str):
+        """
+        Writes the snapshot as gzipped JSON with the items stored column by column,
+        fields missing from an item are loaded back as None.
+        """
+        folder_ids = [i for i, items in self._items.items() for _ in items]
+        rows = self.items()
+        columns = list(dict.fromkeys(key for item in rows for key in item))
+        payload = {
+            "version": self.VERSION,
+            "created_at": self.created_at,
+            "project": self.project,
+            "folders": self.folders,
+            "classes": self.classes,
+            "items": {
+                "folder_id": folder_ids,
+                "columns": {key: [item.get(key) for item in rows] for key in columns},
+            },
+        }
+        data = gzip.compress(
+            get_json_codec().dumps(payload), compresslevel=GZIP_COMPRESSION_LEVEL
+        )
+        with open(path, "wb") as file:
+            file.write(self.MAGIC)
+            file.write(data)
+
+    @classmethod
+    def load(cls, path: str) -> "ProjectSnapshot":
+        with open(path, "rb") as file:
+            data = file.read()
+        if not data.startswith(cls.MAGIC):
+            raise SAInvalidInput("Not a project snapshot file.")
+        payload = get_json_codec().loads(gzip.decompress(data[len(cls.MAGIC) :]))
+        if payload.get("version") != cls.VERSION:
+            raise SAInvalidInput(
+                f"Unsupported project snapshot version {payload.get('version')}."
+            )
+        columns: Dict[str, list] = payload["items"]["columns"]
+        items: Dict[int, List[dict]] = {}
+        for index, folder_id in enumerate(payload["items"]["folder_id"]):
+            items.setdefault(folder_id, []).append(
+                {key: values[index] for key, values in columns.items()}
+            )
+        return cls(
+            payload["project"],
+            payload["folders"],
+            payload["classes"],
+            items,
+            created_at=payload["created_at"],
+        )
+
+    def summary(self) -> Dict[str, dict]:
+        """
+        Returns the item and annotation status counts of each folder, keyed by folder name.
+        """
+        return {
+            folder["name"]: {
+                "items": len(self._items[folder["id"]]),
+                "annotation_statuses": self.status_counts(folder["id"]),
+            }
+            for folder in self.folders
+        }
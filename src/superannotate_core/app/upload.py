@@ -0,0 +1,168 @@
+import asyncio
+import io
+import logging
+import os
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import aiohttp
+from superannotate_core.infrastructure.repositories import AnnotationRepository
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.session import Session
+from typing_extensions import TypedDict
+
+logger = logging.getLogger(__name__)
+
+AnnotationSource = Union[dict, str, os.PathLike]
+
+
+class UploadResult(TypedDict):
+    name: str
+    uploaded: bool
+    error: Optional[str]
+
+
+class AnnotationUploader:
+    """
+    Uploads annotations to a folder concurrently through the shared aiohttp session.
+    Annotations up to LARGE_THRESHOLD bytes are batched into multipart requests of at most
+    BATCH_SIZE annotations and BATCH_BYTES bytes, larger ones are streamed one per request.
+    At most `max_concurrency` requests are in flight, the annotations are read as requests free up.
+    """
+
+    LARGE_THRESHOLD = 15 * 1024 * 1024
+    BATCH_SIZE = 100
+    BATCH_BYTES = 10 * 1024 * 1024
+
+    def __init__(
+        self,
+        session: Session,
+        project_id: int,
+        folder_id: int,
+        max_concurrency: int = None,
+    ):
+        self._session = session
+        self._project_id = project_id
+        self._folder_id = folder_id
+        self._max_concurrency = max_concurrency or session.MAX_COROUTINE_COUNT
+        self._annotation_repo = AnnotationRepository(session)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: List[asyncio.Future] = []
+        self._results: List[Tuple[int, UploadResult]] = []
+        # listed once, by the first large annotation needing an item id
+        self._item_ids: Optional["asyncio.Future[Dict[str, int]]"] = None
+
+    @staticmethod
+    def _name(annotation: AnnotationSource) -> str:
+        if isinstance(annotation, dict):
+            return annotation["metadata"]["name"]
+        name = os.path.basename(os.fspath(annotation))
+        if name.endswith(".json"):
+            name = name[: -len(".json")]
+        return name
+
+    def _read(self, annotation: AnnotationSource) -> Tuple[str, Union[bytes, str], int]:
+        """
+        Returns the item name, the encoded annotation or its file path and the encoded size.
+        """
+        name = self._name(annotation)
+        if isinstance(annotation, dict):
+            data = self._session.json_codec.dumps(annotation)
+            return name, data, len(data)
+        path = os.fspath(annotation)
+        return name, path, os.path.getsize(path)
+
+    def _done(self, index: int, name: str, error: str = None):
+        if error:
+            logger.warning("Failed to upload the annotation of %s: %s", name, error)
+        self._results.append(
+            (index, UploadResult(name=name, uploaded=error is None, error=error))
+        )
+
+    async def _submit(self, coroutine):
+        await self._semaphore.acquire()
+        task = asyncio.ensure_future(coroutine)
+        task.add_done_callback(lambda _: self._semaphore.release())
+        self._tasks.append(task)
+
+    async def _upload_small(self, batch: List[Tuple[int, str, bytes]]):
+        try:
+            response = await self._annotation_repo.upload_annotations(
+                self._project_id, self._folder_id, [(n, d) for _, n, d in batch]
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            for index, name, _ in batch:
+                self._done(index, name, str(e) or type(e).__name__)
+            return
+        failed = set(response["failed_items"])
+        for index, name, _ in batch:
+            self._done(
+                index, name, "Rejected by the server." if name in failed else None
+            )
+
+    async def _list_item_ids(self) -> Dict[str, int]:
+        return {
+            item["name"]: item["id"]
+            async for item in AsyncItemRepository(self._session).iter_items(
+                self._project_id, self._folder_id
+            )
+        }
+
+    async def _get_item_id(self, name: str) -> Optional[int]:
+        if self._item_ids is None:
+            self._item_ids = asyncio.ensure_future(self._list_item_ids())
+        return (await self._item_ids).get(name)
+
+    async def _upload_large(self, index: int, name: str, data: Union[bytes, str]):
+        try:
+            item_id = await self._get_item_id(name)
+            if item_id is None:
+                self._done(index, name, "Item not found.")
+                return
+            file = open(data, "rb") if isinstance(data, str) else io.BytesIO(data)
+            with file:
+                await self._annotation_repo.upload_large_annotation(
+                    self._project_id, self._folder_id, item_id, file
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            self._done(index, name, str(e) or type(e).__name__)
+            return
+        self._done(index, name)
+
+    async def arun(self, annotations: Iterable[AnnotationSource]) -> List[UploadResult]:
+        """
+        :param annotations: annotation dicts or paths of <item name>.json annotation files.
+        :return: the result of every annotation, in the order of `annotations`.
+        """
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        batch: List[Tuple[int, str, bytes]] = []
+        batch_bytes = 0
+        for index, annotation in enumerate(annotations):
+            try:
+                name, data, size = self._read(annotation)
+                content = data
+                if size <= self.LARGE_THRESHOLD and isinstance(data, str):
+                    with open(data, "rb") as file:
+                        content = file.read()
+            except KeyError:
+                self._done(index, "", "The annotation has no metadata.name.")
+                continue
+            except OSError as e:
+                self._done(index, self._name(annotation), str(e) or type(e).__name__)
+                continue
+            if isinstance(content, str) or size > self.LARGE_THRESHOLD:
+                await self._submit(self._upload_large(index, name, content))
+                continue
+            batch.append((index, name, content))
+            batch_bytes += size
+            if len(batch) >= self.BATCH_SIZE or batch_bytes >= self.BATCH_BYTES:
+                await self._submit(self._upload_small(batch))
+                batch, batch_bytes = [], 0
+        if batch:
+            await self._submit(self._upload_small(batch))
+        await asyncio.gather(*self._tasks)
+        return [result for _, result in sorted(self._results, key=lambda i: i[0])]
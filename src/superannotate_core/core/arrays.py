@@ -0,0 +1,215 @@
+import itertools
+from array import array
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Optional
+
+from superannotate_core.core.enums import AnnotationTypes
+
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+
+def _require_numpy():
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required to convert annotations to arrays.")
+
+
+class _Geometries:
+    """
+    Variable length geometries as a flat (x, y) coordinate buffer,
+    the points of the i-th geometry are coordinates[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self):
+        self.coordinates = array("f")
+        self.offsets = array("q", [0])
+        self.class_ids = array("i")
+        self.items = array("i")
+
+    def add(self, points: List[float], class_id: int, item: int):
+        self.coordinates.extend(points[: len(points) // 2 * 2])
+        self.offsets.append(len(self.coordinates) // 2)
+        self.class_ids.append(class_id)
+        self.items.append(item)
+
+    def to_numpy(self) -> "GeometryArrays":
+        return GeometryArrays(
+            coordinates=numpy.frombuffer(self.coordinates, dtype=numpy.float32).reshape(
+                -1, 2
+            ),
+            offsets=numpy.frombuffer(self.offsets, dtype=numpy.int64),
+            class_ids=numpy.frombuffer(self.class_ids, dtype=numpy.int32),
+            items=numpy.frombuffer(self.items, dtype=numpy.int32),
+        )
+
+
+class GeometryArrays:
+    """
+    :param coordinates: (P, 2) float32 points of all geometries.
+    :param offsets: (N + 1,) int64, the geometry i spans coordinates[offsets[i]:offsets[i + 1]].
+    :param class_ids: (N,) int32 class ids.
+    :param items: (N,) int32 indexes of the annotations in AnnotationArrays.names.
+    """
+
+    def __init__(self, coordinates, offsets, class_ids, items):
+        self.coordinates = coordinates
+        self.offsets = offsets
+        self.class_ids = class_ids
+        self.items = items
+
+    def __len__(self):
+        return len(self.class_ids)
+
+    def __getitem__(self, index: int):
+        return self.coordinates[self.offsets[index] : self.offsets[index + 1]]
+
+    @classmethod
+    def concatenate(cls, parts: List["GeometryArrays"], shifts: List[int]):
+        offsets = [numpy.zeros(1, dtype=numpy.int64)]
+        points = 0
+        for part in parts:
+            offsets.append(part.offsets[1:] + points)
+            points += len(part.coordinates)
+        return cls(
+            coordinates=numpy.concatenate([i.coordinates for i in parts]),
+            offsets=numpy.concatenate(offsets),
+            class_ids=numpy.concatenate([i.class_ids for i in parts]),
+            items=numpy.concatenate([i.items + j for i, j in zip(parts, shifts)]),
+        )
+
+
+class BoxArrays:
+    """
+    :param boxes: (N, 4) float32 x1, y1, x2, y2.
+    :param class_ids: (N,) int32 class ids.
+    :param items: (N,) int32 indexes of the annotations in AnnotationArrays.names.
+    """
+
+    def __init__(self, boxes, class_ids, items):
+        self.boxes = boxes
+        self.class_ids = class_ids
+        self.items = items
+
+    def __len__(self):
+        return len(self.class_ids)
+
+    @classmethod
+    def concatenate(cls, parts: List["BoxArrays"], shifts: List[int]):
+        return cls(
+            boxes=numpy.concatenate([i.boxes for i in parts]),
+            class_ids=numpy.concatenate([i.class_ids for i in parts]),
+            items=numpy.concatenate([i.items + j for i, j in zip(parts, shifts)]),
+        )
+
+
+class AnnotationArrays:
+    """
+    Vector annotation instances as numpy arrays grouped by instance type.
+    Points are the (N, 2) coordinates of a GeometryArrays with one point per geometry.
+    Instances of other types and instances without a classId are skipped.
+    The arrays are built once from flat buffers and share their memory,
+    concatenate copies them into arrays spanning all the parts.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        bboxes: BoxArrays,
+        polygons: GeometryArrays,
+        polylines: GeometryArrays,
+        points: GeometryArrays,
+    ):
+        self.names = names
+        self.bboxes = bboxes
+        self.polygons = polygons
+        self.polylines = polylines
+        self.points = points
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def _groups(self):
+        return self.bboxes, self.polygons, self.polylines, self.points
+
+    @classmethod
+    def from_annotation(
+        cls,
+        annotation: dict,
+        annotation_filter: Callable[[dict], Optional[dict]] = None,
+    ) -> "AnnotationArrays":
+        """
+        Arrays of a single annotation, the annotation is skipped if `annotation_filter` drops it.
+        """
+        filtered = annotation_filter(annotation) if annotation_filter else annotation
+        return cls.from_annotations([filtered] if filtered is not None else [])
+
+    @classmethod
+    def concatenate(cls, parts: List["AnnotationArrays"]) -> "AnnotationArrays":
+        _require_numpy()
+        if not parts:
+            return cls.from_annotations([])
+        shifts = list(itertools.accumulate([0] + [len(i.names) for i in parts[:-1]]))
+        return cls(
+            names=[name for part in parts for name in part.names],
+            bboxes=BoxArrays.concatenate([i.bboxes for i in parts], shifts),
+            polygons=GeometryArrays.concatenate([i.polygons for i in parts], shifts),
+            polylines=GeometryArrays.concatenate([i.polylines for i in parts], shifts),
+            points=GeometryArrays.concatenate([i.points for i in parts], shifts),
+        )
+
+    def reorder(self, indexes: List[int]):
+        """
+        Reorders the annotations, the annotation at indexes[i] becomes the i-th.
+        """
+        positions = numpy.empty(len(indexes), dtype=numpy.int32)
+        positions[numpy.asarray(indexes, dtype=numpy.int64)] = numpy.arange(
+            len(indexes), dtype=numpy.int32
+        )
+        self.names = [self.names[i] for i in indexes]
+        for group in self._groups:
+            group.items = positions[group.items]
+
+    @classmethod
+    def from_annotations(cls, annotations: Iterable[dict]) -> "AnnotationArrays":
+        _require_numpy()
+        names = []
+        boxes, box_class_ids, box_items = array("f"), array("i"), array("i")
+        polygons, polylines, points = _Geometries(), _Geometries(), _Geometries()
+        for item, annotation in enumerate(annotations):
+            names.append(annotation["metadata"]["name"])
+            for instance in annotation.get("instances", []):
+                class_id = instance.get("classId")
+                if class_id is None:
+                    continue
+                _type = instance.get("type")
+                if _type == AnnotationTypes.BBOX:
+                    _points = instance["points"]
+                    boxes.extend(
+                        (_points["x1"], _points["y1"], _points["x2"], _points["y2"])
+                    )
+                    box_class_ids.append(class_id)
+                    box_items.append(item)
+                elif _type == AnnotationTypes.POLYGON:
+                    polygons.add(instance["points"], class_id, item)
+                elif _type == AnnotationTypes.POLYLINE:
+                    polylines.add(instance["points"], class_id, item)
+                elif _type == AnnotationTypes.POINT:
+                    points.add([instance["x"], instance["y"]], class_id, item)
+        return cls(
+            names=names,
+            bboxes=BoxArrays(
+                boxes=numpy.frombuffer(boxes, dtype=numpy.float32).reshape(-1, 4),
+                class_ids=numpy.frombuffer(box_class_ids, dtype=numpy.int32),
+                items=numpy.frombuffer(box_items, dtype=numpy.int32),
+            ),
+            polygons=polygons.to_numpy(),
+            polylines=polylines.to_numpy(),
+            points=points.to_numpy(),
+        )
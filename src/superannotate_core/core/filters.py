@@ -0,0 +1,85 @@
+from enum import Enum
+from typing import FrozenSet
+from typing import Iterable
+from typing import Optional
+from typing import Union
+
+from superannotate_core.core.enums import AnnotationTypes
+from superannotate_core.core.exceptions import SAInvalidInput
+
+
+def _as_set(values: Optional[Iterable]) -> Optional[FrozenSet]:
+    if values is None:
+        return None
+    if isinstance(values, (str, Enum)):
+        values = [values]
+    return frozenset(i.value if isinstance(i, Enum) else i for i in values)
+
+
+class AnnotationFilter:
+    """
+    Declarative instance filter and projection applied to each annotation as soon as it is decoded.
+
+    :param classes: keep only the instances of these class names.
+    :param types: keep only the instances of these types, see AnnotationTypes.
+    :param instance_fields: keep only these instance keys.
+    :param exclude_instance_fields: drop these instance keys, e.g. "attributes".
+    :param fields: keep only these top level annotation keys, "metadata" is always kept.
+    :param drop_empty: drop the annotations left without instances.
+    """
+
+    def __init__(
+        self,
+        *,
+        classes: Iterable[str] = None,
+        types: Iterable[Union[str, AnnotationTypes]] = None,
+        instance_fields: Iterable[str] = None,
+        exclude_instance_fields: Iterable[str] = None,
+        fields: Iterable[str] = None,
+        drop_empty: bool = False,
+    ):
+        if instance_fields is not None and exclude_instance_fields is not None:
+            raise SAInvalidInput(
+                "Only one of instance_fields and exclude_instance_fields can be set."
+            )
+        self.classes = _as_set(classes)
+        self.types = _as_set(types)
+        self.instance_fields = _as_set(instance_fields)
+        self.exclude_instance_fields = _as_set(exclude_instance_fields)
+        self.fields = _as_set(fields)
+        if self.fields is not None:
+            self.fields |= {"metadata"}
+        self.drop_empty = drop_empty
+
+    def _keep(self, instance: dict) -> bool:
+        if self.classes is not None and instance.get("className") not in self.classes:
+            return False
+        if self.types is not None and instance.get("type") not in self.types:
+            return False
+        return True
+
+    def _project(self, instance: dict) -> dict:
+        if self.instance_fields is not None:
+            return {k: v for k, v in instance.items() if k in self.instance_fields}
+        if self.exclude_instance_fields is not None:
+            return {
+                k: v
+                for k, v in instance.items()
+                if k not in self.exclude_instance_fields
+            }
+        return instance
+
+    def __call__(self, annotation: dict) -> Optional[dict]:
+        """
+        Returns the filtered annotation, or None if it is dropped.
+        """
+        if self.fields is not None:
+            annotation = {k: v for k, v in annotation.items() if k in self.fields}
+        instances = annotation.get("instances")
+        if instances is not None:
+            annotation["instances"] = [
+                self._project(i) for i in instances if self._keep(i)
+            ]
+            if self.drop_empty and not annotation["instances"]:
+                return None
+        return annotation
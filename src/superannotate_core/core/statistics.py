@@ -0,0 +1,146 @@
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Sequence
+
+from superannotate_core.core.enums import AnnotationTypes
+from superannotate_core.core.exceptions import SAInvalidInput
+from typing_extensions import TypedDict
+
+try:
+    import numpy
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+# bbox area bin edges in square pixels, from 1 to 2^24
+DEFAULT_AREA_BINS = tuple(4**i for i in range(13))
+
+
+class AreaHistogram(TypedDict):
+    bins: List[float]
+    counts: List[int]
+    total: float
+
+
+class AnnotationStatisticsReport(TypedDict):
+    annotations: int
+    instances: int
+    classes: Dict[str, int]
+    types: Dict[str, int]
+    annotators: Dict[str, int]
+    statuses: Dict[str, int]
+    bbox_area: AreaHistogram
+
+
+class AnnotationStatistics:
+    """
+    Incremental annotation statistics, annotations are counted as they are added and not kept.
+    Bbox areas are buffered and binned in batches of BATCH_SIZE, with numpy when it is installed.
+    Statistics of different folders or workers are combined with merge.
+
+    :param area_bins: increasing bbox area bin edges, counts[i] is the number of areas in
+     [bins[i], bins[i + 1]), the last bin is unbounded and smaller areas are counted in the first one.
+    """
+
+    BATCH_SIZE = 8192
+
+    def __init__(self, area_bins: Sequence[float] = DEFAULT_AREA_BINS):
+        if list(area_bins) != sorted(set(area_bins)) or not area_bins:
+            raise SAInvalidInput("The area bins should be increasing.")
+        self.area_bins = tuple(area_bins)
+        self.annotations = 0
+        self.instances = 0
+        self.classes: Counter = Counter()
+        self.types: Counter = Counter()
+        self.annotators: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self._area_counts = [0] * len(self.area_bins)
+        self._area_total = 0.0
+        self._areas = array("d")
+
+    @staticmethod
+    def _count(counter: Counter, key):
+        if key is not None:
+            counter[key] += 1
+
+    def add(self, annotation: dict):
+        """
+        The fields an annotation lacks, e.g. after an instance_fields projection, are not counted.
+        """
+        self.annotations += 1
+        self._count(self.statuses, annotation["metadata"].get("status"))
+        instances = annotation.get("instances") or []
+        self.instances += len(instances)
+        for instance in instances:
+            self._count(self.classes, instance.get("className"))
+            self._count(self.types, instance.get("type"))
+            self._count(self.annotators, (instance.get("createdBy") or {}).get("email"))
+            points = instance.get("points")
+            if points and instance.get("type") == AnnotationTypes.BBOX:
+                self._areas.append(
+                    abs(points["x2"] - points["x1"]) * abs(points["y2"] - points["y1"])
+                )
+        if len(self._areas) >= self.BATCH_SIZE:
+            self._flush()
+
+    def update(self, annotations: Iterable[dict]):
+        for annotation in annotations:
+            self.add(annotation)
+
+    def _flush(self):
+        if not self._areas:
+            return
+        if HAS_NUMPY:
+            areas = numpy.frombuffer(self._areas, dtype=numpy.float64)
+            indexes = numpy.searchsorted(self.area_bins, areas, side="right") - 1
+            counts = numpy.bincount(
+                numpy.maximum(indexes, 0), minlength=len(self.area_bins)
+            )
+            self._area_total += float(areas.sum())
+            self._area_counts = [i + int(j) for i, j in zip(self._area_counts, counts)]
+        else:
+            for area in self._areas:
+                self._area_counts[max(bisect_right(self.area_bins, area) - 1, 0)] += 1
+            self._area_total += sum(self._areas)
+        self._areas = array("d")
+
+    def merge(self, other: "AnnotationStatistics") -> "AnnotationStatistics":
+        """
+        Adds the statistics of `other` to these ones.
+        """
+        if other.area_bins != self.area_bins:
+            raise SAInvalidInput("Statistics with different area bins can't be merged.")
+        self._flush()
+        other._flush()
+        self.annotations += other.annotations
+        self.instances += other.instances
+        self.classes.update(other.classes)
+        self.types.update(other.types)
+        self.annotators.update(other.annotators)
+        self.statuses.update(other.statuses)
+        self._area_counts = [
+            i + j for i, j in zip(self._area_counts, other._area_counts)
+        ]
+        self._area_total += other._area_total
+        return self
+
+    def to_json(self) -> AnnotationStatisticsReport:
+        self._flush()
+        return AnnotationStatisticsReport(
+            annotations=self.annotations,
+            instances=self.instances,
+            classes=dict(self.classes),
+            types=dict(self.types),
+            annotators=dict(self.annotators),
+            statuses=dict(self.statuses),
+            bbox_area=AreaHistogram(
+                bins=list(self.area_bins),
+                counts=list(self._area_counts),
+                total=self._area_total,
+            ),
+        )
@@ -2,3 +2,27 @@ def chunkify(lst, n):
     """Divide the list `lst` into chunks of size `n`."""
     for i in range(0, len(lst), n):
         yield lst[i : i + n]
+
+
+def chunkify_iter(iterable, n):
+    """Divide the iterable `iterable` into lists of size `n` without materializing it."""
+    chunk = []
+    for i in iterable:
+        chunk.append(i)
+        if len(chunk) == n:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def achunkify_iter(aiterable, n):
+    """Divide the async iterable `aiterable` into lists of size `n` without materializing it."""
+    chunk = []
+    async for i in aiterable:
+        chunk.append(i)
+        if len(chunk) == n:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
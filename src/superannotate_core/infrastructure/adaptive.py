@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+
+class AdaptiveSettings:
+    """
+    Enables the adaptive chunk sizes and concurrency of a session.
+
+    :param target_latency: seconds a request may take before the window shrinks.
+    :param max_payload: response bytes a request may carry before the window shrinks.
+    :param decrease: factor applied to a window on an error, a slow or an oversized request.
+    :param limits: (minimum, maximum) of the named windows, overriding the defaults of the repositories.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2.0,
+        max_payload: Optional[int] = None,
+        decrease: float = 0.5,
+        limits: Dict[str, Tuple[int, int]] = None,
+    ):
+        self.target_latency = target_latency
+        self.max_payload = max_payload
+        self.decrease = decrease
+        self.limits = limits or {}
+
+
+class AdaptiveWindow:
+    """
+    AIMD window sizing the chunks or the concurrency of an endpoint.
+    The value grows by `increase` after every request meeting the settings' targets and is multiplied
+    by the decrease factor, at most once per target latency, after an error, a slow or an oversized request.
+    Without settings the value stays at `initial`.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        settings: AdaptiveSettings = None,
+        increase: int = None,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.settings = settings
+        self.increase = increase or max(maximum // 20, 1)
+        self.errors = 0
+        self.requests = 0
+        self._value = float(min(max(initial, minimum), maximum))
+        self._decreased = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return int(self._value)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def record(self, latency: float, error: bool = False, size: int = None):
+        """
+        :param latency: seconds the request took.
+        :param size: response bytes of the request.
+        """
+        if self.settings is None:
+            return
+        with self._lock:
+            self.requests += 1
+            self.errors += error
+            settings = self.settings
+            if (
+                error
+                or latency > settings.target_latency
+                or (settings.max_payload and size and size > settings.max_payload)
+            ):
+                now = time.monotonic()
+                if now - self._decreased >= settings.target_latency:
+                    self._decreased = now
+                    self._value = max(self._value * settings.decrease, self.minimum)
+            else:
+                self._value = min(self._value + self.increase, self.maximum)
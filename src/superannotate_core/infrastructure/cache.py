@@ -0,0 +1,56 @@
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe mapping whose entries expire `ttl` seconds after they were set.
+    Compound updates should hold `lock`.
+    """
+
+    def __init__(self, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.lock = threading.RLock()
+        self._timer = timer
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < self._timer():
+                del self._data[key]
+                return default
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self.lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        with self.lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """
+        Returns the entries that have not expired yet.
+        """
+        now = self._timer()
+        with self.lock:
+            return [(k, v) for k, (expires, v) in self._data.items() if expires >= now]
+
+    def clear(self):
+        with self.lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self.items())
@@ -0,0 +1,102 @@
+import json
+from abc import ABC
+from abc import abstractmethod
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Type
+from typing import Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+try:
+    import ujson
+
+    HAS_UJSON = True
+except ImportError:  # pragma: no cover
+    HAS_UJSON = False
+
+
+class JSONCodec(ABC):
+    """
+    Encodes request payloads to bytes and decodes response payloads from bytes.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        raise NotImplementedError
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonCodec(JSONCodec):
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+    StdlibJSONCodec.name: StdlibJSONCodec,
+}
+
+_AVAILABLE = {
+    OrjsonCodec.name: HAS_ORJSON,
+    UjsonCodec.name: HAS_UJSON,
+    StdlibJSONCodec.name: True,
+}
+
+
+def get_json_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    Returns the codec registered under `name`, or the fastest installed one
+    (orjson, then ujson, then the standard library).
+    """
+    if name:
+        if name not in CODECS:
+            raise ValueError(f"Unknown JSON codec {name}.")
+        if not _AVAILABLE[name]:
+            raise ImportError(f"JSON codec {name} is not installed.")
+        return CODECS[name]()
+    for codec_name, codec_class in CODECS.items():
+        if _AVAILABLE[codec_name]:
+            return codec_class()
+    return StdlibJSONCodec()
@@ -0,0 +1,97 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Optional
+
+import aiohttp
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.codecs import JSONCodec
+
+
+def _decode_file(path: str, codec_name: str, transform: Callable = None) -> Any:
+    with open(path, "rb") as file:
+        data = get_json_codec(codec_name).loads(file.read())
+    return transform(data) if transform else data
+
+
+class ProcessDecoder:
+    """
+    Decodes JSON response bodies of at least `threshold` bytes in a pool of at most `max_workers` processes,
+    so parsing large annotations doesn't hold the event loop and the GIL.
+    Such bodies are spooled to a temporary file the worker reads, smaller ones are decoded in place.
+
+    The decoded object comes back pickled and rebuilding a large object graph costs about as much
+    as parsing it, pass a `transform` reducing it to a compact value, e.g. AnnotationArrays.from_annotation,
+    to keep that cost in the worker too.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self, threshold: int, max_workers: int = 2, json_codec: JSONCodec = None
+    ):
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self._json_codec = json_codec if json_codec else get_json_codec()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # forking a process running an event loop and threads is unsafe
+                self._executor = ProcessPoolExecutor(
+                    self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _decode(self, data: bytes, transform: Callable = None) -> Any:
+        data = self._json_codec.loads(data)
+        return transform(data) if transform else data
+
+    async def decode_response(
+        self, response: aiohttp.ClientResponse, transform: Callable = None
+    ) -> Any:
+        """
+        :param transform: picklable function applied to the decoded body, in the worker for large bodies.
+        """
+        if (
+            response.content_length is not None
+            and response.content_length < self.threshold
+        ):
+            return self._decode(await response.read(), transform)
+        buffer = bytearray()
+        file = None
+        try:
+            async for chunk in response.content.iter_chunked(self.CHUNK_SIZE):
+                if file is not None:
+                    file.write(chunk)
+                    continue
+                buffer += chunk
+                if len(buffer) >= self.threshold:
+                    file = tempfile.NamedTemporaryFile(
+                        prefix="sa_decode_", suffix=".json", delete=False
+                    )
+                    file.write(buffer)
+                    buffer = bytearray()
+            if file is None:
+                return self._decode(bytes(buffer), transform)
+            file.close()
+            return await asyncio.get_running_loop().run_in_executor(
+                self._pool(), _decode_file, file.name, self._json_codec.name, transform
+            )
+        finally:
+            if file is not None:
+                file.close()
+                os.remove(file.name)
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+from superannotate_core.infrastructure.instrumentation import Instrumentation
+from superannotate_core.infrastructure.instrumentation import REQUEST_HEDGED
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """
+    Enables hedged requests for the idempotent reads of a session.
+
+    :param percentile: latency percentile of an endpoint after which an unanswered read is sent again.
+    :param budget: hedges earned by every hedgeable request, at most this share of the requests is duplicated.
+    :param burst: maximum of hedges earned and not spent yet.
+    :param min_samples: latencies an endpoint needs before its reads are hedged.
+    :param samples: number of latest latencies of an endpoint the percentile is computed from.
+    :param min_delay: lower bound of the hedge delay in seconds.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        burst: int = 10,
+        min_samples: int = 20,
+        samples: int = 200,
+        min_delay: float = 0.005,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.min_samples = min_samples
+        self.samples = samples
+        self.min_delay = min_delay
+
+
+class Hedger:
+    """
+    Sends the hedged reads of a session. A read still unanswered after the policy's latency percentile
+    of its endpoint is sent again if the budget allows, the first successful response is used
+    and the other request is cancelled, or discarded once done when it can't be interrupted.
+    Without a policy requests are sent once.
+    """
+
+    def __init__(
+        self,
+        policy: HedgingPolicy = None,
+        max_workers: int = 16,
+        instrumentation: Instrumentation = None,
+    ):
+        # a disabled hedger keeps the default policy, so the policy is never None
+        self.enabled = policy is not None
+        self.policy = policy if policy else HedgingPolicy()
+        self.max_workers = max_workers
+        self.instrumentation = instrumentation if instrumentation else Instrumentation()
+        self.hedges = 0
+        self.wins = 0
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = float(self.policy.burst)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def delay(self, endpoint: str) -> Optional[float]:
+        """
+        Returns the hedge delay of the endpoint, None while it has too few latencies.
+        """
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if not latencies or len(latencies) < self.policy.min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = min(int(len(ordered) * self.policy.percentile), len(ordered) - 1)
+        return max(ordered[index], self.policy.min_delay)
+
+    def record(self, endpoint: str, latency: float):
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(
+                    maxlen=self.policy.samples
+                )
+            latencies.append(latency)
+
+    def _earn(self) -> bool:
+        """
+        Adds the budget share of a request and returns whether a hedge can be spent.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens + self.policy.budget, self.policy.burst)
+            return self._tokens >= 1
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges += 1
+            return True
+
+    def _report(self, endpoint: str, won: bool):
+        with self._lock:
+            self.wins += won
+        self.instrumentation.emit(REQUEST_HEDGED, 1, endpoint=endpoint, won=won)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="sa_hedge"
+                )
+            return self._executor
+
+    def send(
+        self, endpoint: str, send: Callable[[], T], discard: Callable[[T], None]
+    ) -> T:
+        """
+        Calls `send` hedged. Hedges run in a thread pool, a running call can't be interrupted
+        and `discard` is applied to the result of the losing one.
+        """
+        if not self.enabled:
+            return send()
+        start = time.perf_counter()
+        delay = self.delay(endpoint)
+        if not self._earn() or delay is None:
+            result = send()
+            self.record(endpoint, time.perf_counter() - start)
+            return result
+        futures: List[Future] = [self._pool().submit(send)]
+        winner = None
+        try:
+            done, _ = wait(futures, timeout=delay)
+            if not done and self._spend():
+                futures.append(self._pool().submit(send))
+            while winner is None:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                winner = next(
+                    (i for i in futures if i in done and not i.exception()), None
+                )
+                if len(done) == len(futures):
+                    break
+        finally:
+            for future in futures:
+                if future is not winner:
+                    future.cancel()
+                    future.add_done_callback(lambda i: self._discard(i, discard))
+        if winner is None:
+            return futures[0].result()
+        self.record(endpoint, time.perf_counter() - start)
+        if len(futures) > 1:
+            self._report(endpoint, winner is futures[1])
+        return winner.result()
+
+    @staticmethod
+    def _discard(future, discard: Callable):
+        if not future.cancelled() and future.exception() is None:
+            discard(future.result())
+
+    async def asend(
+        self,
+        endpoint: str,
+        send: Callable[[], Awaitable[T]],
+        discard: Callable[[T], None],
+    ) -> T:
+        """
+        Awaits `send()` hedged, the losing request is cancelled and `discard` is applied
+        to its result if it completed first.
+        """
+        if not self.enabled:
+            return await send()
+        start = time.perf_counter()
+        delay = self.delay(endpoint)
+        if not self._earn() or delay is None:
+            result = await send()
+            self.record(endpoint, time.perf_counter() - start)
+            return result
+        tasks = [asyncio.ensure_future(send())]
+        winner = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and self._spend():
+                tasks.append(asyncio.ensure_future(send()))
+            while winner is None:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                winner = next(
+                    (i for i in tasks if i in done and not i.exception()), None
+                )
+                if len(done) == len(tasks):
+                    break
+        finally:
+            for task in tasks:
+                if task is not winner:
+                    task.cancel()
+                    task.add_done_callback(lambda i: self._discard(i, discard))
+        if winner is None:
+            return tasks[0].result()
+        self.record(endpoint, time.perf_counter() - start)
+        if len(tasks) > 1:
+            self._report(endpoint, winner is tasks[1])
+        return winner.result()
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
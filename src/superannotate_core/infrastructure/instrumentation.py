@@ -0,0 +1,258 @@
+import bisect
+import functools
+import inspect
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import TextIO
+from typing import Tuple
+from urllib.parse import urlparse
+
+from typing_extensions import TypedDict
+
+REQUEST_DURATION = "http.request.duration"
+REQUEST_RETRIES = "http.request.retries"
+REQUEST_HEDGED = "http.request.hedged"
+REQUEST_BYTES_OUT = "http.request.bytes_out"
+REQUEST_BYTES_IN = "http.request.bytes_in"
+PAGINATE_PAGES = "http.paginate.pages"
+PAGINATE_ITEMS = "http.paginate.items"
+STREAM_DURATION = "annotations.stream.duration"
+STREAM_BYTES_IN = "annotations.stream.bytes_in"
+STREAM_DECODE_DURATION = "annotations.stream.decode_duration"
+STREAM_ANNOTATIONS = "annotations.stream.count"
+ENTITY_DECODE_DURATION = "entity.decode.duration"
+ENTITY_DECODE_COUNT = "entity.decode.count"
+REPOSITORY_CALL_DURATION = "repository.call.duration"
+
+_ID_PATTERN = re.compile(r"/\d+(?=/|$)")
+
+
+class Event(NamedTuple):
+    name: str
+    value: float
+    tags: Dict[str, str]
+
+
+Hook = Callable[[Event], None]
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Reduces a request url to its path with numeric ids replaced by a placeholder,
+    so that requests to the same endpoint share one metric series.
+    """
+    return _ID_PATTERN.sub("/{id}", urlparse(str(url)).path)
+
+
+class Instrumentation:
+    """
+    Dispatches metric events to the registered hooks. Without hooks emitting is a no-op.
+    """
+
+    def __init__(self, hooks: List[Hook] = None):
+        self._hooks: List[Hook] = list(hooks) if hooks else []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._hooks)
+
+    def add_hook(self, hook: Hook):
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Hook):
+        self._hooks.remove(hook)
+
+    def emit(self, name: str, value: float, **tags):
+        if not self._hooks:
+            return
+        event = Event(name, value, {k: str(v) for k, v in tags.items()})
+        for hook in self._hooks:
+            hook(event)
+
+    @contextmanager
+    def timer(self, name: str, **tags):
+        start = time.perf_counter()
+        try:
+            yield tags
+        finally:
+            self.emit(name, time.perf_counter() - start, **tags)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Reports the duration of a repository method to the session instrumentation.
+    """
+    metric_name = method.__qualname__
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            instrumentation: Instrumentation = self._session.instrumentation
+            if not instrumentation.enabled:
+                return await method(self, *args, **kwargs)
+            with instrumentation.timer(
+                REPOSITORY_CALL_DURATION, method=metric_name, error=False
+            ) as tags:
+                try:
+                    return await method(self, *args, **kwargs)
+                except BaseException:
+                    tags["error"] = True
+                    raise
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        instrumentation: Instrumentation = self._session.instrumentation
+        if not instrumentation.enabled:
+            return method(self, *args, **kwargs)
+        with instrumentation.timer(
+            REPOSITORY_CALL_DURATION, method=metric_name, error=False
+        ) as tags:
+            try:
+                return method(self, *args, **kwargs)
+            except BaseException:
+                tags["error"] = True
+                raise
+
+    return wrapper
+
+
+class MetricSummary(TypedDict):
+    name: str
+    tags: Dict[str, str]
+    count: int
+    sum: float
+    min: float
+    max: float
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+
+
+_BUCKET_FACTOR = 2**0.25
+_BUCKET_BOUNDS: List[float] = [1e-6 * _BUCKET_FACTOR**i for i in range(192)]
+
+
+class Histogram:
+    """
+    Histogram with exponentially growing bucket bounds (factor 2**0.25, ~19% relative error).
+    """
+
+    BOUNDS = _BUCKET_BOUNDS
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, value: float):
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        bucket = bisect.bisect_left(self.BOUNDS, value)
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def merge(self, other: "Histogram"):
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for bucket, count in other._buckets.items():
+            self._buckets[bucket] = self._buckets.get(bucket, 0) + count
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                if bucket >= len(self.BOUNDS):
+                    return self.max
+                return min(max(self.BOUNDS[bucket], self.min), self.max)
+        return self.max
+
+
+class MetricsCollector:
+    """
+    In-memory hook that aggregates events into histograms keyed by metric name and tags.
+
+        collector = MetricsCollector()
+        session.instrumentation.add_hook(collector)
+        ...
+        collector.dump()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Histogram] = {}
+
+    def __call__(self, event: Event):
+        key = (event.name, tuple(sorted(event.tags.items())))
+        with self._lock:
+            histogram = self._series.get(key)
+            if histogram is None:
+                histogram = self._series[key] = Histogram()
+            histogram.add(event.value)
+
+    def get(self, name: str, **tags) -> Histogram:
+        """
+        Returns the histogram merged over all series of `name` matching `tags`.
+        """
+        result = Histogram()
+        expected = {k: str(v) for k, v in tags.items()}
+        with self._lock:
+            for (series_name, series_tags), histogram in self._series.items():
+                _tags = dict(series_tags)
+                if series_name == name and all(
+                    _tags.get(k) == v for k, v in expected.items()
+                ):
+                    result.merge(histogram)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def summary(self) -> List[MetricSummary]:
+        with self._lock:
+            series = sorted(self._series.items())
+        return [
+            MetricSummary(
+                name=name,
+                tags=dict(tags),
+                count=histogram.count,
+                sum=histogram.sum,
+                min=histogram.min,
+                max=histogram.max,
+                mean=histogram.sum / histogram.count,
+                p50=histogram.quantile(0.5),
+                p95=histogram.quantile(0.95),
+                p99=histogram.quantile(0.99),
+            )
+            for (name, tags), histogram in series
+        ]
+
+    def dump(self, file: TextIO = None):
+        file = file if file else sys.stdout
+        for metric in self.summary():
+            tags = ",".join(f"{k}={v}" for k, v in metric["tags"].items())
+            file.write(
+                f"{metric['name']}{{{tags}}} count={metric['count']} sum={metric['sum']:.6g} "
+                f"mean={metric['mean']:.6g} p50={metric['p50']:.6g} p95={metric['p95']:.6g} "
+                f"p99={metric['p99']:.6g} max={metric['max']:.6g}\n"
+            )
@@ -0,0 +1,137 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from typing_extensions import TypedDict
+
+logger = logging.getLogger(__name__)
+
+
+class JournalEntry(TypedDict):
+    id: Optional[int]
+    name: str
+    size: int
+    sha256: str
+
+
+class DownloadJournal:
+    """
+    Append only log of the annotation files stored in a download directory,
+    one JSON line per stored file and per completed chunk of item ids.
+    The journal is synced to disk once per chunk, covering the file lines written before it.
+
+    With `resume` the existing journal is loaded and the files it lists are verified by size and hash.
+    The ids of the intact files and of the items of completed chunks that stored no file are
+    in `completed` and don't have to be downloaded again. Otherwise the journal is started over.
+    """
+
+    FILE_NAME = ".sa_download_journal"
+
+    def __init__(self, download_path: str, resume: bool = False):
+        self.download_path = download_path
+        self.path = os.path.join(download_path, self.FILE_NAME)
+        self.completed: Set[int] = set()
+        self._lock = threading.Lock()
+        os.makedirs(download_path, exist_ok=True)
+        if resume and os.path.exists(self.path):
+            entries, chunk_ids = self._load()
+            self.completed = self._verified_ids(entries)
+            # items of a completed chunk without a file line had no annotation to store
+            file_ids = {i["id"] for i in entries.values()}
+            self.completed.update(chunk_ids - file_ids)
+            mode = "a"
+        else:
+            mode = "w"
+        self._file = open(self.path, mode, encoding="utf-8")
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _load(self) -> Tuple[Dict[str, JournalEntry], Set[int]]:
+        """
+        Returns the file entries by name and the ids of the completed chunks.
+        """
+        entries: Dict[str, JournalEntry] = {}
+        chunk_ids: Set[int] = set()
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line is cut when the process dies mid write
+                    continue
+                if "name" in record:
+                    entries[record["name"]] = record
+                elif "chunk" in record:
+                    chunk_ids.update(record["chunk"])
+        return entries, chunk_ids
+
+    def _verified_ids(self, entries: Dict[str, JournalEntry]) -> Set[int]:
+        verified = set()
+        for name, entry in entries.items():
+            item_id = entry.get("id")
+            if item_id is None:
+                continue
+            path = os.path.join(self.download_path, f"{name}.json")
+            try:
+                if os.path.getsize(path) != entry["size"]:
+                    continue
+                with open(path, "rb") as file:
+                    if self.digest(file.read()) != entry["sha256"]:
+                        continue
+            except OSError:
+                continue
+            verified.add(item_id)
+        logger.info(
+            "Resuming download, %s of %s journaled annotations are intact.",
+            len(verified),
+            len(entries),
+        )
+        return verified
+
+    def _write(self, record: Mapping[str, Any]):
+        with self._lock:
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+
+    def record(self, item_id: Optional[int], name: str, data: bytes):
+        """
+        Records the annotation file of the item written with `data`.
+        """
+        self._write(
+            JournalEntry(
+                id=item_id, name=name, size=len(data), sha256=self.digest(data)
+            )
+        )
+        if item_id is not None:
+            self.completed.add(item_id)
+
+    def complete_chunk(self, item_ids: Iterable[int]):
+        """
+        Records that every item of the chunk is downloaded, including the ones without an annotation file.
+        """
+        with self._lock:
+            self._file.write(json.dumps({"chunk": list(item_ids)}) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -4,15 +4,30 @@ from superannotate_core.infrastructure.repositories.annotation_repository import
 from superannotate_core.infrastructure.repositories.classes_repository import (
     AnnotationClassesRepository,
 )
+from superannotate_core.infrastructure.repositories.classes_repository import (
+    AsyncAnnotationClassesRepository,
+)
+from superannotate_core.infrastructure.repositories.folder_repository import (
+    AsyncFolderRepository,
+)
 from superannotate_core.infrastructure.repositories.folder_repository import (
     FolderRepository,
 )
+from superannotate_core.infrastructure.repositories.item_repository import (
+    AsyncItemRepository,
+)
 from superannotate_core.infrastructure.repositories.item_repository import (
     ItemRepository,
 )
+from superannotate_core.infrastructure.repositories.limits_repository import (
+    AsyncLimitsRepository,
+)
 from superannotate_core.infrastructure.repositories.limits_repository import (
     LimitsRepository,
 )
+from superannotate_core.infrastructure.repositories.proejct_repository import (
+    AsyncProjectRepository,
+)
 from superannotate_core.infrastructure.repositories.proejct_repository import (
     ProjectRepository,
 )
@@ -28,4 +43,9 @@ __all__ = [
     "ItemRepository",
     "LimitsRepository",
     "AnnotationRepository",
+    "AsyncProjectRepository",
+    "AsyncFolderRepository",
+    "AsyncAnnotationClassesRepository",
+    "AsyncItemRepository",
+    "AsyncLimitsRepository",
 ]
@@ -1,19 +1,31 @@
 import asyncio
+from typing import Any
+from typing import AsyncIterator
 from typing import Callable
+from typing import IO
 from typing import Iterable
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 from urllib.parse import urljoin
 
 import aiohttp
+from superannotate_core.infrastructure.journal import DownloadJournal
 from superannotate_core.infrastructure.repositories.base import BaseRepositry
-from superannotate_core.infrastructure.repositories.utils import AIOHttpSession
 from superannotate_core.infrastructure.repositories.utils import StreamedAnnotations
+from superannotate_core.infrastructure.store import AnnotationStore
 from typing_extensions import TypedDict
 
 
 class SortedAnnotationsResponse(TypedDict):
     small: List[List[dict]]
-    large: List[List[dict]]
+    large: List[dict]
+
+
+class UploadAnnotationsResponse(TypedDict):
+    failed_items: List[str]
+    missing_resources: dict
 
 
 class AnnotationRepository(BaseRepositry):
@@ -22,6 +34,8 @@ class AnnotationRepository(BaseRepositry):
     URL_DOWNLOAD_LARGE_ANNOTATION = "items/{item_id}/annotations/download"
     URL_START_FILE_SYNC = "items/{item_id}/annotations/sync"
     URL_START_FILE_SYNC_STATUS = "items/{item_id}/annotations/sync/status"
+    URL_UPLOAD_ANNOTATIONS = "items/annotations/upload"
+    URL_UPLOAD_LARGE_ANNOTATION = "items/{item_id}/annotations/upload"
 
     def sort_annotatoins_by_size(
         self, project_id: int, folder_id: int, item_ids: List[int]
@@ -38,11 +52,59 @@ class AnnotationRepository(BaseRepositry):
             build_url=False,
         )
         response.raise_for_status()
-        data = response.json()
+        data = self._session.read_json(response)
+        return self._sorted_annotations(data)
+
+    @staticmethod
+    def _sorted_annotations(data: dict) -> SortedAnnotationsResponse:
         return SortedAnnotationsResponse(
-            large=[i["data"] for i in data.get("small", {}).values()],
-            small=data.get("large", []),
+            small=[i["data"] for i in data.get("small", {}).values()],
+            large=data.get("large", []),
+        )
+
+    async def asort_annotations_by_size(
+        self, project_id: int, item_ids: List[int]
+    ) -> SortedAnnotationsResponse:
+        """
+        Async sort_annotatoins_by_size through the shared aiohttp session.
+        """
+        response = await self._session.arequest(
+            url=urljoin(self._session.assets_provider_url, self.URL_CLASSIFY_ITEM_SIZE),
+            method="post",
+            params={"limit": len(item_ids)},
+            json={"project_id": project_id, "item_ids": item_ids},
+            build_url=False,
         )
+        return self._sorted_annotations(await self._session.aread_json(response))
+
+    async def iter_annotations(
+        self,
+        project_id: int,
+        folder_id: int,
+        item_ids: List[int],
+        annotation_filter: Callable[[dict], Optional[dict]] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Streams the small annotations of the items through the shared aiohttp session.
+        """
+        handler = StreamedAnnotations(
+            headers=self._session.default_headers,
+            json_codec=self._session.json_codec,
+            annotation_filter=annotation_filter,
+        )
+        async for annotation in handler.fetch(
+            "post",
+            self._session.aio_client(),
+            urljoin(self._session.assets_provider_url, self.URL_GET_ANNOTATIONS),
+            {"image_ids": item_ids},
+            params={
+                "team_id": self._session.team_id,
+                "project_id": project_id,
+                "folder_id": folder_id,
+                "limit": len(item_ids),
+            },
+        ):
+            yield annotation
 
     async def list_annotations(
         self,
@@ -50,7 +112,9 @@ class AnnotationRepository(BaseRepositry):
         folder_id: int,
         item_ids: Iterable[int],
         callback: Callable = None,
-    ) -> List[dict]:
+        store: AnnotationStore = None,
+        annotation_filter: Callable[[dict], Optional[dict]] = None,
+    ) -> Union[List[dict], AnnotationStore]:
         query_params = {
             "team_id": self._session.team_id,
             "project_id": project_id,
@@ -60,12 +124,16 @@ class AnnotationRepository(BaseRepositry):
             headers=self._session.default_headers,
             map_function=lambda x: {"image_ids": x},
             callback=callback,
+            json_codec=self._session.json_codec,
+            session_factory=self._session.aio_session,
+            annotation_filter=annotation_filter,
         )
         return await handler.list_annotations(
             method="post",
             url=urljoin(self._session.assets_provider_url, self.URL_GET_ANNOTATIONS),
             data=item_ids,
             params=query_params,
+            store=store,
         )
 
     async def _sync_large_annotation(
@@ -85,9 +153,8 @@ class AnnotationRepository(BaseRepositry):
             self._session.assets_provider_url,
             self.URL_START_FILE_SYNC.format(item_id=item_id),
         )
-        async with AIOHttpSession(
+        async with self._session.aio_session(
             connector=aiohttp.TCPConnector(ssl=False),
-            headers=self._session.default_headers,
             # raise_for_status=True,
         ) as session:
             _response = await session.request("post", sync_url, params=sync_params)
@@ -99,17 +166,28 @@ class AnnotationRepository(BaseRepositry):
                 self._session.assets_provider_url,
                 self.URL_START_FILE_SYNC_STATUS.format(item_id=item_id),
             )
-            while synced != "SUCCESS":
-                synced = await session.get(sync_status_url, params=sync_params)
-                synced = await synced.json()
+            while True:
+                synced = await session.request(
+                    "get", sync_status_url, params=sync_params
+                )
+                synced = await session.read_json(synced)
                 synced = synced["status"]
+                if synced == "SUCCESS":
+                    break
                 await asyncio.sleep(5)
         return synced
 
     async def get_large_annotation(
-        self, project_id: int, folder_id: int, item_id: int
-    ) -> dict:
-        url = urljoin(self._session.assets_provider_url, self.URL_GET_ANNOTATIONS)
+        self, project_id: int, folder_id: int, item_id: int, transform: Callable = None
+    ) -> Any:
+        """
+        :param transform: picklable function applied to the decoded annotation,
+         in the session's decoding processes when the annotation is large enough.
+        """
+        url = urljoin(
+            self._session.assets_provider_url,
+            self.URL_DOWNLOAD_LARGE_ANNOTATION.format(item_id=item_id),
+        )
         query_params = {
             "project_id": project_id,
             "folder_id": folder_id,
@@ -120,14 +198,72 @@ class AnnotationRepository(BaseRepositry):
             project_id=project_id, folder_id=folder_id, item_id=item_id
         )
 
-        async with AIOHttpSession(
+        async with self._session.aio_session(
             connector=aiohttp.TCPConnector(ssl=False),
-            headers=self._session.default_headers,
             # raise_for_status=True,
         ) as session:
             start_response = await session.request("post", url, params=query_params)
-            large_annotation = await start_response.json()
-            return large_annotation
+            if self._session.decoder:
+                return await self._session.decoder.decode_response(
+                    start_response, transform
+                )
+            large_annotation = await session.read_json(start_response)
+            return transform(large_annotation) if transform else large_annotation
+
+    async def upload_annotations(
+        self, project_id: int, folder_id: int, annotations: List[Tuple[str, bytes]]
+    ) -> UploadAnnotationsResponse:
+        """
+        Uploads the encoded annotations of the named items as one multipart request
+        through the shared aiohttp session.
+        """
+        form_data = aiohttp.FormData(quote_fields=False)
+        for name, content in annotations:
+            form_data.add_field(
+                name,
+                content,
+                filename=f"{name}.json",
+                content_type="application/json",
+            )
+        response = await self._session.arequest(
+            url=urljoin(self._session.assets_provider_url, self.URL_UPLOAD_ANNOTATIONS),
+            method="post",
+            data=form_data,
+            params={"project_id": project_id, "folder_id": folder_id},
+            build_url=False,
+        )
+        data = await self._session.aread_json(response)
+        return UploadAnnotationsResponse(
+            failed_items=data.get("failedItems", []),
+            missing_resources=data.get("missing", {}),
+        )
+
+    async def upload_large_annotation(
+        self, project_id: int, folder_id: int, item_id: int, file: IO[bytes]
+    ):
+        """
+        Streams the annotation file of a large item, the file is read from the start on every retry.
+        """
+        form_data = aiohttp.FormData(quote_fields=False)
+        form_data.add_field(
+            "file", file, filename="annotation.json", content_type="application/json"
+        )
+        await self._session.arequest(
+            url=urljoin(
+                self._session.assets_provider_url,
+                self.URL_UPLOAD_LARGE_ANNOTATION.format(item_id=item_id),
+            ),
+            method="post",
+            data=form_data,
+            params={
+                "project_id": project_id,
+                "folder_id": folder_id,
+                "desired_transform_version": "export",
+                "desired_version": self._session.ANNOTATION_VERSION,
+                "current_transform_version": self._session.ANNOTATION_VERSION,
+            },
+            build_url=False,
+        )
 
     async def download_small_annotations(
         self,
@@ -136,7 +272,11 @@ class AnnotationRepository(BaseRepositry):
         item_ids: List[int],
         download_path: str,
         callback: Callable = None,
+        journal: DownloadJournal = None,
     ):
+        """
+        :param journal: records the stored files, items it has already completed are skipped.
+        """
         query_params = {
             "project_id": project_id,
             "folder_id": folder_id,
@@ -145,6 +285,8 @@ class AnnotationRepository(BaseRepositry):
             headers=self._session.default_headers,
             map_function=lambda x: {"image_ids": x},
             callback=callback,
+            json_codec=self._session.json_codec,
+            session_factory=self._session.aio_session,
         )
 
         return await handler.download_annotations(
@@ -153,4 +295,5 @@ class AnnotationRepository(BaseRepositry):
             data=item_ids,
             params=query_params,
             download_path=download_path,
+            journal=journal,
         )
@@ -1,25 +1,66 @@
+import inspect
 from abc import ABC
 from typing import List
 from typing import Union
 
+from superannotate_core.infrastructure.instrumentation import ENTITY_DECODE_COUNT
+from superannotate_core.infrastructure.instrumentation import (
+    ENTITY_DECODE_DURATION,
+)
+from superannotate_core.infrastructure.instrumentation import instrumented
+
 
 class BaseRepositry(ABC):
     def __init__(self, session):
         self._session = session
 
+    def __init_subclass__(cls, **kwargs):
+        """
+        Reports the duration of every public repository method to the session instrumentation.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.__module__ == __name__:
+            return
+        for name, attr in list(vars(cls).items()):
+            if name.startswith("_") or not inspect.isfunction(attr):
+                continue
+            if (
+                inspect.isgeneratorfunction(attr)
+                or inspect.isasyncgenfunction(attr)
+                or getattr(attr, "__instrumented__", False)
+            ):
+                continue
+            wrapped = instrumented(attr)
+            wrapped.__instrumented__ = True
+            setattr(cls, name, wrapped)
+
 
 class BaseHttpRepositry(BaseRepositry):
     def serialize_entiy(self, data: Union[List[dict], dict]):
         entitiy_class = getattr(self, "ENTITY")
         if not entitiy_class:
             raise Exception("Repository entity object not specified")
-        if isinstance(data, list):
-            response = []
-            for i in data:
-                entity = entitiy_class.from_json(i)
-                entity.session = self._session
-                response.append(entity)
-        else:
-            response = entitiy_class.from_json(data)
-            response.session = self._session
+        with self._session.instrumentation.timer(
+            ENTITY_DECODE_DURATION, entity=entitiy_class.__name__
+        ):
+            if isinstance(data, list):
+                response = []
+                for i in data:
+                    entity = entitiy_class.from_json(i)
+                    entity.session = self._session
+                    response.append(entity)
+            else:
+                response = entitiy_class.from_json(data)
+                response.session = self._session
+        self._session.instrumentation.emit(
+            ENTITY_DECODE_COUNT,
+            len(data) if isinstance(data, list) else 1,
+            entity=entitiy_class.__name__,
+        )
         return response
+
+
+class BaseAsyncHttpRepositry(BaseHttpRepositry):
+    """
+    Repository whose methods are coroutines running on the session's shared aiohttp client.
+    """
@@ -1,40 +1,236 @@
+from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
 
 from superannotate_core.core.conditions import Condition
+from superannotate_core.core.conditions import CONDITION_EQ as EQ
 from superannotate_core.core.entities import AnnotationClassEntity
+from superannotate_core.core.utils import chunkify
+from superannotate_core.infrastructure.repositories.base import BaseAsyncHttpRepositry
 from superannotate_core.infrastructure.repositories.base import BaseHttpRepositry
+from superannotate_core.infrastructure.repositories.utils import gather_bounded
+from superannotate_core.infrastructure.repositories.utils import map_threaded
+
+
+class ClassRegistry:
+    """
+    Indexed view of the annotation classes of a project.
+    Classes are looked up by name or id, attribute groups and attributes by their names
+    inside a class and by their ids.
+    """
+
+    def __init__(self, project_id: int, classes: List[AnnotationClassEntity]):
+        self.project_id = project_id
+        self._classes = list(classes)
+        self._by_name: Dict[str, AnnotationClassEntity] = {}
+        self._by_id: Dict[int, AnnotationClassEntity] = {}
+        self._group_ids: Dict[Tuple[int, str], int] = {}
+        self._attribute_ids: Dict[Tuple[int, str, str], int] = {}
+        self._group_names: Dict[int, str] = {}
+        self._attribute_names: Dict[int, str] = {}
+        for annotation_class in self._classes:
+            self._by_name[annotation_class.name] = annotation_class
+            self._by_id[annotation_class.id] = annotation_class
+            for group in annotation_class.attribute_groups or []:
+                self._group_ids[(annotation_class.id, group["name"])] = group["id"]
+                self._group_names[group["id"]] = group["name"]
+                for attribute in group.get("attributes") or []:
+                    key = (annotation_class.id, group["name"], attribute["name"])
+                    self._attribute_ids[key] = attribute["id"]
+                    self._attribute_names[attribute["id"]] = attribute["name"]
+
+    def __len__(self):
+        return len(self._classes)
+
+    def __iter__(self) -> Iterator[AnnotationClassEntity]:
+        return iter(self._classes)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._by_name
+
+    def _class_id(self, annotation_class: Union[str, int]) -> int:
+        if isinstance(annotation_class, str):
+            return self._by_name[annotation_class].id
+        return annotation_class
+
+    def get_by_name(self, name: str) -> Optional[AnnotationClassEntity]:
+        return self._by_name.get(name)
+
+    def get_by_id(self, class_id: int) -> Optional[AnnotationClassEntity]:
+        return self._by_id.get(class_id)
+
+    def class_id(self, name: str) -> int:
+        return self._by_name[name].id
+
+    def class_name(self, class_id: int) -> str:
+        return self._by_id[class_id].name
+
+    def group_id(self, annotation_class: Union[str, int], group_name: str) -> int:
+        """
+        :param annotation_class: class name or id
+        """
+        return self._group_ids[(self._class_id(annotation_class), group_name)]
+
+    def group_name(self, group_id: int) -> str:
+        return self._group_names[group_id]
+
+    def attribute_id(
+        self, annotation_class: Union[str, int], group_name: str, attribute_name: str
+    ) -> int:
+        """
+        :param annotation_class: class name or id
+        """
+        return self._attribute_ids[
+            (self._class_id(annotation_class), group_name, attribute_name)
+        ]
+
+    def attribute_name(self, attribute_id: int) -> str:
+        return self._attribute_names[attribute_id]
 
 
 class AnnotationClassesRepository(BaseHttpRepositry):
     ENTITY = AnnotationClassEntity
+    CREATE_CHUNK_SIZE = 500
+    REGISTRY_CACHE = "annotation_classes"
+    REGISTRY_TTL = 300
     URL_LIST = "classes"
     URL_GET = "class/{}"
 
-    def bulk_create(
-        self, project_id: int, classes: List[AnnotationClassEntity]
-    ) -> List[AnnotationClassEntity]:
-        params = {
-            "project_id": project_id,
-        }
+    def _create(
+        self, project_id: int, chunk: Tuple[int, List[AnnotationClassEntity]]
+    ) -> Tuple[int, List[dict]]:
+        index, classes = chunk
         response = self._session.request(
             self.URL_LIST,
             "post",
-            params=params,
+            params={"project_id": project_id},
             json={"classes": [i.to_json(exclude_none=True) for i in classes]},
         )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        return index, self._session.read_json(response)
+
+    def bulk_create(
+        self, project_id: int, classes: List[AnnotationClassEntity]
+    ) -> List[AnnotationClassEntity]:
+        """
+        Creates the classes in CREATE_CHUNK_SIZE chunks sent concurrently, keeping their order.
+        """
+        try:
+            chunks = sorted(
+                map_threaded(
+                    lambda chunk: self._create(project_id, chunk),
+                    enumerate(chunkify(classes, self.CREATE_CHUNK_SIZE)),
+                    self._session.executor(),
+                    self._session.MAX_THREAD_COUNT,
+                ),
+                key=lambda i: i[0],
+            )
+        finally:
+            self.invalidate(project_id)
+        return self.serialize_entiy([i for _, created in chunks for i in created])
 
     def list(self, condition: Condition = None) -> List[AnnotationClassEntity]:
-        return self._session.paginate(
-            url=f"{self.URL_LIST}?{condition.build_query()}"
-            if condition
-            else self.URL_LIST,
+        return self.serialize_entiy(
+            self._session.paginate(
+                url=f"{self.URL_LIST}?{condition.build_query()}"
+                if condition
+                else self.URL_LIST,
+            )
         )
 
     def delete(self, project_id: int, annotation_class_id: int):
-        return self._session.request(
-            self.URL_GET.format(annotation_class_id),
-            "delete",
+        try:
+            return self._session.request(
+                self.URL_GET.format(annotation_class_id),
+                "delete",
+                params={"project_id": project_id},
+            )
+        finally:
+            self.invalidate(project_id)
+
+    def registry(self, project_id: int, refresh: bool = False) -> ClassRegistry:
+        """
+        Returns the cached class registry of the project, listing the classes when missing or expired.
+        """
+        cache = self._session.cache(self.REGISTRY_CACHE, self.REGISTRY_TTL)
+        registry = None if refresh else cache.get(project_id)
+        if registry is None:
+            registry = ClassRegistry(
+                project_id, self.list(Condition("project_id", project_id, EQ))
+            )
+            cache.set(project_id, registry)
+        return registry
+
+    def invalidate(self, project_id: int):
+        self._session.cache(self.REGISTRY_CACHE, self.REGISTRY_TTL).pop(project_id)
+
+
+class AsyncAnnotationClassesRepository(BaseAsyncHttpRepositry):
+    ENTITY = AnnotationClassEntity
+    CREATE_CHUNK_SIZE = AnnotationClassesRepository.CREATE_CHUNK_SIZE
+    REGISTRY_CACHE = AnnotationClassesRepository.REGISTRY_CACHE
+    REGISTRY_TTL = AnnotationClassesRepository.REGISTRY_TTL
+    URL_LIST = AnnotationClassesRepository.URL_LIST
+    URL_GET = AnnotationClassesRepository.URL_GET
+
+    async def _create(
+        self, project_id: int, classes: List[AnnotationClassEntity]
+    ) -> List[dict]:
+        response = await self._session.arequest(
+            self.URL_LIST,
+            "post",
             params={"project_id": project_id},
+            json={"classes": [i.to_json(exclude_none=True) for i in classes]},
+        )
+        return await self._session.aread_json(response)
+
+    async def bulk_create(
+        self, project_id: int, classes: List[AnnotationClassEntity]
+    ) -> List[AnnotationClassEntity]:
+        try:
+            chunks = await gather_bounded(
+                (
+                    self._create(project_id, chunk)
+                    for chunk in chunkify(classes, self.CREATE_CHUNK_SIZE)
+                ),
+                self._session.MAX_COROUTINE_COUNT,
+            )
+        finally:
+            self.invalidate(project_id)
+        return self.serialize_entiy([i for created in chunks for i in created])
+
+    async def list(self, condition: Condition = None) -> List[AnnotationClassEntity]:
+        return self.serialize_entiy(
+            await self._session.apaginate(
+                url=f"{self.URL_LIST}?{condition.build_query()}"
+                if condition
+                else self.URL_LIST,
+            )
         )
+
+    async def delete(self, project_id: int, annotation_class_id: int):
+        try:
+            response = await self._session.arequest(
+                self.URL_GET.format(annotation_class_id),
+                "delete",
+                params={"project_id": project_id},
+            )
+            response.release()
+        finally:
+            self.invalidate(project_id)
+
+    async def registry(self, project_id: int, refresh: bool = False) -> ClassRegistry:
+        cache = self._session.cache(self.REGISTRY_CACHE, self.REGISTRY_TTL)
+        registry = None if refresh else cache.get(project_id)
+        if registry is None:
+            registry = ClassRegistry(
+                project_id, await self.list(Condition("project_id", project_id, EQ))
+            )
+            cache.set(project_id, registry)
+        return registry
+
+    def invalidate(self, project_id: int):
+        self._session.cache(self.REGISTRY_CACHE, self.REGISTRY_TTL).pop(project_id)
@@ -1,10 +1,88 @@
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
 
+import aiohttp
+from requests import HTTPError
 from superannotate_core.core.conditions import Condition
+from superannotate_core.core.conditions import CONDITION_EQ as EQ
 from superannotate_core.core.entities import FolderEntity
+from superannotate_core.infrastructure.repositories.base import BaseAsyncHttpRepositry
 from superannotate_core.infrastructure.repositories.base import BaseHttpRepositry
 
 
+class FolderIndex:
+    """
+    Name and id index of the folders of a project.
+    A complete index holds every folder of the project, otherwise only the folders looked up so far.
+    """
+
+    def __init__(self, folders: Iterable[FolderEntity] = (), complete: bool = False):
+        self.complete = complete
+        self._by_name: Dict[str, FolderEntity] = {}
+        self._by_id: Dict[int, FolderEntity] = {}
+        for folder in folders:
+            self.add(folder)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[FolderEntity]:
+        return iter(list(self._by_id.values()))
+
+    def get_by_name(self, name: str) -> Optional[FolderEntity]:
+        return self._by_name.get(name)
+
+    def get_by_id(self, folder_id: int) -> Optional[FolderEntity]:
+        return self._by_id.get(folder_id)
+
+    def add(self, folder: FolderEntity):
+        self.remove(folder.id)
+        self._by_name[folder.name] = folder
+        self._by_id[folder.id] = folder
+
+    def remove(self, folder_id: int):
+        folder = self._by_id.pop(folder_id, None)
+        if folder is not None and self._by_name.get(folder.name) is folder:
+            del self._by_name[folder.name]
+
+
+class FolderIndexCache:
+    """
+    Session wide cache of the project folder indexes, kept up to date by the folder writes of the SDK.
+    Folders created or deleted by other clients are picked up on lookup misses or when the index expires.
+    """
+
+    NAME = "folders"
+    TTL = 300
+
+    def __init__(self, session):
+        self._cache = session.cache(self.NAME, self.TTL)
+
+    def get(self, project_id: int) -> FolderIndex:
+        with self._cache.lock:
+            index = self._cache.get(project_id)
+            if index is None:
+                index = FolderIndex()
+                self._cache.set(project_id, index)
+            return index
+
+    def set(self, project_id: int, index: FolderIndex):
+        self._cache.set(project_id, index)
+
+    def add(self, project_id: int, folder: FolderEntity):
+        with self._cache.lock:
+            self.get(project_id).add(folder)
+
+    def remove(self, project_id: int, folder_ids: List[int]):
+        with self._cache.lock:
+            index = self.get(project_id)
+            for folder_id in folder_ids:
+                index.remove(folder_id)
+
+
 class FolderRepository(BaseHttpRepositry):
     ENTITY = FolderEntity
     URL_BASE = "folder"
@@ -15,17 +93,54 @@ class FolderRepository(BaseHttpRepositry):
     URL_UPDATE = "folder/{folder_id}"
     URL_ASSIGN_FOLDER = "folder/editAssignment"
 
+    def index(self, project_id: int, refresh: bool = False) -> FolderIndex:
+        """
+        Returns the complete folder index of the project, listing the folders once per FolderIndexCache.TTL.
+        """
+        cache = FolderIndexCache(self._session)
+        index = cache.get(project_id)
+        if refresh or not index.complete:
+            index = FolderIndex(
+                self.list(Condition("project_id", project_id, EQ)), complete=True
+            )
+            cache.set(project_id, index)
+        return index
+
     def get_by_id(self, project_id: int, folder_id: int) -> FolderEntity:
         params = {"folder_id": folder_id, "project_id": project_id}
-        response = self._session.request(self.URL_RETRIEVE, "get", params=params)
+        response = self._session.request(
+            self.URL_RETRIEVE.format(folder_id=folder_id), "get", params=params
+        )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        folder = self.serialize_entiy(self._session.read_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
 
     def get_by_name(self, project_id: int, name: str):
         params = {"project_id": project_id, "name": name}
         response = self._session.request(self.URL_GET_BY_NAME, "get", params=params)
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        folder = self.serialize_entiy(self._session.read_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
+
+    def get_cached_by_id(self, project_id: int, folder_id: int) -> FolderEntity:
+        folder = FolderIndexCache(self._session).get(project_id).get_by_id(folder_id)
+        return folder if folder else self.get_by_id(project_id, folder_id)
+
+    def get_cached_by_name(self, project_id: int, name: str) -> Optional[FolderEntity]:
+        """
+        Looks the folder up in the project index, a miss fetches the folder by name and indexes it.
+        """
+        folder = FolderIndexCache(self._session).get(project_id).get_by_name(name)
+        if folder:
+            return folder
+        try:
+            return self.get_by_name(project_id, name)
+        except HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
 
     def create(self, project_id: int, name: str):
         data = {"name": name}
@@ -35,7 +150,9 @@ class FolderRepository(BaseHttpRepositry):
         )
 
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        folder = self.serialize_entiy(self._session.read_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
 
     def list(self, condition: Condition) -> List[FolderEntity]:
         data = self._session.paginate(
@@ -53,7 +170,9 @@ class FolderRepository(BaseHttpRepositry):
             params=params,
         )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        folder = self.serialize_entiy(self._session.read_json(response))
+        FolderIndexCache(self._session).add(entity.project_id, folder)
+        return folder
 
     def bulk_delete(self, project_id: int, folder_ids: List[int]) -> None:
         params = {"project_id": project_id, "folder_ids": folder_ids}
@@ -62,6 +181,7 @@ class FolderRepository(BaseHttpRepositry):
             self.URL_BULK_DELETE, "put", json={"folder_ids": folder_ids}, params=params
         )
         response.raise_for_status()
+        FolderIndexCache(self._session).remove(project_id, folder_ids)
 
     def assign(
         self,
@@ -76,3 +196,110 @@ class FolderRepository(BaseHttpRepositry):
             data={"folder_name": folder_name, "assign_user_ids": users},
         )
         response.raise_for_status()
+
+
+class AsyncFolderRepository(BaseAsyncHttpRepositry):
+    ENTITY = FolderEntity
+    URL_BASE = FolderRepository.URL_BASE
+    URL_LIST = FolderRepository.URL_LIST
+    URL_GET_BY_NAME = FolderRepository.URL_GET_BY_NAME
+    URL_BULK_DELETE = FolderRepository.URL_BULK_DELETE
+    URL_RETRIEVE = FolderRepository.URL_RETRIEVE
+    URL_UPDATE = FolderRepository.URL_UPDATE
+    URL_ASSIGN_FOLDER = FolderRepository.URL_ASSIGN_FOLDER
+
+    async def index(self, project_id: int, refresh: bool = False) -> FolderIndex:
+        cache = FolderIndexCache(self._session)
+        index = cache.get(project_id)
+        if refresh or not index.complete:
+            index = FolderIndex(
+                await self.list(Condition("project_id", project_id, EQ)), complete=True
+            )
+            cache.set(project_id, index)
+        return index
+
+    async def get_by_id(self, project_id: int, folder_id: int) -> FolderEntity:
+        params = {"folder_id": folder_id, "project_id": project_id}
+        response = await self._session.arequest(
+            self.URL_RETRIEVE.format(folder_id=folder_id), "get", params=params
+        )
+        folder = self.serialize_entiy(await self._session.aread_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
+
+    async def get_by_name(self, project_id: int, name: str):
+        params = {"project_id": project_id, "name": name}
+        response = await self._session.arequest(
+            self.URL_GET_BY_NAME, "get", params=params
+        )
+        folder = self.serialize_entiy(await self._session.aread_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
+
+    async def get_cached_by_id(self, project_id: int, folder_id: int) -> FolderEntity:
+        folder = FolderIndexCache(self._session).get(project_id).get_by_id(folder_id)
+        return folder if folder else await self.get_by_id(project_id, folder_id)
+
+    async def get_cached_by_name(
+        self, project_id: int, name: str
+    ) -> Optional[FolderEntity]:
+        folder = FolderIndexCache(self._session).get(project_id).get_by_name(name)
+        if folder:
+            return folder
+        try:
+            return await self.get_by_name(project_id, name)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
+
+    async def create(self, project_id: int, name: str):
+        response = await self._session.arequest(
+            self.URL_BASE,
+            "post",
+            json={"name": name},
+            params={"project_id": project_id},
+        )
+        folder = self.serialize_entiy(await self._session.aread_json(response))
+        FolderIndexCache(self._session).add(project_id, folder)
+        return folder
+
+    async def list(self, condition: Condition) -> List[FolderEntity]:
+        data = await self._session.apaginate(
+            url=self.URL_LIST,
+            query_params=condition.get_as_params_dict(),
+        )
+        return self.serialize_entiy(data)
+
+    async def update(self, entity: FolderEntity) -> FolderEntity:
+        response = await self._session.arequest(
+            self.URL_UPDATE.format(folder_id=entity.id),
+            "put",
+            json=entity.to_json(),
+            params={"project_id": entity.project_id},
+        )
+        folder = self.serialize_entiy(await self._session.aread_json(response))
+        FolderIndexCache(self._session).add(entity.project_id, folder)
+        return folder
+
+    async def bulk_delete(self, project_id: int, folder_ids: List[int]) -> None:
+        params = {"project_id": project_id, "folder_ids": folder_ids}
+        response = await self._session.arequest(
+            self.URL_BULK_DELETE, "put", json={"folder_ids": folder_ids}, params=params
+        )
+        response.release()
+        FolderIndexCache(self._session).remove(project_id, folder_ids)
+
+    async def assign(
+        self,
+        project_id: int,
+        folder_name: str,
+        users: List[str],
+    ):
+        response = await self._session.arequest(
+            self.URL_ASSIGN_FOLDER,
+            "post",
+            params={"project_id": project_id},
+            data={"folder_name": folder_name, "assign_user_ids": users},
+        )
+        response.release()
@@ -1,8 +1,21 @@
+import asyncio
+import functools
+import logging
 import time
+from typing import Any
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Set
 from typing import Tuple
+from typing import Union
 
+import aiohttp
 from superannotate_core.core import constants
 from superannotate_core.core.conditions import Condition
 from superannotate_core.core.conditions import CONDITION_EQ as EQ
@@ -12,12 +25,26 @@ from superannotate_core.core.enums import ApprovalStatus
 from superannotate_core.core.enums import UploadStateEnum
 from superannotate_core.core.exceptions import SAValidationException
 from superannotate_core.core.utils import chunkify
+from superannotate_core.core.utils import achunkify_iter
+from superannotate_core.core.utils import chunkify_iter
+from superannotate_core.infrastructure.adaptive import AdaptiveWindow
+from superannotate_core.infrastructure.repositories.base import BaseAsyncHttpRepositry
 from superannotate_core.infrastructure.repositories.base import BaseHttpRepositry
+from superannotate_core.infrastructure.repositories.limits_repository import (
+    AsyncLimitsRepository,
+)
 from superannotate_core.infrastructure.repositories.limits_repository import (
     LimitsRepository,
 )
+from superannotate_core.infrastructure.repositories.limits_repository import (
+    UserLimits,
+)
+from superannotate_core.infrastructure.repositories.utils import gather_adaptive
+from superannotate_core.infrastructure.repositories.utils import map_threaded
 from typing_extensions import TypedDict
 
+logger = logging.getLogger(__name__)
+
 
 class Attachment(TypedDict, total=False):
     name: str
@@ -32,6 +59,32 @@ class AttachmentMeta(TypedDict, total=False):
     integration_id: int
 
 
+def _folder_condition(
+    project_id: int, folder_id: int, condition: Condition = None
+) -> Condition:
+    base_condition = Condition("project_id", project_id, EQ) & Condition(
+        "folder_id", folder_id, EQ
+    )
+    if condition:
+        base_condition &= condition
+    return base_condition
+
+
+class BulkReport(TypedDict):
+    succeeded: List[str]
+    failed: List[str]
+    errors: List[str]
+
+
+class DeleteReport(TypedDict):
+    deleted: List[int]
+    failed: List[int]
+    # ids or names, as passed to bulk_delete or delete_by_names
+    missing: List[Union[int, str]]
+    unresolved: List[Union[int, str]]
+    errors: List[str]
+
+
 class Polling:
     def __init__(self, project_id: int, polling_id: int, trashold: int):
         self.project_id = project_id
@@ -50,12 +103,43 @@ class Polling:
         return self.cursor >= self.trashold
 
 
-class ItemRepository(BaseHttpRepositry):
+def _adaptive_chunks(values: list, window: AdaptiveWindow) -> Iterator[list]:
+    """
+    Splits `values` into consecutive chunks of the current window size.
+    """
+    offset = 0
+    while offset < len(values):
+        chunk = values[offset : offset + window.value]
+        offset += len(chunk)
+        yield chunk
+
+
+# the chunk, the response body and the error of a chunk sent by _send_chunks, the body is empty on error
+ChunkResult = Tuple[Any, bytes, Optional[str]]
+
+
+class _ItemRepositoryMixin:
+    """
+    Request payloads, chunk planning and response parsing shared by ItemRepository and AsyncItemRepository,
+    which only send the requests.
+    The request builders return the keyword arguments of Session.request and Session.arequest.
+    """
+
+    _session: Any
+
     ENTITY = BaseItemEntity
     CHUNK_SIZE = 2000
     ATTACH_CHUNK_SIZE = 500
     ASSIGN_CHUNK_SIZE = ATTACH_CHUNK_SIZE
+    STATUS_CHUNK_SIZE = ATTACH_CHUNK_SIZE
+    DELETE_CHUNK_SIZE = 1000
+    LIST_BY_NAMES_CHUNK_SIZE = 200
+    CHUNK_RETRY_LIMIT = 3
     BACK_OFF_FACTOR = 0.3
+    # adaptive windows, see Session.window
+    ATTACH_WINDOW = "items.attach"
+    LIST_BY_NAMES_WINDOW = "items.list_by_names"
+    CONCURRENCY_WINDOW = "items.concurrency"
 
     URL_LIST = "items"
     URL_ATTACH = "image/ext-create"
@@ -70,18 +154,14 @@ class ItemRepository(BaseHttpRepositry):
     URL_SET_ANNOTATION_STATUSES = "image/updateAnnotationStatusBulk"
     URL_ASSIGN_ITEMS = "images/editAssignment/"
 
-    def _validate_limitations(
-        self,
-        project_id: int,
-        folder_id: int,
+    @staticmethod
+    def _check_limitations(
+        limits: UserLimits,
         attachments_count: int,
         folder_limit=True,
         project_limit=True,
         user_limit=True,
     ):
-        limits = LimitsRepository(self._session).get_limitations(
-            project_id=project_id, folder_id=folder_id
-        )
         if (
             folder_limit
             and attachments_count > limits["folder_limit"]["remaining_image_count"]
@@ -98,15 +178,362 @@ class ItemRepository(BaseHttpRepositry):
         ):
             raise SAValidationException(constants.ATTACH_USER_LIMIT_ERROR_MESSAGE)
 
+    @staticmethod
+    def _consume_moved(
+        limits_repository, project_id, source_folder_id, destination_folder_id, count
+    ):
+        limits_repository.consume(
+            project_id,
+            destination_folder_id,
+            count,
+            project_limit=False,
+            user_limit=False,
+        )
+        limits_repository.consume(
+            project_id, source_folder_id, -count, project_limit=False, user_limit=False
+        )
+
+    def _list_by_names_window(self) -> AdaptiveWindow:
+        return self._session.window(
+            self.LIST_BY_NAMES_WINDOW, self.LIST_BY_NAMES_CHUNK_SIZE, minimum=10
+        )
+
+    def _attach_window(self) -> AdaptiveWindow:
+        return self._session.window(
+            self.ATTACH_WINDOW, self.ATTACH_CHUNK_SIZE, minimum=10
+        )
+
+    def _decode(self, content: bytes) -> Any:
+        return self._session.json_codec.loads(content)
+
+    def _by_ids_request(
+        self, project_id: int, folder_id: int, ids: List[int]
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_LIST_BY_IDS,
+            "method": "post",
+            "json": {"image_ids": ids},
+            "params": {"project_id": project_id, "folder_id": folder_id},
+        }
+
+    def _by_names_request(
+        self, project_id: int, folder_id: int, names: List[str]
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_LIST_BY_NAMES,
+            "method": "post",
+            "json": {
+                "project_id": project_id,
+                "team_id": self._session.team_id,
+                "folder_id": folder_id,
+                "names": names,
+            },
+            "hedge": True,
+        }
+
+    def _attach_request(
+        self,
+        project_id: int,
+        folder_id: int,
+        attachments: List[Attachment],
+        existing: Set[str],
+        annotation_status: AnnotationStatus,
+        upload_state: UploadStateEnum,
+        meta: Optional[Dict[str, AttachmentMeta]],
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """
+        Returns the names of the attachments missing from the folder and the request creating them.
+        """
+        _data, _metadata = [], {}
+        for _attachment in attachments:
+            if _attachment["name"] not in existing:
+                _data.append({"name": _attachment["name"], "path": _attachment["url"]})
+                _metadata[_attachment["name"]] = {
+                    "width": None,
+                    "height": None,
+                    "_integration_id": _attachment.get("integration_id"),
+                }
+        return [i["name"] for i in _data], {
+            "url": self.URL_ATTACH,
+            "method": "post",
+            "json": {
+                "project_id": project_id,
+                "folder_id": folder_id,
+                "team_id": self._session.team_id,
+                "images": _data,
+                "annotation_status": annotation_status,
+                "upload_state": upload_state,
+                "meta": meta if meta else _metadata,
+            },
+        }
+
+    def _copy_request(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        include_annotations: bool,
+        include_pin: bool,
+        item_names: List[str],
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_BULK_COPY_BY_NAMES,
+            "method": "post",
+            "params": {"project_id": project_id},
+            "json": {
+                "is_folder_copy": False,
+                "image_names": item_names,
+                "destination_folder_id": destination_folder_id,
+                "source_folder_id": source_folder_id,
+                "include_annotations": include_annotations,
+                "keep_pin_status": include_pin,
+            },
+        }
+
+    def _copy_progress_request(self, polling: Polling) -> Dict[str, Any]:
+        return {
+            "url": self.URL_COPY_PROGRESS,
+            "method": "get",
+            "params": {
+                "project_id": polling.project_id,
+                "poll_id": polling.polling_id,
+            },
+        }
+
+    def _move_request(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        item_names: List[str],
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_MOVE_MULTIPLE,
+            "method": "post",
+            "params": {"project_id": project_id},
+            "json": {
+                "image_names": item_names,
+                "destination_folder_id": destination_folder_id,
+                "source_folder_id": source_folder_id,
+            },
+        }
+
+    def _status_request(
+        self,
+        project_id: int,
+        folder_id: int,
+        annotation_status: AnnotationStatus,
+        item_names: List[str],
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_SET_ANNOTATION_STATUSES,
+            "method": "put",
+            "params": {"project_id": project_id},
+            "json": {
+                "folder_id": folder_id,
+                "annotation_status": annotation_status,
+                "image_names": item_names,
+            },
+        }
+
+    def _approval_request(
+        self,
+        project_id: int,
+        folder_id: int,
+        approval_status: ApprovalStatus,
+        item_names: List[str],
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_SET_APPROVAL_STATUSES,
+            "method": "post",
+            "params": {"project_id": project_id, "folder_id": folder_id},
+            "json": {
+                "item_names": item_names,
+                "change_actions": {
+                    "APPROVAL_STATUS": approval_status
+                    if approval_status.value
+                    else None
+                },
+            },
+        }
+
+    def _delete_request(
+        self, project_id: int, folder_id: int, item_ids: List[int]
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_DELETE_ITEMS,
+            "method": "put",
+            "params": {"project_id": project_id, "folder_id": folder_id},
+            "data": {"image_ids": item_ids},
+        }
+
+    def _assign_request(
+        self, project_id: int, folder_id: int, assignment: Tuple[str, List[str]]
+    ) -> Dict[str, Any]:
+        user_id, item_names = assignment
+        return {
+            "url": self.URL_ASSIGN_ITEMS,
+            "method": "put",
+            "params": {"project_id": project_id},
+            "data": {
+                "image_names": item_names,
+                "assign_user_id": user_id,
+                "folder_id": folder_id,
+            },
+        }
+
+    def _unassign_request(
+        self, project_id: int, folder_id: int, item_names: List[str]
+    ) -> Dict[str, Any]:
+        return {
+            "url": self.URL_ASSIGN_ITEMS,
+            "method": "put",
+            "params": {"project_id": project_id},
+            "data": {
+                "image_names": item_names,
+                "remove_user_ids": ["all"],
+                "folder_id": folder_id,
+            },
+        }
+
+    @staticmethod
+    def _bulk_report(results: Iterable[ChunkResult], action: str) -> BulkReport:
+        """
+        Reports the outcome of the sent item name chunks per item name, the failed names are logged.
+        :param action: the failed action for the log, e.g. "unassign".
+        """
+        report = BulkReport(succeeded=[], failed=[], errors=[])
+        for chunk, _, error in results:
+            if error:
+                logger.warning(
+                    f"Failed to {action} {len(chunk)} items {', '.join(chunk)}: {error}"
+                )
+                report["failed"].extend(chunk)
+                report["errors"].append(error)
+            else:
+                report["succeeded"].extend(chunk)
+        return report
+
+    def _assigned_count(self, results: Iterable[ChunkResult]) -> int:
+        count = 0
+        for (user_id, chunk), content, error in results:
+            if error:
+                logger.warning(
+                    f"Failed to assign {len(chunk)} items to {user_id}: {error}"
+                )
+            else:
+                count += self._decode(content)["successCount"]
+        return count
+
+    @staticmethod
+    def _delete_report() -> DeleteReport:
+        return DeleteReport(deleted=[], failed=[], missing=[], unresolved=[], errors=[])
+
+    def _found_ids(
+        self, report: DeleteReport, results: Iterable[ChunkResult]
+    ) -> Iterator[int]:
+        """
+        Yields the ids of the resolved id chunks found in the folder,
+        the missing and the unresolved ids are reported.
+        """
+        for chunk, content, error in results:
+            if error:
+                report["unresolved"].extend(chunk)
+                report["errors"].append(error)
+                continue
+            found = {i["id"] for i in self._decode(content)["images"]}
+            for item_id in chunk:
+                if item_id in found:
+                    yield item_id
+                else:
+                    report["missing"].append(item_id)
+
+    def _found_names(
+        self, report: DeleteReport, results: Iterable[ChunkResult], found: Set[str]
+    ) -> Iterator[int]:
+        """
+        Yields the ids of the items of the resolved name chunks and adds their names to `found`,
+        the unresolved names are reported.
+        """
+        for chunk, content, error in results:
+            if error:
+                report["unresolved"].extend(chunk)
+                report["errors"].append(error)
+                continue
+            for item in self._decode(content):
+                found.add(item["name"])
+                yield item["id"]
+
+    @staticmethod
+    def _report_missing(report: DeleteReport, item_names: List[str], found: Set[str]):
+        unresolved = set(report["unresolved"])
+        report["missing"] = [
+            i for i in item_names if i not in found and i not in unresolved
+        ]
+
+    @staticmethod
+    def _report_deleted(report: DeleteReport, results: Iterable[ChunkResult]):
+        for chunk, _, error in results:
+            if error:
+                report["failed"].extend(chunk)
+                report["errors"].append(error)
+            else:
+                report["deleted"].extend(chunk)
+
+    @staticmethod
+    def _unmoved(
+        item_names: List[str],
+        in_source: Set[str],
+        in_destination: Set[str],
+        skipped: List[str],
+    ) -> List[str]:
+        """
+        Returns the names of a failed move still in the source folder, to be sent again.
+        The names found in neither folder are added to `skipped`, the ones in the destination were moved.
+        """
+        unmoved = []
+        for name in item_names:
+            if name in in_source:
+                unmoved.append(name)
+            elif name not in in_destination:
+                skipped.append(name)
+        return unmoved
+
+
+class ItemRepository(_ItemRepositoryMixin, BaseHttpRepositry):
+    def _validate_limitations(
+        self,
+        project_id: int,
+        folder_id: int,
+        attachments_count: int,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ):
+        limits = LimitsRepository(self._session).get_limitations(
+            project_id=project_id,
+            folder_id=folder_id,
+            required=attachments_count,
+            folder_limit=folder_limit,
+            project_limit=project_limit,
+            user_limit=user_limit,
+        )
+        self._check_limitations(
+            limits, attachments_count, folder_limit, project_limit, user_limit
+        )
+
     def get_by_id(
         self, project_id: int, folder_id: int, item_id: int
     ) -> BaseItemEntity:
         params = {"project_id": project_id, "folder_id": folder_id}
         response = self._session.request(
-            self.URL_GET_BY_ID.format(item_id=item_id), "get", params=params
+            self.URL_GET_BY_ID.format(item_id=item_id),
+            "get",
+            params=params,
+            hedge=True,
         )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        return self.serialize_entiy(self._session.read_json(response))
 
     def list(self, condition: Condition = None) -> List[BaseItemEntity]:
         data = self._session.paginate(
@@ -123,7 +550,26 @@ class ItemRepository(BaseHttpRepositry):
             data=item.dict(),
             params={"project_id": project_id},
         )
-        return self.serialize_entiy(response.json())
+        return self.serialize_entiy(self._session.read_json(response))
+
+    def _list_by_ids(self, project_id: int, folder_id: int, ids: List[int]):
+        def _list(chunk: Tuple[int, List[int]]) -> Tuple[int, List[dict]]:
+            index, _ids = chunk
+            response = self._session.request(
+                **self._by_ids_request(project_id, folder_id, _ids)
+            )
+            response.raise_for_status()
+            return index, self._session.read_json(response)["images"]
+
+        chunks = sorted(
+            map_threaded(
+                _list,
+                enumerate(chunkify(ids, self.CHUNK_SIZE)),
+                self._session.executor(),
+                self._session.MAX_THREAD_COUNT,
+            )
+        )
+        return [i for _, items in chunks for i in items]
 
     def list_by_ids(
         self,
@@ -131,19 +577,15 @@ class ItemRepository(BaseHttpRepositry):
         folder_id: int,
         ids: List[int],
     ):
-        items = []
-        for i in range(0, len(ids), self.CHUNK_SIZE):
-            response = self._session.request(
-                self.URL_LIST_BY_IDS,
-                "post",
-                json={
-                    "image_ids": ids[i : i + self.CHUNK_SIZE],  # noqa
-                },
-                params={"project_id": project_id, "folder_id": folder_id},
-            )
-            response.raise_for_status()
-            items.extend(response.json()["images"])
-        return self.serialize_entiy(items)
+        return self.serialize_entiy(self._list_by_ids(project_id, folder_id, ids))
+
+    def names_by_ids(
+        self, project_id: int, folder_id: int, ids: List[int]
+    ) -> List[str]:
+        """
+        Resolves item ids to names without building the item entities.
+        """
+        return [i["name"] for i in self._list_by_ids(project_id, folder_id, ids)]
 
     def list_by_names(
         self,
@@ -151,21 +593,20 @@ class ItemRepository(BaseHttpRepositry):
         folder_id: int,
         names: List[str],
     ):
-        chunk_size = 200
         items = []
-        for i in range(0, len(names), chunk_size):
+        window = self._list_by_names_window()
+        for chunk in _adaptive_chunks(names, window):
+            start = time.perf_counter()
             response = self._session.request(
-                self.URL_LIST_BY_NAMES,
-                "post",
-                json={
-                    "project_id": project_id,
-                    "team_id": self._session.team_id,
-                    "folder_id": folder_id,
-                    "names": names[i : i + chunk_size],  # noqa
-                },
+                **self._by_names_request(project_id, folder_id, chunk)
+            )
+            window.record(
+                time.perf_counter() - start,
+                error=not response.ok,
+                size=len(response.content),
             )
             response.raise_for_status()
-            items.extend(response.json())
+            items.extend(self._session.read_json(response))
         return self.serialize_entiy(items)
 
     def attach(
@@ -177,42 +618,34 @@ class ItemRepository(BaseHttpRepositry):
         upload_state: UploadStateEnum,
         meta: Dict[str, AttachmentMeta] = None,
     ) -> Tuple[List[str], List["str"]]:
-        attached, duplicated = [], []
+        attached: List[str] = []
+        duplicated: List[str] = []
         self._validate_limitations(project_id, folder_id, len(attachments))
-
-        for i in range(0, len(attachments), self.ATTACH_CHUNK_SIZE):
-            _attachments = attachments[i : i + self.ATTACH_CHUNK_SIZE]
+        window = self._attach_window()
+        for _attachments in _adaptive_chunks(attachments, window):
             existing_items = self.list_by_names(
                 project_id=project_id,
                 folder_id=folder_id,
                 names=[attachment["name"] for attachment in _attachments],
             )
-            duplicated.extend([image.name for image in existing_items])
-            _data, _metadata = [], {}
-            for _attachment in _attachments:
-                if _attachment["name"] not in duplicated:
-                    _data.append(
-                        {"name": _attachment["name"], "path": _attachment["url"]}
-                    )
-                    _metadata[_attachment["name"]] = {
-                        "width": None,
-                        "height": None,
-                        "_integration_id": _attachment.get("integration_id"),
-                    }
-
-            data = {
-                "project_id": project_id,
-                "folder_id": folder_id,
-                "team_id": self._session.team_id,
-                "images": _data,
-                "annotation_status": annotation_status,
-                "upload_state": upload_state,
-                "meta": meta if meta else _metadata,
-            }
+            existing = {image.name for image in existing_items}
+            duplicated.extend(existing)
+            names, request = self._attach_request(
+                project_id,
+                folder_id,
+                _attachments,
+                existing,
+                annotation_status,
+                upload_state,
+                meta,
+            )
             # todo define output
-            response = self._session.request(self.URL_ATTACH, "post", json=data)
+            start = time.perf_counter()
+            response = self._session.request(**request)
+            window.record(time.perf_counter() - start, error=not response.ok)
             if response.ok:
-                attached.extend([i["name"] for i in _data])
+                attached.extend(names)
+        LimitsRepository(self._session).consume(project_id, folder_id, len(attached))
         return attached, duplicated
 
     def bulk_copy_by_names(
@@ -262,41 +695,34 @@ class ItemRepository(BaseHttpRepositry):
         for i in range(0, len(items_to_copy), self.ATTACH_CHUNK_SIZE):
             _item_names = items_to_copy[i : i + self.ATTACH_CHUNK_SIZE]
             response = self._session.request(
-                self.URL_BULK_COPY_BY_NAMES,
-                "post",
-                params={"project_id": project_id},
-                json={
-                    "is_folder_copy": False,
-                    "image_names": _item_names,
-                    "destination_folder_id": destination_folder_id,
-                    "source_folder_id": source_folder_id,
-                    "include_annotations": include_annotations,
-                    "keep_pin_status": include_pin,
-                },
+                **self._copy_request(
+                    project_id,
+                    source_folder_id,
+                    destination_folder_id,
+                    include_annotations,
+                    include_pin,
+                    _item_names,
+                )
             )
             response.raise_for_status()
             polling = Polling(
                 project_id=project_id,
-                polling_id=response.json()["poll_id"],
+                polling_id=self._session.read_json(response)["poll_id"],
                 trashold=len(_item_names),
             )
             self.await_copy(polling)
+        LimitsRepository(self._session).consume(
+            project_id, destination_folder_id, len(items_to_copy), user_limit=False
+        )
         return list(skipped)
 
     def await_copy(self, polling: Polling):
         await_time = polling.trashold * 0.3
         timeout_start = time.time()
         while time.time() < timeout_start + await_time:
-            response = self._session.request(
-                self.URL_COPY_PROGRESS,
-                "get",
-                params={
-                    "project_id": polling.project_id,
-                    "poll_id": polling.polling_id,
-                },
-            )
+            response = self._session.request(**self._copy_progress_request(polling))
             response.raise_for_status()
-            data = response.json()
+            data = self._session.read_json(response)
             done_count, skipped = data["done"], data["skipped"]
             polling.update(done_count)
             polling.update(skipped)
@@ -312,62 +738,203 @@ class ItemRepository(BaseHttpRepositry):
         destination_folder_id: int,
         item_names: List[str] = None,
     ) -> List[str]:
-        if not item_names:
-            item_names = [
-                i.name
-                for i in self.list(
-                    Condition("project_id", project_id, EQ)
-                    & Condition("folder_id", source_folder_id, EQ)
-                )
-            ]
-        self._validate_limitations(
-            project_id=project_id,
-            folder_id=destination_folder_id,
-            attachments_count=len(item_names),
+        """
+        Returns the names of the items that were not moved.
+        """
+        validate = functools.partial(
+            self._validate_limitations,
+            project_id,
+            destination_folder_id,
+            folder_limit=True,
+            project_limit=True,
             user_limit=False,
         )
-        skipped = []
-        for i in range(0, len(item_names), self.CHUNK_SIZE):
-            response = self._session.request(
-                self.URL_MOVE_MULTIPLE,
-                "post",
-                params={"project_id": project_id},
-                json={
-                    "image_names": item_names[i : i + self.CHUNK_SIZE],
-                    "destination_folder_id": destination_folder_id,
-                    "source_folder_id": source_folder_id,
-                },
+        if item_names:
+            validate(len(item_names))
+        else:
+            # the source names are collected before moving as moved items shift the listing offsets,
+            # the limits are validated against the count of the first page
+            item_names = list(
+                self.iter_names(project_id, source_folder_id, on_count=validate)
             )
-            response.raise_for_status()
-            skipped.extend(response.json()["skipped"])
+        skipped = [
+            name
+            for chunk_skipped in map_threaded(
+                functools.partial(
+                    self._move_chunk,
+                    project_id,
+                    source_folder_id,
+                    destination_folder_id,
+                ),
+                chunkify(item_names, self.CHUNK_SIZE),
+                self._session.executor(),
+                self._session.MAX_THREAD_COUNT,
+            )
+            for name in chunk_skipped
+        ]
+        self._consume_moved(
+            LimitsRepository(self._session),
+            project_id,
+            source_folder_id,
+            destination_folder_id,
+            len(set(item_names) - set(skipped)),
+        )
         return skipped
 
+    def _existing_names(
+        self, project_id: int, folder_id: int, item_names: List[str]
+    ) -> Set[str]:
+        if not item_names:
+            return set()
+        return {i.name for i in self.list_by_names(project_id, folder_id, item_names)}
+
+    def _move_chunk(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        item_names: List[str],
+    ) -> List[str]:
+        """
+        Returns the names of the chunk items that were not moved.
+        A failed move may still have been applied, so the retries only send the names left in the source folder.
+        """
+        request = functools.partial(
+            self._move_request, project_id, source_folder_id, destination_folder_id
+        )
+        skipped: List[str] = []
+        error = None
+        for attempt in range(self.CHUNK_RETRY_LIMIT):
+            if attempt:
+                time.sleep(self.BACK_OFF_FACTOR * attempt)
+                try:
+                    in_source = self._existing_names(
+                        project_id, source_folder_id, item_names
+                    )
+                    in_destination = self._existing_names(
+                        project_id,
+                        destination_folder_id,
+                        [i for i in item_names if i not in in_source],
+                    )
+                except Exception as e:
+                    error = str(e)
+                    break
+                item_names = self._unmoved(
+                    item_names, in_source, in_destination, skipped
+                )
+                if not item_names:
+                    return skipped
+            content, error, retry = self._send_once(request, item_names)
+            if not error:
+                return skipped + self._decode(content)["skipped"]
+            if not retry:
+                break
+        logger.warning(f"Failed to move {len(item_names)} items: {error}")
+        return skipped + item_names
+
+    def iter_items(
+        self,
+        project_id: int,
+        folder_id: int,
+        condition: Condition = None,
+        on_count: Callable[[int], Any] = None,
+    ) -> Iterator[dict]:
+        """
+        Streams the raw folder items matching the condition page by page.
+        :param on_count: called with the total items count once the first page arrives.
+        """
+        for page in self._session.iter_pages(
+            self.URL_LIST,
+            self.CHUNK_SIZE,
+            _folder_condition(project_id, folder_id, condition).get_as_params_dict(),
+            on_count=on_count,
+        ):
+            yield from page
+
+    def iter_names(
+        self,
+        project_id: int,
+        folder_id: int,
+        condition: Condition = None,
+        on_count: Callable[[int], Any] = None,
+    ) -> Iterator[str]:
+        for item in self.iter_items(project_id, folder_id, condition, on_count):
+            yield item["name"]
+
+    def _name_chunks(
+        self, project_id: int, folder_id: int, item_names: Optional[List[str]], size
+    ) -> Iterable[List[str]]:
+        if item_names:
+            return chunkify(item_names, size)
+        return chunkify_iter(self.iter_names(project_id, folder_id), size)
+
+    def _send_once(
+        self, request: Callable[[Any], Dict[str, Any]], chunk: Any
+    ) -> Tuple[bytes, Optional[str], bool]:
+        """
+        Returns the response body, the error and whether the failed request may be retried.
+        """
+        try:
+            response = self._session.request(**request(chunk))
+        except Exception as e:
+            return b"", str(e), True
+        if response.ok:
+            return response.content, None, False
+        return (
+            b"",
+            f"{response.status_code}: {response.text}",
+            response.status_code >= 500,
+        )
+
+    def _send_chunk(
+        self, request: Callable[[Any], Dict[str, Any]], chunk: Any
+    ) -> ChunkResult:
+        error = None
+        for attempt in range(self.CHUNK_RETRY_LIMIT):
+            if attempt:
+                time.sleep(self.BACK_OFF_FACTOR * attempt)
+            content, error, retry = self._send_once(request, chunk)
+            if not error:
+                return chunk, content, None
+            if not retry:
+                break
+        return chunk, b"", error
+
+    def _send_chunks(
+        self, request: Callable[[Any], Dict[str, Any]], chunks: Iterable
+    ) -> Iterator[ChunkResult]:
+        """
+        Sends the requests built for the chunks concurrently, retrying the failed ones.
+        Yields the results in completion order.
+        """
+        return map_threaded(
+            functools.partial(self._send_chunk, request),
+            chunks,
+            self._session.executor(),
+            self._session.MAX_THREAD_COUNT,
+        )
+
     def set_statuses(
         self,
         project_id: int,
         folder_id: int,
         annotation_status: AnnotationStatus,
         item_names: List[str] = None,
-    ):
-        if not item_names:
-            item_names = [
-                i.name
-                for i in self.list(
-                    Condition("project_id", project_id, EQ)
-                    & Condition("folder_id", folder_id, EQ)
-                )
-            ]
-        response = self._session.request(
-            self.URL_SET_ANNOTATION_STATUSES,
-            "put",
-            params={"project_id": project_id},
-            json={
-                "folder_id": folder_id,
-                "annotation_status": annotation_status,
-                "image_names": item_names,
-            },
+    ) -> BulkReport:
+        """
+        Without item_names the statuses of all folder items are set.
+        """
+        return self._bulk_report(
+            self._send_chunks(
+                functools.partial(
+                    self._status_request, project_id, folder_id, annotation_status
+                ),
+                self._name_chunks(
+                    project_id, folder_id, item_names, self.STATUS_CHUNK_SIZE
+                ),
+            ),
+            "set the annotation status of",
         )
-        response.raise_for_status()
 
     def set_approval_statuses(
         self,
@@ -375,80 +942,715 @@ class ItemRepository(BaseHttpRepositry):
         folder_id: int,
         approval_status: ApprovalStatus,
         item_names: List[str] = None,
-    ):
-        if not item_names:
-            item_names = [
-                i.name
-                for i in self.list(
-                    Condition("project_id", project_id, EQ)
-                    & Condition("folder_id", folder_id, EQ)
-                )
-            ]
-        response = self._session.request(
-            self.URL_SET_APPROVAL_STATUSES,
-            "post",
-            params={"project_id": project_id, "folder_id": folder_id},
-            json={
-                "item_names": item_names,
-                "change_actions": {
-                    "APPROVAL_STATUS": approval_status
-                    if approval_status.value
-                    else None
-                },
-            },
+    ) -> BulkReport:
+        """
+        Without item_names the statuses of all folder items are set.
+        """
+        return self._bulk_report(
+            self._send_chunks(
+                functools.partial(
+                    self._approval_request, project_id, folder_id, approval_status
+                ),
+                self._name_chunks(
+                    project_id, folder_id, item_names, self.STATUS_CHUNK_SIZE
+                ),
+            ),
+            "set the approval status of",
         )
-        response.raise_for_status()
 
-    def bulk_delete(self, project_id: int, folder_id: int, item_ids: List[int]):
-        self._session.request(
-            self.URL_DELETE_ITEMS,
-            "put",
-            params={"project_id": project_id, "folder_id": folder_id},
-            data={"image_ids": item_ids},
+    def bulk_delete(
+        self, project_id: int, folder_id: int, item_ids: Iterable[int]
+    ) -> DeleteReport:
+        """
+        Resolves the ids and deletes the found items in DELETE_CHUNK_SIZE batches sent concurrently.
+        Ids missing from the folder and ids that failed to resolve are reported.
+        """
+        report = self._delete_report()
+        item_ids = self._found_ids(
+            report,
+            self._send_chunks(
+                functools.partial(self._by_ids_request, project_id, folder_id),
+                chunkify_iter(item_ids, self.CHUNK_SIZE),
+            ),
         )
-        return True
+        return self._delete_chunks(project_id, folder_id, item_ids, report)
+
+    def _delete_chunks(
+        self,
+        project_id: int,
+        folder_id: int,
+        item_ids: Iterable[int],
+        report: DeleteReport,
+    ) -> DeleteReport:
+        self._report_deleted(
+            report,
+            self._send_chunks(
+                functools.partial(self._delete_request, project_id, folder_id),
+                chunkify_iter(item_ids, self.DELETE_CHUNK_SIZE),
+            ),
+        )
+        LimitsRepository(self._session).consume(
+            project_id, folder_id, -len(report["deleted"]), user_limit=False
+        )
+        return report
+
+    def delete_by_names(
+        self, project_id: int, folder_id: int, item_names: List[str]
+    ) -> DeleteReport:
+        """
+        Resolves the names to ids and deletes them while the resolution is still running.
+        Names missing from the folder and names that failed to resolve are reported.
+        """
+        report = self._delete_report()
+        found: Set[str] = set()
+        item_ids = self._found_names(
+            report,
+            self._send_chunks(
+                functools.partial(self._by_names_request, project_id, folder_id),
+                chunkify(item_names, self.LIST_BY_NAMES_CHUNK_SIZE),
+            ),
+            found,
+        )
+        self._delete_chunks(project_id, folder_id, item_ids, report)
+        self._report_missing(report, item_names, found)
+        return report
 
     def assign_items(
         self,
         project_id: int,
         folder_id: int,
         user_id: str,
-        item_names: List[str],
+        item_names: Iterable[str],
     ) -> int:
         """
         Returns successed items count.
         """
-        _count = 0
-        for chunk in chunkify(item_names, self.ASSIGN_CHUNK_SIZE):
-            response = self._session.request(
-                self.URL_ASSIGN_ITEMS,
-                "put",
-                params={"project_id": project_id},
-                data={
-                    "image_names": chunk,
-                    "assign_user_id": user_id,
-                    "folder_id": folder_id,
-                },
+        return self._assigned_count(
+            self._send_chunks(
+                functools.partial(self._assign_request, project_id, folder_id),
+                (
+                    (user_id, chunk)
+                    for chunk in chunkify_iter(item_names, self.ASSIGN_CHUNK_SIZE)
+                ),
             )
-            response.raise_for_status()
-            _count += response.json()["successCount"]
-        return _count
+        )
+
+    def assign_items_to_users(
+        self,
+        project_id: int,
+        folder_id: int,
+        assignments: Dict[str, List[str]],
+    ) -> int:
+        """
+        Assigns each user its item names, the chunks of all users are sent concurrently.
+        Returns successed items count.
+        """
+        return self._assigned_count(
+            self._send_chunks(
+                functools.partial(self._assign_request, project_id, folder_id),
+                (
+                    (user_id, chunk)
+                    for user_id, item_names in assignments.items()
+                    for chunk in chunkify(item_names, self.ASSIGN_CHUNK_SIZE)
+                ),
+            )
+        )
 
     def unassign_items(
         self,
         project_id: int,
         folder_id: int,
-        item_names: List[str],
+        item_names: Iterable[str],
+    ) -> BulkReport:
+        return self._bulk_report(
+            self._send_chunks(
+                functools.partial(self._unassign_request, project_id, folder_id),
+                chunkify_iter(item_names, self.ASSIGN_CHUNK_SIZE),
+            ),
+            "unassign",
+        )
+
+
+class AsyncItemRepository(_ItemRepositoryMixin, BaseAsyncHttpRepositry):
+    async def _gather(self, coroutines) -> list:
+        return await gather_adaptive(
+            coroutines,
+            self._session.window(
+                self.CONCURRENCY_WINDOW,
+                self._session.MAX_COROUTINE_COUNT,
+                maximum=self._session.MAX_COROUTINE_COUNT * 4,
+            ),
+        )
+
+    async def _validate_limitations(
+        self,
+        project_id: int,
+        folder_id: int,
+        attachments_count: int,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
     ):
-        for chunk in chunkify(item_names, self.ASSIGN_CHUNK_SIZE):
-            response = self._session.request(
-                self.URL_ASSIGN_ITEMS,
-                "put",
-                params={"project_id": project_id},
-                data={
-                    "image_names": chunk,
-                    "remove_user_ids": ["all"],
-                    "folder_id": folder_id,
-                },
+        limits = await AsyncLimitsRepository(self._session).get_limitations(
+            project_id=project_id,
+            folder_id=folder_id,
+            required=attachments_count,
+            folder_limit=folder_limit,
+            project_limit=project_limit,
+            user_limit=user_limit,
+        )
+        self._check_limitations(
+            limits, attachments_count, folder_limit, project_limit, user_limit
+        )
+
+    async def _folder_item_names(self, project_id: int, folder_id: int) -> List[str]:
+        return [i async for i in self.iter_names(project_id, folder_id)]
+
+    async def get_by_id(
+        self, project_id: int, folder_id: int, item_id: int
+    ) -> BaseItemEntity:
+        response = await self._session.arequest(
+            self.URL_GET_BY_ID.format(item_id=item_id),
+            "get",
+            params={"project_id": project_id, "folder_id": folder_id},
+            hedge=True,
+        )
+        return self.serialize_entiy(await self._session.aread_json(response))
+
+    async def list(self, condition: Condition = None) -> List[BaseItemEntity]:
+        data = await self._session.apaginate(
+            url=self.URL_LIST,
+            chunk_size=self.CHUNK_SIZE,
+            query_params=condition.get_as_params_dict() if condition else {},
+        )
+        return self.serialize_entiy(data)
+
+    async def update(self, project_id: int, item: BaseItemEntity):
+        response = await self._session.arequest(
+            self.URL_GET_BY_ID.format(item_id=item.id),
+            "put",
+            data=item.dict(),
+            params={"project_id": project_id},
+        )
+        return self.serialize_entiy(await self._session.aread_json(response))
+
+    async def _list_by_ids(self, project_id: int, folder_id: int, ids: List[int]):
+        async def _list(chunk: List[int]) -> List[dict]:
+            response = await self._session.arequest(
+                **self._by_ids_request(project_id, folder_id, chunk)
             )
-            response.raise_for_status()
+            return (await self._session.aread_json(response))["images"]
+
+        chunks = await self._gather(
+            _list(chunk) for chunk in chunkify(ids, self.CHUNK_SIZE)
+        )
+        return [i for chunk in chunks for i in chunk]
+
+    async def list_by_ids(self, project_id: int, folder_id: int, ids: List[int]):
+        return self.serialize_entiy(await self._list_by_ids(project_id, folder_id, ids))
+
+    async def names_by_ids(
+        self, project_id: int, folder_id: int, ids: List[int]
+    ) -> List[str]:
+        return [i["name"] for i in await self._list_by_ids(project_id, folder_id, ids)]
+
+    async def _list_by_names(
+        self, project_id: int, folder_id: int, names: List[str]
+    ) -> List[dict]:
+        window = self._list_by_names_window()
+
+        async def _list(chunk: List[str]) -> List[dict]:
+            start = time.perf_counter()
+            try:
+                response = await self._session.arequest(
+                    **self._by_names_request(project_id, folder_id, chunk)
+                )
+                content = await response.read()
+            except aiohttp.ClientError:
+                window.record(time.perf_counter() - start, error=True)
+                raise
+            window.record(time.perf_counter() - start, size=len(content))
+            return self._decode(content)
+
+        chunks = await self._gather(
+            _list(chunk) for chunk in _adaptive_chunks(names, window)
+        )
+        return [i for chunk in chunks for i in chunk]
+
+    async def list_by_names(self, project_id: int, folder_id: int, names: List[str]):
+        return self.serialize_entiy(
+            await self._list_by_names(project_id, folder_id, names)
+        )
+
+    async def attach(
+        self,
+        project_id: int,
+        folder_id: int,
+        attachments: List[Attachment],
+        annotation_status: AnnotationStatus,
+        upload_state: UploadStateEnum,
+        meta: Dict[str, AttachmentMeta] = None,
+    ) -> Tuple[List[str], List[str]]:
+        await self._validate_limitations(project_id, folder_id, len(attachments))
+        window = self._attach_window()
+
+        async def _attach(_attachments: List[Attachment]) -> Tuple[List, List]:
+            existing_items = await self._list_by_names(
+                project_id, folder_id, [i["name"] for i in _attachments]
+            )
+            existing = {i["name"] for i in existing_items}
+            names, request = self._attach_request(
+                project_id,
+                folder_id,
+                _attachments,
+                existing,
+                annotation_status,
+                upload_state,
+                meta,
+            )
+            start = time.perf_counter()
+            try:
+                response = await self._session.arequest(**request)
+                response.release()
+            except aiohttp.ClientResponseError:
+                window.record(time.perf_counter() - start, error=True)
+                names = []
+            else:
+                window.record(time.perf_counter() - start)
+            return names, list(existing)
+
+        results = await self._gather(
+            _attach(chunk) for chunk in _adaptive_chunks(attachments, window)
+        )
+        attached = [name for attached, _ in results for name in attached]
+        await AsyncLimitsRepository(self._session).consume(
+            project_id, folder_id, len(attached)
+        )
+        return attached, [name for _, duplicated in results for name in duplicated]
+
+    async def bulk_copy_by_names(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        item_names: List[str] = None,
+        include_annotations: bool = False,
+        include_pin: bool = False,
+    ) -> List[str]:
+        """
+        Returns list of skipped item names.
+        """
+        skipped = set()
+        if not item_names:
+            existing_item_names = await self._folder_item_names(
+                project_id, source_folder_id
+            )
+        else:
+            existing_item_names = [
+                i["name"]
+                for i in await self._list_by_names(
+                    project_id, source_folder_id, item_names
+                )
+            ]
+            skipped.update(set(item_names) - set(existing_item_names))
+        existing_in_destination = await self._list_by_names(
+            project_id, destination_folder_id, existing_item_names
+        )
+        skipped.update({i["name"] for i in existing_in_destination})
+        items_to_copy = list(set(existing_item_names) - skipped)
+        await self._validate_limitations(
+            project_id=project_id,
+            folder_id=destination_folder_id,
+            attachments_count=len(items_to_copy),
+            user_limit=False,
+        )
+
+        async def _copy(_item_names: List[str]):
+            response = await self._session.arequest(
+                **self._copy_request(
+                    project_id,
+                    source_folder_id,
+                    destination_folder_id,
+                    include_annotations,
+                    include_pin,
+                    _item_names,
+                )
+            )
+            polling = Polling(
+                project_id=project_id,
+                polling_id=(await self._session.aread_json(response))["poll_id"],
+                trashold=len(_item_names),
+            )
+            await self.await_copy(polling)
+
+        await self._gather(
+            _copy(chunk) for chunk in chunkify(items_to_copy, self.ATTACH_CHUNK_SIZE)
+        )
+        await AsyncLimitsRepository(self._session).consume(
+            project_id, destination_folder_id, len(items_to_copy), user_limit=False
+        )
+        return list(skipped)
+
+    async def await_copy(self, polling: Polling):
+        await_time = polling.trashold * 0.3
+        timeout_start = time.time()
+        while time.time() < timeout_start + await_time:
+            response = await self._session.arequest(
+                **self._copy_progress_request(polling)
+            )
+            data = await self._session.aread_json(response)
+            polling.update(data["done"])
+            polling.update(data["skipped"])
+            if polling.is_finished():
+                break
+            await asyncio.sleep(4)
+        return True
+
+    async def bulk_move_by_names(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        item_names: List[str] = None,
+    ) -> List[str]:
+        """
+        Returns the names of the items that were not moved.
+        """
+
+        async def validate(count: int):
+            await self._validate_limitations(
+                project_id=project_id,
+                folder_id=destination_folder_id,
+                attachments_count=count,
+                user_limit=False,
+            )
+
+        if item_names:
+            await validate(len(item_names))
+        else:
+            # validated against the count of the first page, before listing the rest
+            counts: List[int] = []
+            item_names = []
+            async for name in self.iter_names(
+                project_id, source_folder_id, on_count=counts.append
+            ):
+                if not item_names:
+                    await validate(counts[0])
+                item_names.append(name)
+        skipped = [
+            name
+            for chunk_skipped in await self._gather(
+                self._move_chunk(
+                    project_id, source_folder_id, destination_folder_id, chunk
+                )
+                for chunk in chunkify(item_names, self.CHUNK_SIZE)
+            )
+            for name in chunk_skipped
+        ]
+        self._consume_moved(
+            LimitsRepository(self._session),
+            project_id,
+            source_folder_id,
+            destination_folder_id,
+            len(set(item_names) - set(skipped)),
+        )
+        return skipped
+
+    async def _existing_names(
+        self, project_id: int, folder_id: int, item_names: List[str]
+    ) -> Set[str]:
+        if not item_names:
+            return set()
+        return {
+            i["name"]
+            for i in await self._list_by_names(project_id, folder_id, item_names)
+        }
+
+    async def _move_chunk(
+        self,
+        project_id: int,
+        source_folder_id: int,
+        destination_folder_id: int,
+        item_names: List[str],
+    ) -> List[str]:
+        """
+        Returns the names of the chunk items that were not moved.
+        A failed move may still have been applied, so the retries only send the names left in the source folder.
+        """
+        request = functools.partial(
+            self._move_request, project_id, source_folder_id, destination_folder_id
+        )
+        skipped: List[str] = []
+        error = None
+        for attempt in range(self.CHUNK_RETRY_LIMIT):
+            if attempt:
+                await asyncio.sleep(self.BACK_OFF_FACTOR * attempt)
+                try:
+                    in_source = await self._existing_names(
+                        project_id, source_folder_id, item_names
+                    )
+                    in_destination = await self._existing_names(
+                        project_id,
+                        destination_folder_id,
+                        [i for i in item_names if i not in in_source],
+                    )
+                except aiohttp.ClientError as e:
+                    error = str(e)
+                    break
+                item_names = self._unmoved(
+                    item_names, in_source, in_destination, skipped
+                )
+                if not item_names:
+                    return skipped
+            content, error, retry = await self._send_once(
+                request, item_names, retry=False
+            )
+            if not error:
+                return skipped + self._decode(content)["skipped"]
+            if not retry:
+                break
+        logger.warning(f"Failed to move {len(item_names)} items: {error}")
+        return skipped + item_names
+
+    async def iter_items(
+        self,
+        project_id: int,
+        folder_id: int,
+        condition: Condition = None,
+        on_count: Callable[[int], Any] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Streams the raw folder items matching the condition page by page.
+        """
+        async for page in self._session.aiter_pages(
+            self.URL_LIST,
+            self.CHUNK_SIZE,
+            _folder_condition(project_id, folder_id, condition).get_as_params_dict(),
+            on_count=on_count,
+        ):
+            for item in page:
+                yield item
+
+    async def iter_names(
+        self,
+        project_id: int,
+        folder_id: int,
+        condition: Condition = None,
+        on_count: Callable[[int], Any] = None,
+    ) -> AsyncIterator[str]:
+        async for item in self.iter_items(project_id, folder_id, condition, on_count):
+            yield item["name"]
+
+    def _name_chunks(
+        self, project_id: int, folder_id: int, item_names: Optional[List[str]], size
+    ) -> Union[Iterable[List[str]], AsyncIterator[List[str]]]:
+        if item_names:
+            return chunkify(item_names, size)
+        return achunkify_iter(self.iter_names(project_id, folder_id), size)
+
+    async def _send_once(
+        self, request: Callable[[Any], Dict[str, Any]], chunk: Any, retry=True
+    ) -> Tuple[bytes, Optional[str], bool]:
+        """
+        Returns the response body, the error and whether the failed request may be retried.
+        :param retry: let the session resend the request on a 502, 503 or 504.
+        """
+        try:
+            response = await self._session.arequest(**request(chunk), retry=retry)
+            return await response.read(), None, False
+        except aiohttp.ClientResponseError as e:
+            return b"", f"{e.status}: {e.message}", e.status >= 500
+        except aiohttp.ClientError as e:
+            return b"", str(e), True
+
+    async def _send_chunk(
+        self, request: Callable[[Any], Dict[str, Any]], chunk: Any
+    ) -> ChunkResult:
+        error = None
+        for attempt in range(self.CHUNK_RETRY_LIMIT):
+            if attempt:
+                await asyncio.sleep(self.BACK_OFF_FACTOR * attempt)
+            content, error, retry = await self._send_once(request, chunk)
+            if not error:
+                return chunk, content, None
+            if not retry:
+                break
+        return chunk, b"", error
+
+    async def _send_chunks(
+        self,
+        request: Callable[[Any], Dict[str, Any]],
+        chunks: Union[Iterable, AsyncIterable],
+    ) -> List[ChunkResult]:
+        """
+        Chunks of an async iterable are pulled as the sent ones complete.
+        """
+        if isinstance(chunks, AsyncIterable):
+            return await self._gather(
+                self._send_chunk(request, chunk) async for chunk in chunks
+            )
+        return await self._gather(self._send_chunk(request, chunk) for chunk in chunks)
+
+    async def set_statuses(
+        self,
+        project_id: int,
+        folder_id: int,
+        annotation_status: AnnotationStatus,
+        item_names: List[str] = None,
+    ) -> BulkReport:
+        return self._bulk_report(
+            await self._send_chunks(
+                functools.partial(
+                    self._status_request, project_id, folder_id, annotation_status
+                ),
+                self._name_chunks(
+                    project_id, folder_id, item_names, self.STATUS_CHUNK_SIZE
+                ),
+            ),
+            "set the annotation status of",
+        )
+
+    async def set_approval_statuses(
+        self,
+        project_id: int,
+        folder_id: int,
+        approval_status: ApprovalStatus,
+        item_names: List[str] = None,
+    ) -> BulkReport:
+        return self._bulk_report(
+            await self._send_chunks(
+                functools.partial(
+                    self._approval_request, project_id, folder_id, approval_status
+                ),
+                self._name_chunks(
+                    project_id, folder_id, item_names, self.STATUS_CHUNK_SIZE
+                ),
+            ),
+            "set the approval status of",
+        )
+
+    async def bulk_delete(
+        self, project_id: int, folder_id: int, item_ids: List[int]
+    ) -> DeleteReport:
+        """
+        Resolves the ids and deletes the found items,
+        ids missing from the folder and ids that failed to resolve are reported.
+        """
+        report = self._delete_report()
+        found_ids = list(
+            self._found_ids(
+                report,
+                await self._send_chunks(
+                    functools.partial(self._by_ids_request, project_id, folder_id),
+                    chunkify(item_ids, self.CHUNK_SIZE),
+                ),
+            )
+        )
+        return await self._delete_chunks(project_id, folder_id, found_ids, report)
+
+    async def _delete_chunks(
+        self,
+        project_id: int,
+        folder_id: int,
+        item_ids: List[int],
+        report: DeleteReport,
+    ) -> DeleteReport:
+        self._report_deleted(
+            report,
+            await self._send_chunks(
+                functools.partial(self._delete_request, project_id, folder_id),
+                chunkify(item_ids, self.DELETE_CHUNK_SIZE),
+            ),
+        )
+        await AsyncLimitsRepository(self._session).consume(
+            project_id, folder_id, -len(report["deleted"]), user_limit=False
+        )
+        return report
+
+    async def delete_by_names(
+        self, project_id: int, folder_id: int, item_names: List[str]
+    ) -> DeleteReport:
+        """
+        Names missing from the folder and names that failed to resolve are reported.
+        """
+        report = self._delete_report()
+        found: Set[str] = set()
+        item_ids = list(
+            self._found_names(
+                report,
+                await self._send_chunks(
+                    functools.partial(self._by_names_request, project_id, folder_id),
+                    chunkify(item_names, self.LIST_BY_NAMES_CHUNK_SIZE),
+                ),
+                found,
+            )
+        )
+        await self._delete_chunks(project_id, folder_id, item_ids, report)
+        self._report_missing(report, item_names, found)
+        return report
+
+    @staticmethod
+    def _chunks(
+        item_names: Union[List[str], AsyncIterable[str]], size: int
+    ) -> Union[Iterable[List[str]], AsyncIterator[List[str]]]:
+        if isinstance(item_names, AsyncIterable):
+            return achunkify_iter(item_names, size)
+        return chunkify(item_names, size)
+
+    async def assign_items(
+        self,
+        project_id: int,
+        folder_id: int,
+        user_id: str,
+        item_names: Union[List[str], AsyncIterable[str]],
+    ) -> int:
+        """
+        Returns successed items count.
+        The chunks of streamed names are sent while the rest is listed.
+        """
+        chunks = self._chunks(item_names, self.ASSIGN_CHUNK_SIZE)
+        request = functools.partial(self._assign_request, project_id, folder_id)
+        if isinstance(chunks, AsyncIterable):
+            return self._assigned_count(
+                await self._send_chunks(
+                    request, ((user_id, chunk) async for chunk in chunks)
+                )
+            )
+        return self._assigned_count(
+            await self._send_chunks(request, ((user_id, chunk) for chunk in chunks))
+        )
+
+    async def assign_items_to_users(
+        self,
+        project_id: int,
+        folder_id: int,
+        assignments: Dict[str, List[str]],
+    ) -> int:
+        """
+        Assigns each user its item names, the chunks of all users are sent concurrently.
+        Returns successed items count.
+        """
+        return self._assigned_count(
+            await self._send_chunks(
+                functools.partial(self._assign_request, project_id, folder_id),
+                (
+                    (user_id, chunk)
+                    for user_id, item_names in assignments.items()
+                    for chunk in chunkify(item_names, self.ASSIGN_CHUNK_SIZE)
+                ),
+            )
+        )
+
+    async def unassign_items(
+        self,
+        project_id: int,
+        folder_id: int,
+        item_names: Union[List[str], AsyncIterable[str]],
+    ) -> BulkReport:
+        return self._bulk_report(
+            await self._send_chunks(
+                functools.partial(self._unassign_request, project_id, folder_id),
+                self._chunks(item_names, self.ASSIGN_CHUNK_SIZE),
+            ),
+            "unassign",
+        )
@@ -1,3 +1,6 @@
+import copy
+from typing import Optional
+
 from superannotate_core.infrastructure.repositories.base import BaseRepositry
 from typing_extensions import TypedDict
 
@@ -13,14 +16,159 @@ class UserLimits(TypedDict):
     folder_limit: Limit
 
 
+class LimitsCache:
+    """
+    Session wide cache of the folder limits. The SDK decrements the cached remaining counts
+    as it adds items, so that bulk writes do not have to fetch the limits every time.
+    The limits are fetched again when they expire or when a write would use up most of
+    the remaining count.
+    """
+
+    NAME = "limits"
+    TTL = 30
+    REVALIDATE_RATIO = 0.9
+
+    def __init__(self, session):
+        self._cache = session.cache(self.NAME, self.TTL)
+
+    def get(
+        self,
+        project_id: int,
+        folder_id: int,
+        required: int = 0,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ) -> Optional[UserLimits]:
+        limits: UserLimits = self._cache.get((project_id, folder_id))
+        if limits is None:
+            return None
+        checked = (
+            (folder_limit, limits.get("folder_limit")),
+            (project_limit, limits.get("project_limit")),
+            (user_limit, limits.get("user_limit")),
+        )
+        for enabled, limit in checked:
+            if (
+                enabled
+                and limit
+                and required > limit["remaining_image_count"] * self.REVALIDATE_RATIO
+            ):
+                return None
+        return copy.deepcopy(limits)
+
+    def set(self, project_id: int, folder_id: int, limits: UserLimits):
+        self._cache.set((project_id, folder_id), copy.deepcopy(limits))
+
+    def consume(
+        self,
+        project_id: int,
+        folder_id: int,
+        count: int,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ):
+        """
+        Accounts for `count` items added to the folder, negative counts release the capacity.
+        """
+        with self._cache.lock:
+            for (_project_id, _folder_id), limits in self._cache.items():
+                if folder_limit and (_project_id, _folder_id) == (
+                    project_id,
+                    folder_id,
+                ):
+                    limits["folder_limit"]["remaining_image_count"] -= count
+                if project_limit and _project_id == project_id:
+                    limits["project_limit"]["remaining_image_count"] -= count
+                if user_limit and "user_limit" in limits:
+                    limits["user_limit"]["remaining_image_count"] -= count
+
+    def invalidate(self, project_id: int, folder_id: int):
+        self._cache.pop((project_id, folder_id))
+
+
 class LimitsRepository(BaseRepositry):
     URL_GET_LIMITS = "project/{project_id}/limitationDetails"
 
-    def get_limitations(self, project_id: int, folder_id) -> UserLimits:
+    def get_limitations(
+        self,
+        project_id: int,
+        folder_id,
+        required: int = 0,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ) -> UserLimits:
+        """
+        :param required: count of the items about to be added, near the limit the cached limits are refreshed.
+        """
+        cache = LimitsCache(self._session)
+        limits = cache.get(
+            project_id, folder_id, required, folder_limit, project_limit, user_limit
+        )
+        if limits is not None:
+            return limits
         response = self._session.request(
             self.URL_GET_LIMITS.format(project_id=project_id),
             "get",
             params={"folder_id": folder_id},
         )
         response.raise_for_status()
-        return response.json()
+        limits = self._session.read_json(response)
+        cache.set(project_id, folder_id, limits)
+        return limits
+
+    def consume(
+        self,
+        project_id: int,
+        folder_id: int,
+        count: int,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ):
+        LimitsCache(self._session).consume(
+            project_id, folder_id, count, folder_limit, project_limit, user_limit
+        )
+
+
+class AsyncLimitsRepository(BaseRepositry):
+    URL_GET_LIMITS = LimitsRepository.URL_GET_LIMITS
+
+    async def get_limitations(
+        self,
+        project_id: int,
+        folder_id,
+        required: int = 0,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ) -> UserLimits:
+        cache = LimitsCache(self._session)
+        limits = cache.get(
+            project_id, folder_id, required, folder_limit, project_limit, user_limit
+        )
+        if limits is not None:
+            return limits
+        response = await self._session.arequest(
+            self.URL_GET_LIMITS.format(project_id=project_id),
+            "get",
+            params={"folder_id": folder_id},
+        )
+        limits = await self._session.aread_json(response)
+        cache.set(project_id, folder_id, limits)
+        return limits
+
+    async def consume(
+        self,
+        project_id: int,
+        folder_id: int,
+        count: int,
+        folder_limit=True,
+        project_limit=True,
+        user_limit=True,
+    ):
+        LimitsCache(self._session).consume(
+            project_id, folder_id, count, folder_limit, project_limit, user_limit
+        )
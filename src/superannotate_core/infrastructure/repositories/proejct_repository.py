@@ -2,6 +2,7 @@ from typing import List
 
 from superannotate_core.core.conditions import Condition
 from superannotate_core.core.entities import ProjectEntity
+from superannotate_core.infrastructure.repositories.base import BaseAsyncHttpRepositry
 from superannotate_core.infrastructure.repositories.base import BaseHttpRepositry
 
 
@@ -17,7 +18,7 @@ class ProjectRepository(BaseHttpRepositry):
             "get",
         )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        return self.serialize_entiy(self._session.read_json(response))
 
     def list(self, condition: Condition) -> List[ProjectEntity]:
         data = self._session.paginate(
@@ -29,7 +30,7 @@ class ProjectRepository(BaseHttpRepositry):
     def create(self, entity: ProjectEntity) -> ProjectEntity:
         response = self._session.request(self.URL_CREATE, "post", data=entity.to_json())
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        return self.serialize_entiy(self._session.read_json(response))
 
     def update(self, entity: ProjectEntity) -> ProjectEntity:
         response = self._session.request(
@@ -38,7 +39,48 @@ class ProjectRepository(BaseHttpRepositry):
             data=entity.to_json(),
         )
         response.raise_for_status()
-        return self.serialize_entiy(response.json())
+        return self.serialize_entiy(self._session.read_json(response))
 
     def delete(self, pk: int) -> None:
         return self._session.request(self.URL_RETRIEVE.format(pk), "delete")
+
+
+class AsyncProjectRepository(BaseAsyncHttpRepositry):
+    ENTITY = ProjectEntity
+    URL_CREATE = ProjectRepository.URL_CREATE
+    URL_LIST = ProjectRepository.URL_LIST
+    URL_RETRIEVE = ProjectRepository.URL_RETRIEVE
+
+    async def get_by_id(self, pk: int) -> ProjectEntity:
+        response = await self._session.arequest(
+            self.URL_RETRIEVE.format(project_id=pk),
+            "get",
+        )
+        return self.serialize_entiy(await self._session.aread_json(response))
+
+    async def list(self, condition: Condition) -> List[ProjectEntity]:
+        data = await self._session.apaginate(
+            url=self.URL_LIST,
+            query_params=condition.get_as_params_dict() if condition else {},
+        )
+        return self.serialize_entiy(data)
+
+    async def create(self, entity: ProjectEntity) -> ProjectEntity:
+        response = await self._session.arequest(
+            self.URL_CREATE, "post", data=entity.to_json()
+        )
+        return self.serialize_entiy(await self._session.aread_json(response))
+
+    async def update(self, entity: ProjectEntity) -> ProjectEntity:
+        response = await self._session.arequest(
+            self.URL_RETRIEVE.format(project_id=entity.id),
+            "put",
+            data=entity.to_json(),
+        )
+        return self.serialize_entiy(await self._session.aread_json(response))
+
+    async def delete(self, pk: int) -> None:
+        response = await self._session.arequest(
+            self.URL_RETRIEVE.format(project_id=pk), "delete"
+        )
+        response.release()
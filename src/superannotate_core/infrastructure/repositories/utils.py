@@ -1,14 +1,39 @@
 import asyncio
 import copy
 import io
-import json
+import itertools
 import logging
 import os
+import time
 import typing
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from threading import Thread
 from typing import Callable
 
 import aiohttp
+from superannotate_core.infrastructure.adaptive import AdaptiveWindow
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.codecs import JSONCodec
+from superannotate_core.infrastructure.hedging import Hedger
+from superannotate_core.infrastructure.instrumentation import endpoint_of
+from superannotate_core.infrastructure.instrumentation import Instrumentation
+from superannotate_core.infrastructure.instrumentation import REQUEST_BYTES_IN
+from superannotate_core.infrastructure.instrumentation import REQUEST_BYTES_OUT
+from superannotate_core.infrastructure.instrumentation import REQUEST_DURATION
+from superannotate_core.infrastructure.instrumentation import REQUEST_RETRIES
+from superannotate_core.infrastructure.instrumentation import STREAM_ANNOTATIONS
+from superannotate_core.infrastructure.instrumentation import STREAM_BYTES_IN
+from superannotate_core.infrastructure.instrumentation import (
+    STREAM_DECODE_DURATION,
+)
+from superannotate_core.infrastructure.instrumentation import STREAM_DURATION
+from superannotate_core.infrastructure.journal import DownloadJournal
+from superannotate_core.infrastructure.store import AnnotationStore
+from superannotate_core.infrastructure.transport import aio_exchange
+from superannotate_core.infrastructure.transport import Cassette
+from superannotate_core.infrastructure.transport import compress_payload
 
 logger = logging.getLogger(__name__)
 
@@ -58,44 +83,295 @@ def run_async(f):
     return response[0]
 
 
+async def gather_bounded(
+    coroutines: typing.Iterable[typing.Awaitable], limit: int
+) -> list:
+    """
+    Like asyncio.gather, with at most `limit` coroutines awaited at a time.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*[_run(i) for i in coroutines])
+
+
+async def gather_adaptive(
+    coroutines: typing.Union[
+        typing.Iterable[typing.Coroutine], typing.AsyncIterable[typing.Coroutine]
+    ],
+    window: AdaptiveWindow,
+) -> list:
+    """
+    Like asyncio.gather, with at most `window.value` coroutines awaited at a time.
+    The coroutines are taken from the (async) iterable as the running ones finish.
+    The duration and failure of every coroutine is recorded to the window, the remaining ones are
+    cancelled once one fails.
+    """
+    results: dict = {}
+    pending: set = set()
+    aiterator: typing.Optional[typing.AsyncIterator[typing.Coroutine]] = None
+    iterator: typing.Iterator[typing.Coroutine] = iter(())
+    if isinstance(coroutines, typing.AsyncIterable):
+        aiterator = coroutines.__aiter__()
+    else:
+        iterator = iter(coroutines)
+
+    async def _run(index: int, coroutine):
+        start = time.perf_counter()
+        try:
+            results[index] = await coroutine
+        except Exception:
+            window.record(time.perf_counter() - start, error=True)
+            raise
+        window.record(time.perf_counter() - start)
+
+    try:
+        index = 0
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < max(window.value, 1):
+                try:
+                    if aiterator is not None:
+                        coroutine = await aiterator.__anext__()
+                    else:
+                        coroutine = next(iterator)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_run(index, coroutine)))
+                index += 1
+            if not pending:
+                break
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        for coroutine in iterator:
+            coroutine.close()
+        aclose = getattr(aiterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    return [results[i] for i in range(len(results))]
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket allowing `rate` acquisitions per second on average and bursts of up to `burst`.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, *args):
+        pass
+
+
+def map_threaded(
+    func: Callable,
+    iterable: typing.Iterable,
+    executor: ThreadPoolExecutor,
+    max_workers: int,
+) -> typing.Iterator:
+    """
+    Applies `func` to the items of `iterable` in the executor and yields the results
+    in completion order. The iterable is consumed lazily, at most two items per worker
+    are pending at a time.
+    """
+    iterator = iter(iterable)
+    pending = {
+        executor.submit(func, i) for i in itertools.islice(iterator, max_workers * 2)
+    }
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+        for i in itertools.islice(iterator, len(done)):
+            pending.add(executor.submit(func, i))
+
+
+class _AttemptReader(io.RawIOBase):
+    """
+    Reads a form file for one request attempt, aiohttp closes the reader once sent
+    and the file stays open for the retries.
+    """
+
+    def __init__(self, file: io.BufferedIOBase):
+        super().__init__()
+        self._file = file
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._file.read(size)
+
+
 class AIOHttpSession(aiohttp.ClientSession):
+    ATTRS = aiohttp.ClientSession.ATTRS | frozenset(
+        ["json_codec", "compress_threshold", "instrumentation", "cassette", "hedger"]
+    )
     RETRY_STATUS_CODES = [401, 403, 502, 503, 504]
     RETRY_LIMIT = 3
     BACKOFF_FACTOR = 0.3
 
+    def __init__(
+        self,
+        *args,
+        json_codec: JSONCodec = None,
+        compress_threshold: typing.Optional[int] = None,
+        instrumentation: Instrumentation = None,
+        cassette: Cassette = None,
+        hedger: Hedger = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.json_codec = json_codec if json_codec else get_json_codec()
+        self.compress_threshold = compress_threshold
+        self.instrumentation = instrumentation if instrumentation else Instrumentation()
+        self.cassette = cassette
+        self.hedger = hedger if hedger else Hedger()
+
+    async def _request(self, method, str_or_url, **kwargs):
+        if self.cassette is None:
+            return await super()._request(method, str_or_url, **kwargs)
+        return await aio_exchange(
+            self.cassette, super()._request, method, str_or_url, **kwargs
+        )
+
+    async def read_json(self, response: aiohttp.ClientResponse) -> typing.Any:
+        """
+        Decodes the response body straight from bytes with the session codec.
+        """
+        return self.json_codec.loads(await response.read())
+
+    def _report(
+        self,
+        args: tuple,
+        kwargs: dict,
+        response: aiohttp.ClientResponse,
+        duration: float,
+        retried: int,
+    ):
+        tags = {"endpoint": endpoint_of(args[1]), "method": args[0].upper()}
+        self.instrumentation.emit(
+            REQUEST_DURATION, duration, status=response.status, **tags
+        )
+        self.instrumentation.emit(REQUEST_RETRIES, retried, **tags)
+        data = kwargs.get("data")
+        if isinstance(data, (bytes, str)):
+            self.instrumentation.emit(REQUEST_BYTES_OUT, len(data), **tags)
+        if response.content_length is not None:
+            self.instrumentation.emit(REQUEST_BYTES_IN, response.content_length, **tags)
+
     @staticmethod
     def _copy_form_data(data: aiohttp.FormData) -> aiohttp.FormData:
         form_data = aiohttp.FormData(quote_fields=False)
         for field in data._fields:  # noqa
-            if isinstance(field[2], io.IOBase):
-                field[2].seek(0)
+            value = field[2]
+            if isinstance(value, io.BufferedIOBase):
+                value.seek(0)
+                value = _AttemptReader(value)
             form_data.add_field(
-                value=field[2],
+                value=value,
                 content_type=field[1].get("Content-Type", ""),
                 **field[0],
             )
         return form_data
 
-    async def request(self, *args, **kwargs) -> aiohttp.ClientResponse:
-        attempts = self.RETRY_LIMIT
+    def _multipart_kwargs(self, kwargs: dict, form_data: aiohttp.FormData) -> dict:
+        # each attempt sends a copy, newer aiohttp versions drop the fields of a processed form
+        # the multipart content type with its boundary replaces the session's default JSON one
+        payload = self._copy_form_data(form_data)()
+        headers = {**kwargs.get("headers", {}), "Content-Type": payload.content_type}
+        return {**kwargs, "data": payload, "headers": headers}
+
+    async def request(
+        self, *args, hedge: bool = False, retry: bool = True, **kwargs
+    ) -> aiohttp.ClientResponse:
+        """
+        :param hedge: the request is an idempotent read the session's hedger may send twice.
+        :param retry: resend the request on the RETRY_STATUS_CODES, off for the requests that are not idempotent.
+        """
+        if hedge and self.hedger.enabled:
+            return await self.hedger.asend(
+                endpoint_of(args[1]),
+                lambda: self._send(*args, retry=retry, **kwargs),
+                aiohttp.ClientResponse.release,
+            )
+        return await self._send(*args, retry=retry, **kwargs)
+
+    async def _send(
+        self, *args, retry: bool = True, **kwargs
+    ) -> aiohttp.ClientResponse:
+        data, encoding = compress_payload(kwargs.get("data"), self.compress_threshold)
+        if encoding:
+            kwargs["data"] = data
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Encoding": encoding,
+            }
+        limit = self.RETRY_LIMIT if retry else 1
+        attempts = limit
         delay: float = 0
         for _ in range(attempts):
             delay += self.BACKOFF_FACTOR
             try:
-                response = await super()._request(*args, **kwargs)
+                start = time.perf_counter()
+                data = kwargs.get("data")
+                if isinstance(data, aiohttp.FormData):
+                    response = await self._request(
+                        *args, **self._multipart_kwargs(kwargs, data)
+                    )
+                else:
+                    response = await self._request(*args, **kwargs)
+                if self.instrumentation.enabled:
+                    self._report(
+                        args,
+                        kwargs,
+                        response,
+                        time.perf_counter() - start,
+                        limit - attempts,
+                    )
                 if attempts <= 1 or response.status not in self.RETRY_STATUS_CODES:
                     if not response.ok:
                         logger.error(await response.text())
                         response.raise_for_status()
                     return response
-                if isinstance(kwargs["data"], aiohttp.FormData):
+                if isinstance(kwargs.get("data"), aiohttp.FormData):
                     raise RuntimeError(await response.text())
-            except (aiohttp.ClientError, RuntimeError) as e:
+            except aiohttp.ClientResponseError as e:
+                if attempts <= 1 or e.status not in self.RETRY_STATUS_CODES:
+                    raise
+            except (aiohttp.ClientError, RuntimeError):
                 if attempts <= 1:
                     raise
-                data = kwargs.get("data", {})
-                if isinstance(data, aiohttp.FormData):
-                    kwargs["data"] = self._copy_form_data(data)
             attempts -= 1
             await asyncio.sleep(delay)
 
@@ -114,12 +390,26 @@ class StreamedAnnotations:
         headers: dict,
         callback: Callable = None,
         map_function: Callable = None,
+        json_codec: JSONCodec = None,
+        session_factory: Callable[..., AIOHttpSession] = None,
+        annotation_filter: Callable[[dict], typing.Optional[dict]] = None,
     ):
+        """
+        :param annotation_filter: applied to each annotation once decoded, see AnnotationFilter.
+         Annotations it returns None for are skipped.
+        """
         self._headers: dict = headers
-        self._annotations: list = []
+        self._session_factory: Callable[..., AIOHttpSession] = AIOHttpSession
+        if session_factory:
+            self._session_factory = session_factory
+        self._json_codec: JSONCodec = json_codec if json_codec else get_json_codec()
         self._callback: typing.Optional[Callable] = callback
         self._map_function: typing.Optional[Callable] = map_function
+        self._annotation_filter: typing.Optional[Callable] = annotation_filter
         self._items_downloaded: int = 0
+        self._bytes_received: int = 0
+        self._decode_time: float = 0.0
+        self._decoded_count: int = 0
 
     async def fetch(
         self,
@@ -128,21 +418,71 @@ class StreamedAnnotations:
         url: str,
         data: dict = None,
         params: dict = None,
+        sized: bool = False,
     ):
-        kwargs: dict = {"params": params, "json": {}}
-        if "folder_id" in kwargs["params"]:
-            kwargs["json"] = {"folder_id": kwargs["params"].pop("folder_id")}
+        """
+        Streams the decoded annotations of the response.
+        :param sized: yield (annotation, encoded size) pairs.
+        """
+        payload: dict = {}
+        if params and "folder_id" in params:
+            payload = {"folder_id": params.pop("folder_id")}
         if data:
-            kwargs["json"].update(data)
-        response = await session.request(method, url, **kwargs, timeout=TIMEOUT)  # noqa
+            payload.update(data)
+        response = await session.request(
+            method,
+            url,
+            params=params,
+            data=self._json_codec.dumps(payload),
+            timeout=TIMEOUT,
+            hedge=True,
+        )
+        loads = self._json_codec.loads
+        instrumentation = session.instrumentation
+        if instrumentation.enabled:
+            loads = self._timed_loads(loads)
+        self._bytes_received, self._decode_time, self._decoded_count = 0, 0.0, 0
+        start = time.perf_counter()
+        if self._annotation_filter:
+            loads = self._filtered_loads(loads)
         buffer = b""
         async for line in response.content.iter_any():
+            self._bytes_received += len(line)
             slices = (buffer + line).split(self.DELIMITER)
-            for _slice in slices[:-1]:
-                yield json.loads(_slice)
-            buffer = slices[-1]
+            buffer = slices.pop()
+            for _slice in slices:
+                annotation = loads(_slice)
+                if annotation is not None:
+                    yield (annotation, len(_slice)) if sized else annotation
         if buffer:
-            yield json.loads(buffer)
+            annotation = loads(buffer)
+            if annotation is not None:
+                yield (annotation, len(buffer)) if sized else annotation
+        if instrumentation.enabled:
+            tags = {"endpoint": endpoint_of(url)}
+            instrumentation.emit(STREAM_DURATION, time.perf_counter() - start, **tags)
+            instrumentation.emit(STREAM_BYTES_IN, self._bytes_received, **tags)
+            instrumentation.emit(STREAM_DECODE_DURATION, self._decode_time, **tags)
+            instrumentation.emit(STREAM_ANNOTATIONS, self._decoded_count, **tags)
+
+    def _filtered_loads(self, loads: Callable) -> Callable:
+        annotation_filter = self._annotation_filter
+
+        def _loads(data):
+            return annotation_filter(loads(data))
+
+        return _loads
+
+    def _timed_loads(self, loads: Callable) -> Callable:
+        def _loads(data):
+            start = time.perf_counter()
+            try:
+                return loads(data)
+            finally:
+                self._decode_time += time.perf_counter() - start
+                self._decoded_count += 1
+
+        return _loads
 
     async def list_annotations(
         self,
@@ -151,29 +491,40 @@ class StreamedAnnotations:
         data: typing.Iterable[int] = None,
         params: dict = None,
         verify_ssl=False,
+        store: AnnotationStore = None,
     ):
+        """
+        :param store: collect the annotations in the store instead of a list and return it.
+        """
         if not params:
             params = {}
         params = copy.copy(params)
         if data:
             params["limit"] = len(list(data))
-        annotations = []
-        async with AIOHttpSession(
+        annotations: typing.Union[typing.List[dict], AnnotationStore] = (
+            store if store is not None else []
+        )
+        async with self._session_factory(
             headers=self._headers,
             timeout=TIMEOUT,
             connector=aiohttp.TCPConnector(ssl=verify_ssl, keepalive_timeout=2**32),
+            json_codec=self._json_codec,
             # raise_for_status=True,
         ) as session:
-            async for annotation in self.fetch(
+            async for annotation, size in self.fetch(
                 method,
                 session,
                 url,
                 self._process_data(data),
                 params=copy.copy(params),
+                sized=True,
             ):
-                annotations.append(
-                    self._callback(annotation) if self._callback else annotation
-                )
+                if self._callback:
+                    annotations.append(self._callback(annotation))
+                elif store is not None:
+                    store.append(annotation, size)
+                else:
+                    annotations.append(annotation)
 
         return annotations
 
@@ -184,15 +535,24 @@ class StreamedAnnotations:
         download_path,
         data: typing.List[int],
         params: dict = None,
+        journal: DownloadJournal = None,
     ):
+        """
+        :param journal: records the stored files, the ids it has completed are not requested again.
+        """
+        if journal:
+            data = [i for i in data if i not in journal.completed]
+            if not data:
+                return
         if params is None:
             params = {}
         params = copy.copy(params)
         params["limit"] = len(data)
-        async with AIOHttpSession(
+        async with self._session_factory(
             headers=self._headers,
             timeout=TIMEOUT,
             connector=aiohttp.TCPConnector(ssl=False, keepalive_timeout=2**32),
+            json_codec=self._json_codec,
             # raise_for_status=True,
         ) as session:
             async for annotation in self.fetch(
@@ -202,22 +562,33 @@ class StreamedAnnotations:
                 self._process_data(data),
                 params=params,
             ):
-                self._annotations.append(
-                    self._callback(annotation) if self._callback else annotation
-                )
-                self._store_annotation(
+                stored = self._store_annotation(
                     download_path,
                     annotation,
                     self._callback,
+                    self._json_codec,
                 )
+                if journal:
+                    metadata = annotation["metadata"]
+                    journal.record(metadata.get("id"), metadata["name"], stored)
                 self._items_downloaded += 1
+        if journal:
+            journal.complete_chunk(data)
 
     @staticmethod
-    def _store_annotation(path, annotation: dict, callback: Callable = None):
+    def _store_annotation(
+        path, annotation: dict, callback: Callable = None, json_codec: JSONCodec = None
+    ) -> bytes:
+        """
+        Returns the stored file content.
+        """
         os.makedirs(path, exist_ok=True)
-        with open(f"{path}/{annotation['metadata']['name']}.json", "w") as file:
+        json_codec = json_codec if json_codec else get_json_codec()
+        with open(f"{path}/{annotation['metadata']['name']}.json", "wb") as file:
             annotation = callback(annotation) if callback else annotation
-            json.dump(annotation, file)
+            data = json_codec.dumps(annotation)
+            file.write(data)
+        return data
 
     def _process_data(self, data):
         if data and self._map_function:
@@ -1,24 +1,55 @@
+import asyncio
 import logging
 import os
 import platform
 import threading
 import time
 import urllib.parse
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import lru_cache
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Tuple
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from requests.adapters import Retry
+from superannotate_core.infrastructure.adaptive import AdaptiveSettings
+from superannotate_core.infrastructure.adaptive import AdaptiveWindow
+from superannotate_core.infrastructure.cache import TTLCache
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.codecs import JSONCodec
+from superannotate_core.infrastructure.decoding import ProcessDecoder
+from superannotate_core.infrastructure.hedging import Hedger
+from superannotate_core.infrastructure.hedging import HedgingPolicy
+from superannotate_core.infrastructure.instrumentation import endpoint_of
+from superannotate_core.infrastructure.instrumentation import Instrumentation
+from superannotate_core.infrastructure.instrumentation import PAGINATE_ITEMS
+from superannotate_core.infrastructure.instrumentation import PAGINATE_PAGES
+from superannotate_core.infrastructure.instrumentation import REQUEST_BYTES_IN
+from superannotate_core.infrastructure.instrumentation import REQUEST_BYTES_OUT
+from superannotate_core.infrastructure.instrumentation import REQUEST_DURATION
+from superannotate_core.infrastructure.instrumentation import REQUEST_RETRIES
+from superannotate_core.infrastructure.repositories.utils import AIOHttpSession
+from superannotate_core.infrastructure.transport import Cassette
+from superannotate_core.infrastructure.transport import CassetteAdapter
+from superannotate_core.infrastructure.transport import compress_payload
 
 logger = logging.getLogger(__name__)
 
 
 class Session:
     MAX_COROUTINE_COUNT = 8
+    MAX_THREAD_COUNT = 8
+    MAX_DECODE_PROCESSES = 2
     ANNOTATION_VERSION = "V1.00"
 
     def __init__(
@@ -28,12 +59,49 @@ class Session:
         api_url: str = "https://api.superannotate.com",
         auth_type: str = "sdk",
         version: str = "4.4.20",
+        json_codec: Optional[str] = None,
+        compress_threshold: Optional[int] = None,
+        cassette: Optional[Cassette] = None,
+        decode_threshold: Optional[int] = None,
+        adaptive: Optional[AdaptiveSettings] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ):
+        """
+        :param compress_threshold: gzip JSON request bodies of at least this many bytes.
+                                   Compression is disabled when not set.
+        :param cassette: record the HTTP traffic to, or replay it from, the cassette.
+        :param decode_threshold: decode large annotations of at least this many bytes
+                                 in a pool of MAX_DECODE_PROCESSES processes. Disabled when not set.
+        :param adaptive: tune the chunk sizes and concurrency of the repositories from the observed
+                         latency, payload size and errors. Fixed sizes are used when not set.
+        :param hedging: send the idempotent reads again when they are slower than the policy's latency
+                        percentile of their endpoint. Reads are sent once when not set.
+        """
         self._token = token
         self._team_id = team_id
         self._api_url = api_url
         self._auth_type = auth_type
         self._verify_ssl = os.environ.get("VERIFY_SSL", True)
+        self._json_codec = get_json_codec(json_codec or os.environ.get("SA_JSON_CODEC"))
+        self._compress_threshold = compress_threshold
+        self._cassette = cassette
+        self._aio_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._caches: Dict[str, TTLCache] = {}
+        self._caches_lock = threading.Lock()
+        self._adaptive = adaptive
+        self._windows: Dict[str, AdaptiveWindow] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.instrumentation = Instrumentation()
+        self.hedger = Hedger(
+            hedging, self.MAX_THREAD_COUNT * 2, instrumentation=self.instrumentation
+        )
+        self.decoder: Optional[ProcessDecoder] = (
+            ProcessDecoder(
+                decode_threshold, self.MAX_DECODE_PROCESSES, self._json_codec
+            )
+            if decode_threshold is not None
+            else None
+        )
         self.default_headers = {
             "Authorization": self._token,
             "authtype": self._auth_type,
@@ -58,6 +126,110 @@ class Session:
     def team_id(self):
         return self._team_id
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        return self._json_codec
+
+    def aio_session(self, **kwargs) -> AIOHttpSession:
+        """
+        Creates an aiohttp session sharing this session's headers, codec and compression settings.
+        """
+        kwargs.setdefault("headers", self.default_headers)
+        kwargs.setdefault("json_codec", self._json_codec)
+        kwargs.setdefault("compress_threshold", self._compress_threshold)
+        kwargs.setdefault("instrumentation", self.instrumentation)
+        kwargs.setdefault("cassette", self._cassette)
+        kwargs.setdefault("hedger", self.hedger)
+        return AIOHttpSession(**kwargs)
+
+    def aio_client(self) -> AIOHttpSession:
+        """
+        Returns the aiohttp session shared by the async repositories on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._aio_clients.get(loop)
+        if client is None or client.closed:
+            client = self.aio_session(
+                connector=aiohttp.TCPConnector(ssl=False),
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=60),
+            )
+            self._aio_clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """
+        Closes the shared aiohttp session of the running event loop.
+        """
+        client = self._aio_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def close(self):
+        """
+        Shuts down the decoding processes, the hedging threads and the executor of the session,
+        they are started again on the next use. The aiohttp sessions are closed with aclose.
+        """
+        if self.decoder is not None:
+            self.decoder.close()
+        self.hedger.close()
+        with self._caches_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Returns the thread pool of the threaded repository calls, creating it on first use.
+        Its threads live across the calls and keep their requests sessions and connections.
+        """
+        with self._caches_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.MAX_THREAD_COUNT, thread_name_prefix="sa_session"
+                )
+            return self._executor
+
+    def window(
+        self, name: str, initial: int, minimum: int = 1, maximum: int = None
+    ) -> AdaptiveWindow:
+        """
+        Returns the named adaptive window shared by the repositories of this session, creating it on first use.
+        The limits set for the name in the adaptive settings override `minimum` and `maximum`,
+        `maximum` defaults to `initial`.
+        """
+        with self._caches_lock:
+            window = self._windows.get(name)
+            if window is None:
+                if self._adaptive and name in self._adaptive.limits:
+                    minimum, maximum = self._adaptive.limits[name]
+                window = AdaptiveWindow(
+                    initial, minimum, maximum or initial, self._adaptive
+                )
+                self._windows[name] = window
+            return window
+
+    def cache(self, name: str, ttl: float) -> TTLCache:
+        """
+        Returns the named cache shared by the repositories of this session, creating it on first use.
+        """
+        with self._caches_lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = self._caches[name] = TTLCache(ttl)
+            return cache
+
+    def clear_caches(self):
+        with self._caches_lock:
+            caches = list(self._caches.values())
+        for cache in caches:
+            cache.clear()
+
+    def read_json(self, response: requests.Response) -> Any:
+        """
+        Decodes the response body straight from bytes with the session codec.
+        """
+        return self._json_codec.loads(response.content)
+
     @lru_cache(maxsize=32)
     def _get_cached_session(self, thread_id, ttl=None):  # noqa
         del ttl
@@ -65,8 +237,12 @@ class Session:
         retries = Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504])
 
         session = requests.Session()
-        session.mount("http://", HTTPAdapter(max_retries=retries))  # noqa
-        session.mount("https://", HTTPAdapter(max_retries=retries))
+        if self._cassette:
+            adapter = CassetteAdapter(self._cassette, max_retries=retries)
+        else:
+            adapter = HTTPAdapter(max_retries=retries)
+        session.mount("http://", adapter)  # noqa
+        session.mount("https://", adapter)
         session.headers.update(self.default_headers)
         return session
 
@@ -101,7 +277,10 @@ class Session:
                 **kwargs,
             )
             prepared = session.prepare_request(req)
+            start = time.perf_counter()
             response = session.send(request=prepared, verify=self._verify_ssl)
+        if self.instrumentation.enabled:
+            self._report(prepared, response, time.perf_counter() - start, retried)
 
         if response.status_code == 404 and retried < 3:
             time.sleep(retried * 0.1)
@@ -114,6 +293,38 @@ class Session:
             )
         return response
 
+    def _report(
+        self,
+        prepared: requests.PreparedRequest,
+        response: requests.Response,
+        duration: float,
+        retried: int,
+    ):
+        tags = {
+            "endpoint": endpoint_of(prepared.url or ""),
+            "method": prepared.method,
+        }
+        self.instrumentation.emit(
+            REQUEST_DURATION, duration, status=response.status_code, **tags
+        )
+        raw_retries = getattr(response.raw, "retries", None)
+        retries = retried + (len(raw_retries.history) if raw_retries else 0)
+        self.instrumentation.emit(REQUEST_RETRIES, retries, **tags)
+        # streamed bodies are measured by their declared length
+        body = prepared.body
+        bytes_out = (
+            len(body)
+            if isinstance(body, (bytes, str))
+            else int(prepared.headers.get("Content-Length", 0))
+        )
+        self.instrumentation.emit(REQUEST_BYTES_OUT, bytes_out, **tags)
+        bytes_in = response.headers.get("Content-Length")
+        self.instrumentation.emit(
+            REQUEST_BYTES_IN,
+            int(bytes_in) if bytes_in else len(response.content),
+            **tags,
+        )
+
     def _build_url(self, url):
         if not url.startswith("htt"):
             return urllib.parse.urljoin(self._api_url, url)
@@ -129,16 +340,35 @@ class Session:
         params=None,
         files=None,
         build_url=True,
+        hedge=False,
     ) -> requests.Response:
+        """
+        :param hedge: the request is an idempotent read the session's hedger may send twice.
+        """
         if build_url:
             url = self._build_url(url)
-        kwargs = {"params": {"team_id": self._team_id}}
+        kwargs: Dict[str, Any] = {"params": {"team_id": self._team_id}}
         if data:
             kwargs["data"] = data
         if json:
-            kwargs["json"] = json
+            kwargs["data"], encoding = compress_payload(
+                self._json_codec.dumps(json), self._compress_threshold
+            )
+            if encoding:
+                kwargs["headers"] = {"Content-Encoding": encoding}
         if params:
             kwargs["params"].update(params)
+        if hedge and self.hedger.enabled and not files:
+            # the attempts run on the hedger threads with their own requests sessions
+            if headers:
+                kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+            return self.hedger.send(
+                endpoint_of(url),
+                lambda: self._request(
+                    url, method, session=self._get_session(), **kwargs
+                ),
+                requests.Response.close,
+            )
         session = self._get_session()
         if files and session.headers.get("Content-Type"):
             del session.headers["Content-Type"]
@@ -148,32 +378,147 @@ class Session:
             session.headers.update(self.default_headers)
         return response
 
-    def paginate(
+    @staticmethod
+    def _aio_fields(data: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Flattens params or form data the way requests encodes them: sequences
+        become repeated keys and None values are dropped.
+        """
+        fields = []
+        for key, value in data.items():
+            for _value in value if isinstance(value, (list, tuple, set)) else [value]:
+                if _value is not None:
+                    fields.append((key, str(_value)))
+        return fields
+
+    async def arequest(
+        self,
+        url,
+        method="get",
+        data=None,
+        json=None,
+        headers=None,
+        params=None,
+        build_url=True,
+        hedge=False,
+        retry=True,
+    ) -> aiohttp.ClientResponse:
+        """
+        Async counterpart of request running on the shared aiohttp session.
+        The response body has to be read with aread_json or response.read().
+        :param retry: resend the request on a 502, 503 or 504 response, off for the requests that are not idempotent.
+        """
+        if build_url:
+            url = self._build_url(url)
+        _params = {"team_id": self._team_id}
+        if params:
+            _params.update(params)
+        kwargs: Dict[str, Any] = {"params": self._aio_fields(_params)}
+        if data:
+            kwargs["data"] = self._aio_fields(data) if isinstance(data, dict) else data
+        if json:
+            kwargs["data"] = self._json_codec.dumps(json)
+        if headers:
+            kwargs["headers"] = headers
+        return await self.aio_client().request(
+            method, url, hedge=hedge, retry=retry, **kwargs
+        )
+
+    async def aread_json(self, response: aiohttp.ClientResponse) -> Any:
+        return self._json_codec.loads(await response.read())
+
+    async def aiter_pages(
         self,
         url: str,
         chunk_size: int = 2000,
         query_params: Dict[str, Any] = None,
-    ) -> List[dict]:
+        on_count: Callable[[int], Any] = None,
+    ) -> AsyncIterator[List[dict]]:
         offset = 0
+        pages = 0
+        items = 0
+        splitter = "&" if "?" in url else "?"
+
+        try:
+            while True:
+                _url = f"{url}{splitter}offset={offset}"
+                _response = await self.arequest(_url, method="get", params=query_params)
+                pages += 1
+                response_data = await self.aread_json(_response)
+                if on_count and pages == 1:
+                    on_count(response_data["count"])
+                payload = response_data["data"]
+                if not payload:
+                    break
+                items += len(payload)
+                yield payload
+                offset += len(payload)
+                if len(payload) < chunk_size or response_data["count"] - offset < 0:
+                    break
+        finally:
+            endpoint = endpoint_of(self._build_url(url))
+            self.instrumentation.emit(PAGINATE_PAGES, pages, endpoint=endpoint)
+            self.instrumentation.emit(PAGINATE_ITEMS, items, endpoint=endpoint)
+
+    async def apaginate(
+        self,
+        url: str,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+    ) -> List[dict]:
         total = []
+        async for page in self.aiter_pages(url, chunk_size, query_params):
+            total.extend(page)
+        return total
+
+    def iter_pages(
+        self,
+        url: str,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+        on_count: Callable[[int], Any] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Yields the pages of a paginated listing as they arrive.
+        :param on_count: called with the total count reported by the first page,
+                         before that page is yielded.
+        """
+        offset = 0
+        pages = 0
+        items = 0
         splitter = "&" if "?" in url else "?"
 
-        while True:
-            _url = f"{url}{splitter}offset={offset}"
-            _response = self.request(_url, method="get", params=query_params)
-            if _response.ok:
-                response_data = _response.json()
+        try:
+            while True:
+                _url = f"{url}{splitter}offset={offset}"
+                _response = self.request(_url, method="get", params=query_params)
+                pages += 1
+                if not _response.ok:
+                    _response.raise_for_status()
+                response_data = self.read_json(_response)
+                if on_count and pages == 1:
+                    on_count(response_data["count"])
                 payload = response_data["data"]
-                if payload:
-                    total.extend(payload)
-                else:
+                if not payload:
                     break
+                items += len(payload)
+                yield payload
                 data_len = len(payload)
                 offset += data_len
                 if data_len < chunk_size or response_data["count"] - offset < 0:
                     break
-            else:
-                break
-        if not _response.ok:
-            _response.raise_for_status()
+        finally:
+            endpoint = endpoint_of(self._build_url(url))
+            self.instrumentation.emit(PAGINATE_PAGES, pages, endpoint=endpoint)
+            self.instrumentation.emit(PAGINATE_ITEMS, items, endpoint=endpoint)
+
+    def paginate(
+        self,
+        url: str,
+        chunk_size: int = 2000,
+        query_params: Dict[str, Any] = None,
+    ) -> List[dict]:
+        total = []
+        for page in self.iter_pages(url, chunk_size, query_params):
+            total.extend(page)
         return total
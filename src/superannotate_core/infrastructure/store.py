@@ -0,0 +1,157 @@
+import os
+import tempfile
+import threading
+import weakref
+from array import array
+from collections.abc import Sequence
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+from superannotate_core.infrastructure.codecs import get_json_codec
+from superannotate_core.infrastructure.codecs import JSONCodec
+
+
+def _remove(file, path: str):
+    file.close()
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class AnnotationStore(Sequence):
+    """
+    Sequence of annotations held in memory until their encoded size passes `memory_budget` bytes.
+    Past the budget every annotation moves to a temporary NDJSON file and only the line offsets
+    and item names stay in memory, annotations are decoded back on access.
+    The file is removed on close or when the store is garbage collected.
+    """
+
+    def __init__(
+        self, memory_budget: int, json_codec: JSONCodec = None, directory: str = None
+    ):
+        self.memory_budget = memory_budget
+        self.names: List[str] = []
+        self._json_codec = json_codec if json_codec else get_json_codec()
+        self._directory = directory
+        self._memory: List[dict] = []
+        self._memory_size = 0
+        self._offsets = array("q")
+        self._order: Optional[array] = None
+        self._file: Optional[IO[bytes]] = None
+        self._path: Optional[str] = None
+        self._finalizer = None
+        self._lock = threading.RLock()
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, annotation: dict, size: int = None):
+        """
+        :param size: encoded size of the annotation, the annotation is encoded to measure it if not given.
+        """
+        with self._lock:
+            self.names.append(annotation["metadata"]["name"])
+            if self._order is not None:
+                self._order.append(len(self._order))
+            if self._file is not None:
+                self._write(self._file, annotation)
+                return
+            self._memory.append(annotation)
+            self._memory_size += (
+                size if size is not None else len(self._json_codec.dumps(annotation))
+            )
+            if self._memory_size > self.memory_budget:
+                self._spill()
+
+    def extend(self, annotations: Iterable[dict]):
+        for annotation in annotations:
+            self.append(annotation)
+
+    def reorder(self, indexes: List[int]):
+        """
+        Reorders the annotations without loading them, the annotation at indexes[i] becomes the i-th.
+        """
+        with self._lock:
+            if self._file is None:
+                self._memory = [self._memory[i] for i in indexes]
+            else:
+                current = self._order
+                self._order = array(
+                    "q", (current[i] if current is not None else i for i in indexes)
+                )
+            self.names = [self.names[i] for i in indexes]
+
+    def _spill(self):
+        fd, self._path = tempfile.mkstemp(
+            prefix="sa_annotations_", suffix=".ndjson", dir=self._directory
+        )
+        self._file = file = os.fdopen(fd, "w+b")
+        self._finalizer = weakref.finalize(self, _remove, file, self._path)
+        for annotation in self._memory:
+            self._write(file, annotation)
+        self._memory, self._memory_size = [], 0
+
+    def _write(self, file: IO[bytes], annotation: dict):
+        file.seek(0, os.SEEK_END)
+        self._offsets.append(file.tell())
+        file.write(self._json_codec.dumps(annotation) + b"\n")
+
+    def _read(self, file: IO[bytes], index: int) -> dict:
+        if self._order is not None:
+            index = self._order[index]
+        file.seek(self._offsets[index])
+        return self._json_codec.loads(file.readline())
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("annotation index out of range")
+        with self._lock:
+            if self._file is None:
+                return self._memory[index]
+            return self._read(self._file, index)
+
+    def __iter__(self) -> Iterator[dict]:
+        # the spill file is read sequentially while the annotations keep their order
+        path: Optional[str] = None
+        with self._lock:
+            if self._file is None:
+                memory = list(self._memory)
+            elif self._order is None:
+                self._file.flush()
+                memory, path = None, self._path
+            else:
+                memory = None
+        if memory is not None:
+            yield from memory
+        elif path is not None:
+            with open(path, "rb") as file:
+                for line in file:
+                    yield self._json_codec.loads(line)
+        else:
+            for index in range(len(self)):
+                yield self[index]
+
+    def close(self):
+        if self._finalizer:
+            self._finalizer()
+        self._memory, self.names = [], []
+        self._offsets, self._order = array("q"), None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,375 @@
+import asyncio
+import base64
+import gzip
+import hashlib
+import threading
+import time
+from collections import defaultdict
+from collections import deque
+from typing import Any
+from typing import AsyncIterator
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from urllib.parse import parse_qsl
+from urllib.parse import urlencode
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+import yarl
+from multidict import CIMultiDict
+from multidict import CIMultiDictProxy
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from superannotate_core.core.exceptions import SAException
+from superannotate_core.infrastructure.codecs import get_json_codec
+from typing_extensions import TypedDict
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Headers describing the wire encoding are dropped: recorded bodies are stored decoded.
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+GZIP_COMPRESSION_LEVEL = 6
+
+
+def compress_payload(
+    data: Any, threshold: Optional[int], level: int = GZIP_COMPRESSION_LEVEL
+) -> Tuple[Any, Optional[str]]:
+    """
+    Gzips `data` when compression is enabled and it is a bytes payload of at least `threshold` bytes.
+    Returns the body to send and the Content-Encoding to declare (None if unchanged).
+    """
+    if threshold is None or not isinstance(data, bytes) or len(data) < threshold:
+        return data, None
+    return gzip.compress(data, compresslevel=level, mtime=0), "gzip"
+
+
+class CassetteMissError(SAException):
+    """
+    The replayed request was not recorded
+    """
+
+
+class Exchange(TypedDict):
+    method: str
+    url: str
+    body_digest: Optional[str]
+    status: int
+    reason: str
+    headers: Dict[str, str]
+    body: str
+    started: float
+    duration: float
+    chunks: List[Tuple[float, int]]
+
+
+def _request_key(
+    method: str, url: str, body: Any, headers=None
+) -> Tuple[str, str, Optional[str]]:
+    parts = urlsplit(str(url))
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    path = f"{parts.path}?{query}" if query else parts.path
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    if isinstance(body, bytes) and (headers or {}).get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    digest = hashlib.sha1(body).hexdigest() if isinstance(body, bytes) else None
+    return method.upper(), path, digest
+
+
+class Cassette:
+    """
+    Records HTTP exchanges made through Session and AIOHttpSession to a compact
+    gzipped NDJSON file and replays them with the original timing or at zero latency.
+
+        cassette = Cassette.record("traffic.sa")
+        session = Session(token, team_id, cassette=cassette)
+        ...
+        cassette.save()
+
+        session = Session(token, team_id, cassette=Cassette.replay("traffic.sa", latency_scale=0))
+
+    Requests are matched by method, path, sorted query and body digest; identical
+    requests are replayed in the order they were recorded.
+    """
+
+    def __init__(self, path: str, mode: str, latency_scale: float = 1.0):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown cassette mode {mode}.")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.codec = get_json_codec()
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._exchanges: List[Exchange] = []
+        self._queues: Dict[tuple, Deque[Exchange]] = defaultdict(deque)
+        if mode == REPLAY:
+            self._load()
+
+    @classmethod
+    def record(cls, path: str) -> "Cassette":
+        return cls(path, RECORD)
+
+    @classmethod
+    def replay(cls, path: str, latency_scale: float = 1.0) -> "Cassette":
+        """
+        :param latency_scale: multiplier applied to the recorded timings, 0 replays without delays.
+        """
+        return cls(path, REPLAY, latency_scale=latency_scale)
+
+    @property
+    def exchanges(self) -> List[Exchange]:
+        return list(self._exchanges)
+
+    def _load(self):
+        with gzip.open(self.path, "rb") as file:
+            for line in file:
+                if line.strip():
+                    exchange: Exchange = self.codec.loads(line)
+                    self._exchanges.append(exchange)
+                    key = (
+                        exchange["method"],
+                        exchange["url"],
+                        exchange["body_digest"],
+                    )
+                    self._queues[key].append(exchange)
+
+    def save(self, path: str = None):
+        with self._lock:
+            exchanges = sorted(self._exchanges, key=lambda i: i["started"])
+        with gzip.open(path or self.path, "wb") as file:
+            for exchange in exchanges:
+                file.write(self.codec.dumps(exchange))
+                file.write(b"\n")
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        body: Any,
+        request_headers,
+        status: int,
+        reason: str,
+        headers,
+        content: bytes,
+        started: float,
+        duration: float,
+        chunks: List[Tuple[float, int]] = None,
+    ) -> Exchange:
+        method, path, digest = _request_key(method, url, body, request_headers)
+        exchange = Exchange(
+            method=method,
+            url=path,
+            body_digest=digest,
+            status=status,
+            reason=reason or "",
+            headers={
+                k: v for k, v in headers.items() if k.lower() not in _SKIPPED_HEADERS
+            },
+            body=base64.b64encode(content).decode("ascii"),
+            started=started - self._started,
+            duration=duration,
+            chunks=chunks or [(duration, len(content))],
+        )
+        with self._lock:
+            self._exchanges.append(exchange)
+        return exchange
+
+    def match(self, method: str, url: str, body: Any, headers=None) -> Exchange:
+        key = _request_key(method, url, body, headers)
+        with self._lock:
+            queue = self._queues.get(key)
+            if not queue:
+                raise CassetteMissError(f"No recorded response for {key[0]} {key[1]}.")
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+        return exchange
+
+    @staticmethod
+    def body_of(exchange: Exchange) -> bytes:
+        return base64.b64decode(exchange["body"])
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    requests transport adapter recording to or replaying from a cassette.
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self._cassette = cassette
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[float, Tuple[Optional[float], Optional[float]], None] = None,
+        verify: Union[bool, str] = True,
+        cert: Union[str, Tuple[str, str], None] = None,
+        proxies: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        # a prepared request always has its method and url
+        method, url = request.method or "", request.url or ""
+        if self._cassette.mode == REPLAY:
+            exchange = self._cassette.match(method, url, request.body, request.headers)
+            delay = exchange["duration"] * self._cassette.latency_scale
+            if delay:
+                time.sleep(delay)
+            return self._build_response(request, exchange)
+        started = time.monotonic()
+        response = super().send(request, stream, timeout, verify, cert, proxies)
+        content = response.content
+        self._cassette.add(
+            method,
+            url,
+            request.body,
+            request.headers,
+            response.status_code,
+            response.reason,
+            response.headers,
+            content,
+            started,
+            time.monotonic() - started,
+        )
+        return response
+
+    def _build_response(
+        self, request: requests.PreparedRequest, exchange: Exchange
+    ) -> requests.Response:
+        response = requests.Response()
+        response.status_code = exchange["status"]
+        response.reason = exchange["reason"]
+        response.headers = CaseInsensitiveDict(exchange["headers"])
+        response._content = Cassette.body_of(exchange)  # noqa
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.url = request.url or ""
+        response.request = request
+        response.connection = self
+        return response
+
+
+class _ReplayedStream:
+    def __init__(
+        self, body: bytes, chunks: List[Tuple[float, int]], latency_scale: float
+    ):
+        self._body = body
+        self._chunks = chunks
+        self._latency_scale = latency_scale
+
+    async def iter_any(self) -> AsyncIterator[bytes]:
+        # the delay before the first chunk is spent before the response is returned
+        position, elapsed = 0, self._chunks[0][0] if self._chunks else 0.0
+        for offset, size in self._chunks:
+            delay = (offset - elapsed) * self._latency_scale
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elapsed = offset
+            yield self._body[position : position + size]  # noqa
+            position += size
+        if position < len(self._body):
+            yield self._body[position:]
+
+    async def read(self) -> bytes:
+        return b"".join([i async for i in self.iter_any()])
+
+
+class ReplayedResponse:
+    """
+    Stand-in for aiohttp.ClientResponse built from a recorded exchange.
+    """
+
+    def __init__(
+        self, method: str, url: str, exchange: Exchange, latency_scale: float = 0
+    ):
+        self.method = method
+        self.url = yarl.URL(url)
+        self.status: int = exchange["status"]
+        self.reason: str = exchange["reason"]
+        self.headers = CIMultiDictProxy(CIMultiDict(exchange["headers"]))
+        self._body = Cassette.body_of(exchange)
+        self.content = _ReplayedStream(self._body, exchange["chunks"], latency_scale)
+        self.content_length = len(self._body)
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise aiohttp.ClientResponseError(
+                aiohttp.RequestInfo(self.url, self.method, self.headers, self.url),
+                (),
+                status=self.status,
+                message=self.reason,
+                headers=self.headers,
+            )
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str = "utf-8") -> str:
+        return self._body.decode(encoding)
+
+    async def json(self, *, loads=None, **kwargs) -> Any:
+        return (loads or get_json_codec().loads)(self._body)
+
+    def release(self):
+        ...
+
+    def close(self):
+        ...
+
+    async def __aenter__(self) -> "ReplayedResponse":
+        return self
+
+    async def __aexit__(self, *args):
+        ...
+
+
+async def aio_exchange(
+    cassette: Cassette, send, method: str, url, **kwargs
+) -> ReplayedResponse:
+    """
+    Records or replays a single aiohttp request. `send` performs the real request.
+    Recorded responses are fully read, chunk timings included, and handed back as
+    ReplayedResponse so that callers can still stream them.
+    """
+    params = kwargs.get("params")
+    full_url = yarl.URL(str(url))
+    if params:
+        full_url = full_url.extend_query(params)
+    body = kwargs.get("data")
+    if kwargs.get("json") is not None:
+        body = cassette.codec.dumps(kwargs["json"])
+    if cassette.mode == REPLAY:
+        exchange = cassette.match(method, str(full_url), body, kwargs.get("headers"))
+        if exchange["chunks"] and cassette.latency_scale:
+            await asyncio.sleep(exchange["chunks"][0][0] * cassette.latency_scale)
+        return ReplayedResponse(method, str(full_url), exchange, cassette.latency_scale)
+    started = time.monotonic()
+    response: aiohttp.ClientResponse = await send(method, url, **kwargs)
+    chunks, content = [], bytearray()
+    async for chunk in response.content.iter_any():
+        chunks.append((time.monotonic() - started, len(chunk)))
+        content += chunk
+    response.release()
+    exchange = cassette.add(
+        method,
+        str(full_url),
+        body,
+        kwargs.get("headers"),
+        response.status,
+        response.reason or "",
+        response.headers,
+        bytes(content),
+        started,
+        time.monotonic() - started,
+        chunks,
+    )
+    return ReplayedResponse(method, str(full_url), exchange)
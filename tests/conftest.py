@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from benchmarks.fake_server import FakeServer
+from superannotate_core.infrastructure.repositories import AsyncItemRepository
+from superannotate_core.infrastructure.repositories import ItemRepository
+
+
+@pytest.fixture
+def server():
+    with FakeServer(folders=2, items_per_folder=1200) as server:
+        yield server
+
+
+@pytest.fixture
+def folder_ids(server):
+    """
+    The ids of the root folder and of the second folder.
+    """
+    return list(server.folders)
+
+
+@pytest.fixture
+def session(server):
+    session = server.session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def run(session):
+    """
+    Runs a coroutine on a new event loop and closes the session's aiohttp client of the loop after it.
+    """
+
+    def _run(coroutine):
+        async def main():
+            try:
+                return await coroutine
+            finally:
+                await session.aclose()
+
+        return asyncio.run(main())
+
+    return _run
+
+
+class _AwaitedRepository:
+    def __init__(self, repository, run):
+        self._repository = repository
+        self._run = run
+
+    def __getattr__(self, name):
+        attr = getattr(self._repository, name)
+        if not callable(attr):
+            return attr
+        return lambda *args, **kwargs: self._run(attr(*args, **kwargs))
+
+
+@pytest.fixture(params=["sync", "async"])
+def items(request, session, run):
+    """
+    The ItemRepository, or the AsyncItemRepository with its coroutines run to completion.
+    """
+    if request.param == "sync":
+        return ItemRepository(session)
+    return _AwaitedRepository(AsyncItemRepository(session), run)
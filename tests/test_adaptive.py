@@ -0,0 +1,130 @@
+import time
+
+import aiohttp
+import pytest
+import requests
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.core.enums import AnnotationStatus
+from superannotate_core.core.enums import UploadStateEnum
+from superannotate_core.infrastructure.adaptive import AdaptiveSettings
+from superannotate_core.infrastructure.adaptive import AdaptiveWindow
+from superannotate_core.infrastructure.repositories import ItemRepository
+
+URL_GET_BY_NAMES = "/images/getBulk"
+URL_ATTACH = "/image/ext-create"
+TARGET_LATENCY = 0.2
+
+
+@pytest.fixture
+def session(server):
+    """
+    An adaptive session, sending the async chunks one at a time for the chunk sizes to be deterministic.
+    """
+    session = server.session(
+        adaptive=AdaptiveSettings(
+            target_latency=TARGET_LATENCY,
+            limits={ItemRepository.CONCURRENCY_WINDOW: (1, 1)},
+        )
+    )
+    yield session
+    session.close()
+
+
+def test_window_without_settings_keeps_its_value():
+    window = AdaptiveWindow(100, 10, 200)
+    window.record(10, error=True)
+    assert window.value == 100
+    assert window.requests == 0
+
+
+def test_window_grows_up_to_its_maximum():
+    window = AdaptiveWindow(100, 10, 120, AdaptiveSettings(), increase=15)
+    window.record(0.1)
+    assert window.value == 115
+    window.record(0.1)
+    assert window.value == 120
+
+
+def test_window_shrinks_once_per_target_latency():
+    window = AdaptiveWindow(100, 30, 200, AdaptiveSettings(target_latency=10))
+    window.record(0.1, error=True)
+    window.record(11)
+    assert window.value == 50
+    assert (window.requests, window.errors, window.error_rate) == (2, 1, 0.5)
+
+
+def test_window_shrinks_on_oversized_responses_down_to_its_minimum():
+    window = AdaptiveWindow(
+        100, 30, 200, AdaptiveSettings(target_latency=0, max_payload=10, decrease=0.1)
+    )
+    window.record(0.1, size=11)
+    assert window.value == 30
+
+
+def test_list_by_names_shrinks_the_chunks_after_a_slow_request(
+    server, folder_ids, session, items
+):
+    names = [f"item_{i}.jpg" for i in range(1000)]
+    server.stall(URL_GET_BY_NAMES, TARGET_LATENCY * 2)
+    assert len(items.list_by_names(PROJECT_ID, folder_ids[0], names)) == 1000
+    window = session.window(ItemRepository.LIST_BY_NAMES_WINDOW, 0)
+    # the first chunk of 200 halves the window, which then grows back by 10 per chunk
+    assert server.requests[URL_GET_BY_NAMES] == window.requests == 8
+    assert window.value == 170
+
+
+def test_list_by_names_shrinks_the_chunks_after_a_failed_request(
+    server, folder_ids, session, items
+):
+    server.fail(URL_GET_BY_NAMES, status=400)
+    with pytest.raises((requests.HTTPError, aiohttp.ClientResponseError)):
+        items.list_by_names(PROJECT_ID, folder_ids[0], ["item_1.jpg"])
+    window = session.window(ItemRepository.LIST_BY_NAMES_WINDOW, 0)
+    assert window.errors == 1
+    assert window.value == 100
+
+
+def test_attach_shrinks_the_chunks_after_a_slow_request(
+    server, folder_ids, session, items
+):
+    folder_id = folder_ids[0]
+    attachments = [
+        {"name": f"new_{i}.jpg", "url": f"https://example.com/new_{i}.jpg"}
+        for i in range(1000)
+    ]
+    server.stall(URL_ATTACH, TARGET_LATENCY * 2)
+    start = time.perf_counter()
+    attached, duplicated = items.attach(
+        PROJECT_ID,
+        folder_id,
+        attachments,
+        AnnotationStatus.NotStarted,
+        UploadStateEnum.EXTERNAL,
+    )
+    assert time.perf_counter() - start >= TARGET_LATENCY * 2
+    assert len(attached) == 1000
+    assert duplicated == []
+    window = session.window(ItemRepository.ATTACH_WINDOW, 0)
+    # 500 slow, then 250 and 250
+    assert server.requests[URL_ATTACH] == window.requests == 3
+    assert window.value == 300
+
+
+def test_attach_shrinks_the_chunks_after_a_failed_request(
+    server, folder_ids, session, items
+):
+    attachments = [
+        {"name": f"new_{i}.jpg", "url": f"https://example.com/new_{i}.jpg"}
+        for i in range(600)
+    ]
+    server.fail(URL_ATTACH, status=400)
+    attached, _ = items.attach(
+        PROJECT_ID,
+        folder_ids[0],
+        attachments,
+        AnnotationStatus.NotStarted,
+        UploadStateEnum.EXTERNAL,
+    )
+    assert attached == [f"new_{i}.jpg" for i in range(500, 600)]
+    window = session.window(ItemRepository.ATTACH_WINDOW, 0)
+    assert (window.requests, window.errors) == (2, 1)
@@ -0,0 +1,75 @@
+import pytest
+from benchmarks.fake_server import FakeServer
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.app import Item
+from superannotate_core.app import Project
+from superannotate_core.infrastructure.repositories import AnnotationRepository
+
+LARGE_EVERY = 3
+
+
+@pytest.fixture
+def server():
+    """
+    A folder of 100 items, the items with ids divisible by LARGE_EVERY have large annotations.
+    """
+    with FakeServer(items_per_folder=100, large_every=LARGE_EVERY) as server:
+        yield server
+
+
+@pytest.fixture
+def item_ids(server, folder_ids):
+    return [i["id"] for i in server.items[folder_ids[0]].values()]
+
+
+def _assert_sorted(sorted_annotations, item_ids):
+    small = [i["id"] for chunk in sorted_annotations["small"] for i in chunk]
+    large = [i["id"] for i in sorted_annotations["large"]]
+    assert small == [i for i in item_ids if i % LARGE_EVERY]
+    assert large == [i for i in item_ids if not i % LARGE_EVERY]
+
+
+def test_sort_annotations_by_size(session, folder_ids, item_ids):
+    repo = AnnotationRepository(session)
+    _assert_sorted(
+        repo.sort_annotatoins_by_size(PROJECT_ID, folder_ids[0], item_ids), item_ids
+    )
+
+
+def test_async_sort_annotations_by_size(session, run, item_ids):
+    repo = AnnotationRepository(session)
+    _assert_sorted(run(repo.asort_annotations_by_size(PROJECT_ID, item_ids)), item_ids)
+
+
+def test_get_large_annotation(server, session, run, folder_ids):
+    folder_id = folder_ids[0]
+    item = server.items[folder_id]["item_2.jpg"]
+    annotation = run(
+        AnnotationRepository(session).get_large_annotation(
+            PROJECT_ID, folder_id, item["id"]
+        )
+    )
+    assert annotation == server.annotation(item)
+
+
+def test_item_get_large_annotation(server, session, run, folder_ids):
+    folder_id = folder_ids[0]
+    item = server.items[folder_id]["item_5.jpg"]
+    annotation = run(
+        Item.aget_large_annotation(
+            session=session,
+            project_id=PROJECT_ID,
+            folder_id=folder_id,
+            item_id=item["id"],
+        )
+    )
+    assert annotation["metadata"]["name"] == "item_5.jpg"
+
+
+def test_folder_annotations_include_the_large_annotations(server, session):
+    folder = Project.get_by_id(session, PROJECT_ID).get_folder("root")
+    annotations = folder.get_annotations()
+    names = sorted(i["metadata"]["name"] for i in annotations)
+    assert names == sorted(server.items[folder.id])
+    large = [i for i in annotations if not i["metadata"]["id"] % LARGE_EVERY]
+    assert large and all(i["instances"] for i in large)
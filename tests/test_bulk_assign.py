@@ -0,0 +1,48 @@
+import logging
+
+from benchmarks.fake_server import PROJECT_ID
+
+URL_ASSIGN_ITEMS = "/images/editAssignment/"
+
+
+def test_assign_items_counts_the_assigned_items(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(700)] + ["missing.jpg"]
+    assert items.assign_items(PROJECT_ID, folder_id, "user@x.com", names) == 700
+    assert server.requests[URL_ASSIGN_ITEMS] == 2
+    assert server.items[folder_id]["item_699.jpg"]["annotator_email"] == "user@x.com"
+
+
+def test_assign_items_to_users(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    assignments = {
+        "a@x.com": [f"item_{i}.jpg" for i in range(600)],
+        "b@x.com": [f"item_{i}.jpg" for i in range(600, 700)],
+    }
+    assert items.assign_items_to_users(PROJECT_ID, folder_id, assignments) == 700
+    assert server.requests[URL_ASSIGN_ITEMS] == 3
+    assert server.items[folder_id]["item_599.jpg"]["annotator_email"] == "a@x.com"
+    assert server.items[folder_id]["item_600.jpg"]["annotator_email"] == "b@x.com"
+
+
+def test_assign_items_skips_the_failed_chunks(server, folder_ids, items, caplog):
+    folder_id = folder_ids[0]
+    server.fail(URL_ASSIGN_ITEMS, status=400, count=1)
+    with caplog.at_level(logging.WARNING):
+        count = items.assign_items(
+            PROJECT_ID, folder_id, "user@x.com", ["item_1.jpg", "item_2.jpg"]
+        )
+    assert count == 0
+    assert "Failed to assign 2 items to user@x.com" in caplog.text
+
+
+def test_unassign_items_reports_the_failed_chunks(server, folder_ids, items, caplog):
+    folder_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(600)]
+    server.fail(URL_ASSIGN_ITEMS, status=400, count=1)
+    with caplog.at_level(logging.WARNING):
+        report = items.unassign_items(PROJECT_ID, folder_id, names)
+    assert len(report["failed"]) in (500, 100)
+    assert sorted(report["succeeded"] + report["failed"]) == sorted(names)
+    assert len(report["errors"]) == 1
+    assert f"Failed to unassign {len(report['failed'])} items" in caplog.text
@@ -0,0 +1,49 @@
+from benchmarks.fake_server import PROJECT_ID
+
+URL_GET_BY_NAMES = "/images/getBulk"
+URL_DELETE_ITEMS = "/image/delete/images"
+
+
+def test_bulk_delete_reports_the_missing_ids(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    item_ids = [i["id"] for i in server.items[folder_id].values()][:1100]
+    report = items.bulk_delete(PROJECT_ID, folder_id, item_ids + [-1])
+    assert sorted(report["deleted"]) == sorted(item_ids)
+    assert report["missing"] == [-1]
+    assert report["failed"] == report["unresolved"] == report["errors"] == []
+    assert len(server.items[folder_id]) == 100
+
+
+def test_bulk_delete_reports_the_failed_chunks(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    item_ids = [i["id"] for i in server.items[folder_id].values()][:10]
+    server.fail(URL_DELETE_ITEMS, status=400)
+    report = items.bulk_delete(PROJECT_ID, folder_id, item_ids)
+    assert report["deleted"] == []
+    assert sorted(report["failed"]) == sorted(item_ids)
+    assert len(report["errors"]) == 1
+    assert len(server.items[folder_id]) == 1200
+
+
+def test_delete_by_names_reports_the_missing_names(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(300)]
+    report = items.delete_by_names(PROJECT_ID, folder_id, names + ["missing.jpg"])
+    assert len(report["deleted"]) == 300
+    assert report["missing"] == ["missing.jpg"]
+    assert not any(i in server.items[folder_id] for i in names)
+
+
+def test_delete_by_names_reports_the_unresolved_names(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(300)] + ["missing.jpg"]
+    # the async transport resends a failed request up to its retry limit
+    server.fail(URL_GET_BY_NAMES, status=400, count=3)
+    report = items.delete_by_names(PROJECT_ID, folder_id, names)
+    unresolved = set(report["unresolved"])
+    assert unresolved
+    assert len(report["deleted"]) + len(unresolved - {"missing.jpg"}) == 300
+    # a name is either missing or unresolved, never both
+    assert not unresolved & set(report["missing"])
+    assert set(report["missing"]) <= {"missing.jpg"}
+    assert all(i in server.items[folder_id] for i in unresolved - {"missing.jpg"})
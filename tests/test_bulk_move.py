@@ -0,0 +1,83 @@
+import pytest
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.core.exceptions import SAValidationException
+from superannotate_core.infrastructure.repositories import LimitsRepository
+
+URL_MOVE = "/image/move"
+
+
+@pytest.fixture
+def destination_id(server, folder_ids):
+    """
+    The second folder, emptied so that the moved names do not clash.
+    """
+    server.items[folder_ids[1]].clear()
+    return folder_ids[1]
+
+
+def test_move_skips_the_names_in_the_destination(server, folder_ids, items):
+    source_id, destination_id = folder_ids
+    names = ["item_1.jpg", "item_2.jpg"]
+    skipped = items.bulk_move_by_names(PROJECT_ID, source_id, destination_id, names)
+    assert sorted(skipped) == names
+    assert all(i in server.items[source_id] for i in names)
+
+
+def test_move_by_names(server, folder_ids, destination_id, items):
+    source_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(2500)]
+    skipped = items.bulk_move_by_names(PROJECT_ID, source_id, destination_id, names)
+    assert skipped == [f"item_{i}.jpg" for i in range(1200, 2500)]
+    assert len(server.items[destination_id]) == 1200
+    assert server.items[source_id] == {}
+
+
+def test_move_does_not_skip_the_items_of_a_lost_response(
+    server, folder_ids, destination_id, items
+):
+    source_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(100)]
+    server.fail(URL_MOVE, status=502, applied=True)
+    skipped = items.bulk_move_by_names(PROJECT_ID, source_id, destination_id, names)
+    assert skipped == []
+    assert sorted(server.items[destination_id]) == sorted(names)
+    assert server.requests[URL_MOVE] == 1
+
+
+def test_move_resends_the_names_left_in_the_source(
+    server, folder_ids, destination_id, items
+):
+    source_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(100)] + ["missing.jpg"]
+    server.fail(URL_MOVE, status=502)
+    skipped = items.bulk_move_by_names(PROJECT_ID, source_id, destination_id, names)
+    assert skipped == ["missing.jpg"]
+    assert len(server.items[destination_id]) == 100
+    assert server.requests[URL_MOVE] == 2
+
+
+def test_move_consumes_the_cached_limits(
+    server, folder_ids, destination_id, session, items
+):
+    source_id = folder_ids[0]
+    limits = LimitsRepository(session)
+    remaining = limits.get_limitations(PROJECT_ID, destination_id)["folder_limit"][
+        "remaining_image_count"
+    ]
+    names = [f"item_{i}.jpg" for i in range(300)]
+    items.bulk_move_by_names(PROJECT_ID, source_id, destination_id, names)
+    limit = limits.get_limitations(PROJECT_ID, destination_id)["folder_limit"]
+    assert limit["remaining_image_count"] == remaining - 300
+
+
+def test_move_validates_the_destination_limits(
+    server, folder_ids, destination_id, items
+):
+    source_id = folder_ids[0]
+    # the stand-in backend counts the folder items against a 50000 items limit
+    server.items[destination_id].update({f"x_{i}": {} for i in range(49_900)})
+    with pytest.raises(SAValidationException):
+        items.bulk_move_by_names(
+            PROJECT_ID, source_id, destination_id, [f"item_{i}.jpg" for i in range(200)]
+        )
+    assert server.requests[URL_MOVE] == 0
@@ -0,0 +1,58 @@
+import logging
+
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.core.enums import AnnotationStatus
+from superannotate_core.core.enums import ApprovalStatus
+
+URL_SET_STATUSES = "/image/updateAnnotationStatusBulk"
+
+
+def test_set_statuses_of_all_folder_items(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    report = items.set_statuses(PROJECT_ID, folder_id, AnnotationStatus.Completed)
+    assert sorted(report["succeeded"]) == sorted(server.items[folder_id])
+    assert report["failed"] == report["errors"] == []
+    assert {i["annotation_status"] for i in server.items[folder_id].values()} == {
+        AnnotationStatus.Completed.value
+    }
+
+
+def test_set_statuses_retries_server_errors(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    server.fail(URL_SET_STATUSES, status=500)
+    report = items.set_statuses(
+        PROJECT_ID, folder_id, AnnotationStatus.InProgress, ["item_1.jpg"]
+    )
+    assert report["succeeded"] == ["item_1.jpg"]
+    assert server.items[folder_id]["item_1.jpg"]["annotation_status"] == 2
+
+
+def test_set_statuses_reports_and_logs_failed_chunks(server, folder_ids, items, caplog):
+    folder_id = folder_ids[0]
+    names = [f"item_{i}.jpg" for i in range(600)]
+    # the async transport resends a failed request up to its retry limit
+    server.fail(URL_SET_STATUSES, status=400, count=3)
+    with caplog.at_level(logging.WARNING):
+        report = items.set_statuses(
+            PROJECT_ID, folder_id, AnnotationStatus.Completed, names
+        )
+    assert report["failed"]
+    assert sorted(report["succeeded"] + report["failed"]) == sorted(names)
+    assert all(i.startswith("400") for i in report["errors"])
+    assert all(i in caplog.text for i in report["failed"])
+    assert all(
+        server.items[folder_id][i]["annotation_status"] == 5
+        for i in report["succeeded"]
+    )
+
+
+def test_set_approval_statuses(server, folder_ids, items):
+    folder_id = folder_ids[0]
+    report = items.set_approval_statuses(
+        PROJECT_ID, folder_id, ApprovalStatus.Approved, ["item_3.jpg", "item_4.jpg"]
+    )
+    assert sorted(report["succeeded"]) == ["item_3.jpg", "item_4.jpg"]
+    assert (
+        server.items[folder_id]["item_3.jpg"]["approval_status"]
+        == ApprovalStatus.Approved.value
+    )
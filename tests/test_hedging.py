@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from benchmarks.fake_server import PROJECT_ID
+from superannotate_core.infrastructure.hedging import Hedger
+from superannotate_core.infrastructure.hedging import HedgingPolicy
+
+ENDPOINT = "item"
+SLOW = 1.0
+
+
+@pytest.fixture
+def hedger():
+    hedger = Hedger(HedgingPolicy(min_samples=1, budget=1, burst=1, min_delay=0.05))
+    hedger.record(ENDPOINT, 0.01)
+    yield hedger
+    hedger.close()
+
+
+@pytest.fixture
+def session(server):
+    session = server.session(
+        hedging=HedgingPolicy(min_samples=1, budget=1, burst=1, min_delay=0.05)
+    )
+    yield session
+    session.close()
+
+
+def _slow_first():
+    """
+    Returns a send whose first call takes SLOW seconds and the discarded results.
+    """
+    calls = []
+    discarded = []
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            calls.append(len(calls))
+            call = calls[-1]
+        if call == 0:
+            time.sleep(SLOW)
+        return call
+
+    return send, discarded.append, discarded
+
+
+def _ignore(_):
+    pass
+
+
+def test_disabled_hedger_sends_once():
+    hedger = Hedger()
+    calls = []
+    assert hedger.send(ENDPOINT, lambda: calls.append(1) or "done", _ignore) == "done"
+    assert calls == [1]
+    assert hedger.hedges == 0
+
+
+def test_hedger_sends_once_without_latencies():
+    hedger = Hedger(HedgingPolicy(min_samples=1, budget=1, burst=1))
+    send, discard, _ = _slow_first()
+    assert hedger.send("other", send, discard) == 0
+    assert hedger.hedges == 0
+    hedger.close()
+
+
+def test_slow_request_is_hedged(hedger):
+    send, discard, discarded = _slow_first()
+    start = time.perf_counter()
+    assert hedger.send(ENDPOINT, send, discard) == 1
+    assert time.perf_counter() - start < SLOW
+    assert (hedger.hedges, hedger.wins) == (1, 1)
+    time.sleep(SLOW)
+    assert discarded == [0]
+
+
+def test_hedges_are_limited_by_the_budget(hedger):
+    hedger.policy.budget = 0
+    for _ in range(2):
+        send, discard, _ = _slow_first()
+        hedger.send(ENDPOINT, send, discard)
+    assert hedger.hedges == 1
+
+
+def test_slow_coroutine_is_hedged(hedger):
+    calls = []
+
+    async def send():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(SLOW)
+            return "slow"
+        return "hedge"
+
+    start = time.perf_counter()
+    assert asyncio.run(hedger.asend(ENDPOINT, send, _ignore)) == "hedge"
+    assert time.perf_counter() - start < SLOW
+    assert (hedger.hedges, hedger.wins) == (1, 1)
+
+
+def test_get_by_id_is_hedged(server, folder_ids, session, items):
+    folder_id = folder_ids[0]
+    first, second = list(server.items[folder_id].values())[:2]
+    assert items.get_by_id(PROJECT_ID, folder_id, first["id"]).id == first["id"]
+    server.stall(f"/image/{second['id']}", SLOW)
+    start = time.perf_counter()
+    assert items.get_by_id(PROJECT_ID, folder_id, second["id"]).id == second["id"]
+    assert time.perf_counter() - start < SLOW
+    assert (session.hedger.hedges, session.hedger.wins) == (1, 1)
+    assert server.requests[f"/image/{second['id']}"] == 2